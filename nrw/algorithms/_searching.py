@@ -21,14 +21,10 @@ _T = TypeVar("_T")
 
 
 def linear_search(lst: List[_T], element: _T) -> int:
-    lst.to_first()
-    index: int = 0
-    while lst.has_access:
-        if lst.content == element:
+    for index, content in enumerate(lst):
+        if content == element:
             return index
-        index += 1
-        lst.next()
-    return index
+    return len(lst)
 
 
 def _depth_first_search_impl(graph: Graph, vertex: Vertex) -> List[Vertex]:
@@ -41,13 +37,8 @@ def _depth_first_search_impl(graph: Graph, vertex: Vertex) -> List[Vertex]:
     result.append(vertex)
     vertex.mark = True
 
-    neighbours: List[Vertex] = graph.get_neighbours(vertex)
-    neighbours.to_first()
-    while neighbours.has_access:
-        current: Vertex | None = neighbours.content
-        assert current is not None
-        result.concat(_depth_first_search_impl(graph, current))
-        neighbours.next()
+    for neighbour in graph.get_neighbours(vertex):
+        result.concat(_depth_first_search_impl(graph, neighbour))
 
     return result
 
@@ -77,18 +68,13 @@ def breadth_first_search(graph: Graph, vertex: Vertex) -> List[Vertex]:
     while result.has_access:
         current: Vertex | None = result.content
         assert current is not None
-        neighbours: List[Vertex] = graph.get_neighbours(current)
-        neighbours.to_first()
-        while neighbours.has_access:
-            current_neighbour: Vertex | None = neighbours.content
-            assert current_neighbour is not None
-            if not current_neighbour.is_marked:
-                edge: Edge | None = graph.get_edge(current_neighbour, current)
+        for neighbour in graph.get_neighbours(current):
+            if not neighbour.is_marked:
+                edge: Edge | None = graph.get_edge(neighbour, current)
                 assert edge is not None
                 edge.mark = True
-                current_neighbour.mark = True
-                result.append(current_neighbour)
-            neighbours.next()
+                neighbour.mark = True
+                result.append(neighbour)
         result.next()
 
     return result
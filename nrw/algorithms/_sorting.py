@@ -16,9 +16,11 @@ from nrw.datastructures._list import List
 
 if TYPE_CHECKING:
     from nrw.datastructures._comparable_content import ComparableContentT
+    from nrw.datastructures._list import _ListNode
 
 
 def bubble_sort(lst: List[ComparableContentT]) -> List[ComparableContentT]:
+    lst._own_nodes()
     swapped: bool = True
     while swapped:
         swapped = False
@@ -44,15 +46,7 @@ def selection_sort(lst: List[ComparableContentT]) -> List[ComparableContentT]:
 
 
 def _get_min_element(lst: List[ComparableContentT]) -> ComparableContentT:
-    lst.to_first()
-    min_element: ComparableContentT | None = lst.content
-    assert min_element is not None
-    lst.next()
-    while lst.has_access:
-        assert lst.content is not None
-        min_element = min(min_element, lst.content)
-        lst.next()
-    return min_element
+    return min(lst)
 
 
 def _delete(element: ComparableContentT, lst: List[ComparableContentT]) -> None:
@@ -66,10 +60,8 @@ def _delete(element: ComparableContentT, lst: List[ComparableContentT]) -> None:
 
 def insertion_sort(lst: List[ComparableContentT]) -> List[ComparableContentT]:
     result: List[ComparableContentT] = List()
-    lst.to_first()
-    while lst.has_access:
-        _insort(result, lst.content)  # type: ignore[misc]
-        lst.next()
+    for element in lst:
+        _insort(result, element)
     return result
 
 
@@ -84,85 +76,84 @@ def _insort(lst: List[ComparableContentT], element: ComparableContentT) -> None:
 
 
 def merge_sort(lst: List[ComparableContentT]) -> List[ComparableContentT]:
-    lst.to_first()
-    lst.next()
-    if not lst.has_access:
+    return _merge_sort(List.from_iterable(lst))
+
+
+def _merge_sort(lst: List[ComparableContentT]) -> List[ComparableContentT]:
+    if lst.is_empty or lst._first is lst._last:
         return lst
 
-    left: List[ComparableContentT] = List()
-    right: List[ComparableContentT] = List()
+    _to_middle(lst)
+    right: List[ComparableContentT] = lst.split_at_current()
+    return _merge(_merge_sort(lst), _merge_sort(right))
 
-    to_the_left: bool = True
+
+def _to_middle(lst: List[ComparableContentT]) -> None:
     lst.to_first()
-    while lst.has_access:
-        if to_the_left:
-            left.append(lst.content)
-            to_the_left = False
-        else:
-            right.append(lst.content)
-            to_the_left = True
+    runner: _ListNode[ComparableContentT] | None = lst._first.next_node
+    while runner is not None and runner.next_node is not None:
         lst.next()
-
-    return _merge(merge_sort(left), merge_sort(right))
+        runner = runner.next_node.next_node
+    lst.next()
 
 
 def _merge(
     lst1: List[ComparableContentT],
     lst2: List[ComparableContentT],
 ) -> List[ComparableContentT]:
-    if lst1.is_empty:  # pragma: no branch
-        return lst2  # pragma: no cover
-    if lst2.is_empty:  # pragma: no branch
-        return lst1  # pragma: no cover
-
-    result: List[ComparableContentT] = List()
-
     lst1.to_first()
     lst2.to_first()
     while lst1.has_access and lst2.has_access:
-        if lst1.content < lst2.content:  # type: ignore[operator]
-            result.append(lst1.content)
-            lst1.next()
+        if lst2.content < lst1.content:  # type: ignore[operator]
+            while (
+                lst2.has_access and lst2.content < lst1.content  # type: ignore[operator]
+            ):
+                lst2.next()
+            rest: List[ComparableContentT] = lst2.split_at_current()
+            lst1.splice(lst2, at_current=True)
+            lst2 = rest
+            lst2.to_first()
         else:
-            result.append(lst2.content)
-            lst2.next()
-
-    while lst1.has_access:
-        result.append(lst1.content)
-        lst1.next()
-
-    while lst2.has_access:
-        result.append(lst2.content)
-        lst2.next()
+            lst1.next()
 
-    return result
+    lst1.concat(lst2)
+    return lst1
 
 
 def quick_sort(lst: List[ComparableContentT]) -> List[ComparableContentT]:
-    result: List[ComparableContentT] = List()
+    return _quick_sort(List.from_iterable(lst))
 
-    if lst.is_empty:
-        return result
+
+def _quick_sort(lst: List[ComparableContentT]) -> List[ComparableContentT]:
+    if lst.is_empty or lst._first is lst._last:
+        return lst
 
     lst.to_first()
-    pivot: ComparableContentT | None = lst.content
-    assert pivot is not None
+    pivot: ComparableContentT = lst._first.content
     lst.next()
 
-    right: List[ComparableContentT] = List()
     left: List[ComparableContentT] = List()
-
     while lst.has_access:
-        element: ComparableContentT | None = lst.content
-        assert element is not None
-        if element < pivot:
-            left.append(element)
+        if lst.content < pivot:
+            _move_current(lst, left)
         else:
-            right.append(element)
-        lst.next()
+            lst.next()
 
-    result.concat(quick_sort(left))
-    result.append(pivot)
-    result.concat(quick_sort(right))
+    lst.to_first()
+    lst.next()
+    right: List[ComparableContentT] = lst.split_at_current()
 
+    result: List[ComparableContentT] = _quick_sort(left)
+    result.concat(lst)
+    result.concat(_quick_sort(right))
     return result
+
+
+def _move_current(
+    source: List[ComparableContentT],
+    target: List[ComparableContentT],
+) -> None:
+    node: _ListNode[ComparableContentT] | None = source._current
+    assert node is not None
+    source._current = source._unlink_node(node)
+    target._append_node(node)
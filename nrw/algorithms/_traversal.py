@@ -111,9 +111,4 @@ def levelorder(
                 trees.append(current_tree.left_tree)
         trees.next()
 
-    result: List[_T | ComparableContentT] = List()
-    trees.to_first()
-    while trees.has_access:
-        result.append(trees.content.content)
-        trees.next()
-    return result
+    return List.from_iterable(current_tree.content for current_tree in trees)
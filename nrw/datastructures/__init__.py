@@ -3,27 +3,59 @@
 from __future__ import annotations
 
 __all__: Final[list[str]] = [
+    "AVLTree",
+    "ArrayQueue",
+    "ArrayStack",
+    "AsyncQueue",
+    "AsyncStack",
+    "BTree",
     "BinarySearchTree",
     "BinaryTree",
+    "BlockingQueue",
+    "ChunkedList",
     "ComparableContent",
     "ComparableContentT",
+    "ConcurrentList",
+    "Deque",
     "Edge",
     "Graph",
     "List",
+    "ListCursor",
+    "NodePool",
+    "PersistentList",
+    "PersistentStack",
+    "PriorityQueue",
+    "PriorityQueueHandle",
     "Queue",
     "Stack",
+    "TypedList",
     "Vertex",
 ]
 
 
 from typing import Final
 
+from nrw.datastructures._array_queue import ArrayQueue
+from nrw.datastructures._array_stack import ArrayStack
+from nrw.datastructures._async_queue import AsyncQueue
+from nrw.datastructures._async_stack import AsyncStack
+from nrw.datastructures._avl_tree import AVLTree
+from nrw.datastructures._b_tree import BTree
 from nrw.datastructures._binary_search_tree import BinarySearchTree
 from nrw.datastructures._binary_tree import BinaryTree
+from nrw.datastructures._blocking_queue import BlockingQueue
+from nrw.datastructures._chunked_list import ChunkedList
 from nrw.datastructures._comparable_content import ComparableContent, ComparableContentT
+from nrw.datastructures._concurrent_list import ConcurrentList
+from nrw.datastructures._deque import Deque
 from nrw.datastructures._edge import Edge
 from nrw.datastructures._graph import Graph
-from nrw.datastructures._list import List
+from nrw.datastructures._list import List, ListCursor
+from nrw.datastructures._node_pool import NodePool
+from nrw.datastructures._persistent_list import PersistentList
+from nrw.datastructures._persistent_stack import PersistentStack
+from nrw.datastructures._priority_queue import PriorityQueue, PriorityQueueHandle
 from nrw.datastructures._queue import Queue
 from nrw.datastructures._stack import Stack
+from nrw.datastructures._typed_list import TypedList
 from nrw.datastructures._vertex import Vertex
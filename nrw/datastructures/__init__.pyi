@@ -1,52 +1,328 @@
 # pylint: skip-file
 __all__: Final[list[str]] = [
+    "AVLTree",
+    "ArrayQueue",
+    "ArrayStack",
+    "AsyncQueue",
+    "AsyncStack",
+    "BTree",
     "BinarySearchTree",
     "BinaryTree",
+    "BlockingQueue",
+    "ChunkedList",
     "ComparableContent",
     "ComparableContentT",
+    "ConcurrentList",
+    "Deque",
     "Edge",
     "Graph",
     "List",
+    "ListCursor",
+    "NodePool",
+    "PersistentList",
+    "PersistentStack",
+    "PriorityQueue",
+    "PriorityQueueHandle",
     "Queue",
     "Stack",
+    "TypedList",
     "Vertex",
 ]
 
-from typing import Final, Generic, TypeVar, overload
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, ClassVar, Final, Generic, TypeVar, overload
+
+from _typeshed import SupportsWrite
 
 from nrw.datastructures._comparable_content import ComparableContent, ComparableContentT
 
 _T = TypeVar("_T")
+_NodeT = TypeVar("_NodeT")
+_ContentT = TypeVar("_ContentT")
+_NumberT = TypeVar("_NumberT", int, float)
+
+class NodePool(Generic[_ContentT, _NodeT]):
+    __slots__: Final[tuple[str, str, str, str, str]] = (
+        "_capacity",
+        "_factory",
+        "_free",
+        "_hits",
+        "_misses",
+    )
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        factory: Callable[[_ContentT], _NodeT],
+        capacity: int = 0,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    @property
+    def capacity(self) -> int: ...
+    @capacity.setter
+    def capacity(self, new_capacity: int) -> None: ...
+    @property
+    def hits(self) -> int: ...
+    @property
+    def misses(self) -> int: ...
+    @property
+    def hit_rate(self) -> float: ...
+    def acquire(self, content: _ContentT) -> _NodeT: ...
+    def release(self, node: _NodeT) -> None: ...
+    def clear(self) -> None: ...
 
 class Queue(Generic[_T]):
-    __slots__: Final[tuple[str, str]] = ("_head", "_tail")
+    __slots__: Final[tuple[str, str, str]] = ("_head", "_length", "_tail")
     __hash__ = None  # type: ignore[assignment]
+    node_pool: ClassVar[NodePool[Any, Any]]
 
     def __init__(self) -> None: ...
+    def __len__(self) -> int: ...
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None: ...
+    def to_str(self, limit: int | None = None) -> str: ...
+    def __iter__(self) -> Iterator[_T]: ...
+    def __reversed__(self) -> Iterator[_T]: ...
+    def __contains__(self, content: object) -> bool: ...
     @property
     def is_empty(self) -> bool: ...
     def enqueue(self, content: _T) -> None: ...
+    def enqueue_many(self, iterable: Iterable[_T | None]) -> None: ...
     def dequeue(self) -> None: ...
+    def dequeue_many(self, count: int | None = None) -> List[_T]: ...
     @property
     def front(self) -> _T | None: ...
 
+class ArrayQueue(Generic[_T]):
+    __slots__: Final[tuple[str, str, str]] = ("_buffer", "_head", "_length")
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, capacity: int = 8) -> None: ...
+    def __len__(self) -> int: ...
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None: ...
+    def to_str(self, limit: int | None = None) -> str: ...
+    def __iter__(self) -> Iterator[_T]: ...
+    def __reversed__(self) -> Iterator[_T]: ...
+    def __contains__(self, content: object) -> bool: ...
+    @property
+    def capacity(self) -> int: ...
+    @property
+    def is_empty(self) -> bool: ...
+    def enqueue(self, content: _T) -> None: ...
+    def enqueue_many(self, iterable: Iterable[_T | None]) -> None: ...
+    def dequeue(self) -> None: ...
+    def dequeue_many(self, count: int | None = None) -> List[_T]: ...
+    @property
+    def front(self) -> _T | None: ...
+
+class BlockingQueue(Generic[_T]):
+    __slots__: Final[tuple[str, str, str, str]] = (
+        "_maxsize",
+        "_not_empty",
+        "_not_full",
+        "_queue",
+    )
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, maxsize: int = 0) -> None: ...
+    def __len__(self) -> int: ...
+    @property
+    def maxsize(self) -> int: ...
+    @property
+    def is_empty(self) -> bool: ...
+    @property
+    def is_full(self) -> bool: ...
+    @property
+    def front(self) -> _T | None: ...
+    def put(self, content: _T | None, timeout: float | None = None) -> bool: ...
+    def put_many(
+        self,
+        iterable: Iterable[_T | None],
+        timeout: float | None = None,
+    ) -> int: ...
+    def get(self, timeout: float | None = None) -> _T | None: ...
+    def get_batch(self, max_items: int, timeout: float | None = None) -> List[_T]: ...
+
+class AsyncQueue(Generic[_T]):
+    __slots__: Final[tuple[str]] = ("_queue",)
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, maxsize: int = 0) -> None: ...
+    def __len__(self) -> int: ...
+    @property
+    def maxsize(self) -> int: ...
+    @property
+    def is_empty(self) -> bool: ...
+    @property
+    def is_full(self) -> bool: ...
+    @property
+    def front(self) -> _T | None: ...
+    async def put(
+        self,
+        content: _T | None,
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> bool: ...
+    async def put_many(
+        self,
+        iterable: Iterable[_T | None],
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> int: ...
+    async def get(
+        self,
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> _T | None: ...
+    async def get_batch(
+        self,
+        max_items: int,
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> List[_T]: ...
+
+class Deque(Generic[_T]):
+    __slots__: Final[tuple[str, str, str, str, str]] = (
+        "_first_block",
+        "_first_index",
+        "_last_block",
+        "_last_index",
+        "_length",
+    )
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self) -> None: ...
+    def __len__(self) -> int: ...
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None: ...
+    def to_str(self, limit: int | None = None) -> str: ...
+    def __iter__(self) -> Iterator[_T]: ...
+    def __reversed__(self) -> Iterator[_T]: ...
+    def __contains__(self, content: object) -> bool: ...
+    @property
+    def is_empty(self) -> bool: ...
+    @property
+    def front(self) -> _T | None: ...
+    @property
+    def back(self) -> _T | None: ...
+    def push_front(self, content: _T | None) -> None: ...
+    def push_back(self, content: _T | None) -> None: ...
+    def pop_front(self) -> None: ...
+    def pop_back(self) -> None: ...
+
 class Stack(Generic[_T]):
-    __slots__: Final[tuple[str]] = ("_head",)
+    __slots__: Final[tuple[str, str]] = ("_head", "_length")
+    __hash__ = None  # type: ignore[assignment]
+    node_pool: ClassVar[NodePool[Any, Any]]
+
+    def __init__(self) -> None: ...
+    @staticmethod
+    def array_backed() -> ArrayStack[Any]: ...
+    def __len__(self) -> int: ...
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None: ...
+    def to_str(self, limit: int | None = None) -> str: ...
+    def __iter__(self) -> Iterator[_T]: ...
+    def __reversed__(self) -> Iterator[_T]: ...
+    def __contains__(self, content: object) -> bool: ...
+    @property
+    def is_empty(self) -> bool: ...
+    def push(self, content: _T) -> None: ...
+    def push_many(self, iterable: Iterable[_T | None]) -> None: ...
+    def pop(self) -> None: ...
+    def pop_many(self, count: int | None = None) -> List[_T]: ...
+    @property
+    def top(self) -> _T | None: ...
+
+class AsyncStack(Generic[_T]):
+    __slots__: Final[tuple[str]] = ("_stack",)
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, maxsize: int = 0) -> None: ...
+    def __len__(self) -> int: ...
+    @property
+    def maxsize(self) -> int: ...
+    @property
+    def is_empty(self) -> bool: ...
+    @property
+    def is_full(self) -> bool: ...
+    @property
+    def top(self) -> _T | None: ...
+    async def put(
+        self,
+        content: _T | None,
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> bool: ...
+    async def put_many(
+        self,
+        iterable: Iterable[_T | None],
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> int: ...
+    async def get(
+        self,
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> _T | None: ...
+    async def get_batch(
+        self,
+        max_items: int,
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> List[_T]: ...
+
+class PersistentStack(Generic[_T]):
+    __slots__: Final[tuple[str, str]] = ("_head", "_length")
     __hash__ = None  # type: ignore[assignment]
 
     def __init__(self) -> None: ...
+    def __len__(self) -> int: ...
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None: ...
+    def to_str(self, limit: int | None = None) -> str: ...
+    def __iter__(self) -> Iterator[_T]: ...
+    def __reversed__(self) -> Iterator[_T]: ...
+    def __contains__(self, content: object) -> bool: ...
     @property
     def is_empty(self) -> bool: ...
+    def snapshot(self) -> PersistentStack[_T]: ...
     def push(self, content: _T) -> None: ...
     def pop(self) -> None: ...
     @property
     def top(self) -> _T | None: ...
 
+class ArrayStack(Generic[_T]):
+    __slots__: Final[tuple[str]] = ("_contents",)
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self) -> None: ...
+    def __len__(self) -> int: ...
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None: ...
+    def to_str(self, limit: int | None = None) -> str: ...
+    def __iter__(self) -> Iterator[_T]: ...
+    def __reversed__(self) -> Iterator[_T]: ...
+    def __contains__(self, content: object) -> bool: ...
+    @property
+    def is_empty(self) -> bool: ...
+    def push(self, content: _T) -> None: ...
+    def push_many(self, iterable: Iterable[_T | None]) -> None: ...
+    def pop(self) -> None: ...
+    def pop_many(self, count: int | None = None) -> List[_T]: ...
+    @property
+    def top(self) -> _T | None: ...
+
 class List(Generic[_T]):
-    __slots__: Final[tuple[str, str, str]] = ("_current", "_first", "_last")
+    __slots__: Final[tuple[str, str, str, str, str, str]] = (
+        "_current",
+        "_first",
+        "_last",
+        "_length",
+        "_positions",
+        "_shared",
+    )
     __hash__ = None  # type: ignore[assignment]
+    node_pool: ClassVar[NodePool[Any, Any]]
 
     def __init__(self) -> None: ...
+    def __len__(self) -> int: ...
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None: ...
+    def to_str(self, limit: int | None = None) -> str: ...
+    def __iter__(self) -> Iterator[_T]: ...
+    def __reversed__(self) -> Iterator[_T]: ...
+    def __contains__(self, content: object) -> bool: ...
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[_T | None]) -> List[_T]: ...
+    @staticmethod
+    def typed(typecode: str) -> TypedList[Any]: ...
     @property
     def is_empty(self) -> bool: ...
     @property
@@ -54,17 +330,225 @@ class List(Generic[_T]):
     def next(self) -> None: ...
     def to_first(self) -> None: ...
     def to_last(self) -> None: ...
+    def to_index(self, index: int) -> None: ...
+    def index_of(self, content: _T | None) -> int | None: ...
     @property
     def content(self) -> _T | None: ...
     @content.setter
     def content(self, new_content: _T | None) -> None: ...
     def insert(self, content: _T | None) -> None: ...
     def append(self, content: _T | None) -> None: ...
+    def extend(self, iterable: Iterable[_T | None]) -> None: ...
     def concat(self, other_list: List[_T] | None) -> None: ...
+    def splice(
+        self,
+        other_list: List[_T] | None,
+        *,
+        at_current: bool = False,
+    ) -> None: ...
+    def split_at_current(self) -> List[_T]: ...
+    def remove(self) -> None: ...
+    def cursor(self) -> ListCursor[_T]: ...
+
+class ListCursor(Generic[_T]):
+    __slots__: Final[tuple[str, str]] = ("_list", "_node")
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def list(self) -> List[_T]: ...
+    @property
+    def has_access(self) -> bool: ...
+    def copy(self) -> ListCursor[_T]: ...
+    def next(self) -> None: ...
+    def previous(self) -> None: ...
+    def to_first(self) -> None: ...
+    def to_last(self) -> None: ...
+    def to_current(self) -> None: ...
+    def make_current(self) -> None: ...
+    @property
+    def content(self) -> _T | None: ...
+    @content.setter
+    def content(self, new_content: _T | None) -> None: ...
+    def insert(self, content: _T | None) -> None: ...
     def remove(self) -> None: ...
 
+class ChunkedList(Generic[_T]):
+    __slots__: Final[tuple[str, str, str, str, str, str]] = (
+        "_chunk_size",
+        "_current_chunk",
+        "_current_index",
+        "_first",
+        "_last",
+        "_length",
+    )
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, chunk_size: int = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None: ...
+    def to_str(self, limit: int | None = None) -> str: ...
+    def __iter__(self) -> Iterator[_T]: ...
+    def __reversed__(self) -> Iterator[_T]: ...
+    def __contains__(self, content: object) -> bool: ...
+    @property
+    def chunk_size(self) -> int: ...
+    @property
+    def is_empty(self) -> bool: ...
+    @property
+    def has_access(self) -> bool: ...
+    def next(self) -> None: ...
+    def to_first(self) -> None: ...
+    def to_last(self) -> None: ...
+    @property
+    def content(self) -> _T | None: ...
+    @content.setter
+    def content(self, new_content: _T | None) -> None: ...
+    def insert(self, content: _T | None) -> None: ...
+    def append(self, content: _T | None) -> None: ...
+    def concat(self, other_list: ChunkedList[_T] | None) -> None: ...
+    def remove(self) -> None: ...
+
+class PersistentList(Generic[_T]):
+    __slots__: Final[tuple[str, str, str, str, str]] = (
+        "_current",
+        "_first",
+        "_last",
+        "_length",
+        "_shared",
+    )
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self) -> None: ...
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[_T | None]) -> PersistentList[_T]: ...
+    def __len__(self) -> int: ...
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None: ...
+    def to_str(self, limit: int | None = None) -> str: ...
+    def __iter__(self) -> Iterator[_T]: ...
+    def __reversed__(self) -> Iterator[_T]: ...
+    def __contains__(self, content: object) -> bool: ...
+    def snapshot(self) -> PersistentList[_T]: ...
+    def to_list(self) -> List[_T]: ...
+    @property
+    def is_empty(self) -> bool: ...
+    @property
+    def has_access(self) -> bool: ...
+    def next(self) -> None: ...
+    def to_first(self) -> None: ...
+    def to_last(self) -> None: ...
+    @property
+    def content(self) -> _T | None: ...
+    @content.setter
+    def content(self, new_content: _T | None) -> None: ...
+    def insert(self, content: _T | None) -> None: ...
+    def append(self, content: _T | None) -> None: ...
+    def concat(self, other_list: PersistentList[_T] | None) -> None: ...
+    def remove(self) -> None: ...
+
+class ConcurrentList(Generic[_T]):
+    __slots__: Final[tuple[str, str]] = ("_lock", "_snapshot")
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self) -> None: ...
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[_T | None]) -> ConcurrentList[_T]: ...
+    def __len__(self) -> int: ...
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None: ...
+    def to_str(self, limit: int | None = None) -> str: ...
+    def __iter__(self) -> Iterator[_T]: ...
+    def __reversed__(self) -> Iterator[_T]: ...
+    def __contains__(self, content: object) -> bool: ...
+    @property
+    def is_empty(self) -> bool: ...
+    def snapshot(self) -> tuple[_T, ...]: ...
+    def to_list(self) -> List[_T]: ...
+    def find(self, predicate: Callable[[_T], bool]) -> _T | None: ...
+    def append(self, content: _T | None) -> None: ...
+    def extend(self, iterable: Iterable[_T | None]) -> None: ...
+    def remove(self, content: _T | None) -> bool: ...
+    def clear(self) -> tuple[_T, ...]: ...
+
+class TypedList(Generic[_NumberT]):
+    __slots__: Final[tuple[str, str]] = ("_array", "_current")
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, typecode: str) -> None: ...
+    @classmethod
+    def from_iterable(
+        cls,
+        typecode: str,
+        iterable: Iterable[_NumberT | None],
+    ) -> TypedList[_NumberT]: ...
+    def __len__(self) -> int: ...
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None: ...
+    def to_str(self, limit: int | None = None) -> str: ...
+    def __iter__(self) -> Iterator[_NumberT]: ...
+    def __reversed__(self) -> Iterator[_NumberT]: ...
+    def __contains__(self, content: object) -> bool: ...
+    def __buffer__(self, _flags: int) -> memoryview: ...
+    @property
+    def typecode(self) -> str: ...
+    @property
+    def itemsize(self) -> int: ...
+    def memoryview(self) -> memoryview: ...
+    @property
+    def is_empty(self) -> bool: ...
+    @property
+    def has_access(self) -> bool: ...
+    def next(self) -> None: ...
+    def to_first(self) -> None: ...
+    def to_last(self) -> None: ...
+    def to_index(self, index: int) -> None: ...
+    @property
+    def content(self) -> _NumberT | None: ...
+    @content.setter
+    def content(self, new_content: _NumberT | None) -> None: ...
+    def insert(self, content: _NumberT | None) -> None: ...
+    def append(self, content: _NumberT | None) -> None: ...
+    def extend(self, iterable: Iterable[_NumberT | None]) -> None: ...
+    def concat(self, other_list: TypedList[_NumberT] | None) -> None: ...
+    def remove(self) -> None: ...
+
+class PriorityQueueHandle(Generic[ComparableContentT]):
+    __slots__: Final[tuple[str, str]] = ("_content", "_index")
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def content(self) -> ComparableContentT: ...
+    @property
+    def is_queued(self) -> bool: ...
+
+class PriorityQueue(Generic[ComparableContentT]):
+    __slots__: Final[tuple[str]] = ("_heap",)
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self) -> None: ...
+    @classmethod
+    def from_iterable(
+        cls,
+        iterable: Iterable[ComparableContentT | None],
+    ) -> PriorityQueue[ComparableContentT]: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[ComparableContentT]: ...
+    def __contains__(self, content: object) -> bool: ...
+    @property
+    def is_empty(self) -> bool: ...
+    @property
+    def front(self) -> ComparableContentT | None: ...
+    def insert(
+        self,
+        content: ComparableContentT | None,
+    ) -> PriorityQueueHandle[ComparableContentT] | None: ...
+    def heapify(self, iterable: Iterable[ComparableContentT | None]) -> None: ...
+    def remove_front(self) -> None: ...
+    def decrease_key(
+        self,
+        handle: PriorityQueueHandle[ComparableContentT] | None,
+        new_content: ComparableContentT | None,
+    ) -> bool: ...
+
 class BinaryTree(Generic[_T]):
-    __slots__: Final[tuple[str]] = ("_node",)
+    __slots__: Final[tuple[str, str, str]] = ("_is_left", "_node", "_parent")
     __hash__ = None  # type: ignore[assignment]
 
     @overload
@@ -81,6 +565,9 @@ class BinaryTree(Generic[_T]):
         left_tree: BinaryTree[_T] | None,
         right_tree: BinaryTree[_T] | None,
     ) -> None: ...
+    def __iter__(self) -> Iterator[_T]: ...
+    def __reversed__(self) -> Iterator[_T]: ...
+    def __len__(self) -> int: ...
     @property
     def is_empty(self) -> bool: ...
     @property
@@ -97,10 +584,26 @@ class BinaryTree(Generic[_T]):
     def right_tree(self, new_tree: BinaryTree[_T] | None) -> None: ...
 
 class BinarySearchTree(Generic[ComparableContentT]):
-    __slots__: Final[tuple[str]] = ("_node",)
+    __slots__: Final[tuple[str, str, str]] = ("_is_left", "_node", "_parent")
     __hash__ = None  # type: ignore[assignment]
 
     def __init__(self) -> None: ...
+    @classmethod
+    def from_sorted(
+        cls,
+        iterable: Iterable[ComparableContentT | None],
+    ) -> BinarySearchTree[ComparableContentT]: ...
+    @classmethod
+    def from_iterable(
+        cls,
+        iterable: Iterable[ComparableContentT | None],
+    ) -> BinarySearchTree[ComparableContentT]: ...
+    @staticmethod
+    def balanced() -> AVLTree[Any]: ...
+    def __iter__(self) -> Iterator[ComparableContentT]: ...
+    def __reversed__(self) -> Iterator[ComparableContentT]: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, content: object) -> bool: ...
     @property
     def is_empty(self) -> bool: ...
     @property
@@ -115,6 +618,107 @@ class BinarySearchTree(Generic[ComparableContentT]):
         self,
         content: ComparableContentT | None,
     ) -> ComparableContentT | None: ...
+    def rank(self, content: ComparableContentT | None) -> int: ...
+    def select(self, index: int) -> ComparableContentT | None: ...
+    def count_between(
+        self,
+        low: ComparableContentT | None = None,
+        high: ComparableContentT | None = None,
+    ) -> int: ...
+    @property
+    def min(self) -> ComparableContentT | None: ...
+    @property
+    def max(self) -> ComparableContentT | None: ...
+    def floor(
+        self,
+        content: ComparableContentT | None,
+    ) -> ComparableContentT | None: ...
+    def ceiling(
+        self,
+        content: ComparableContentT | None,
+    ) -> ComparableContentT | None: ...
+    def successor(
+        self,
+        content: ComparableContentT | None,
+    ) -> ComparableContentT | None: ...
+    def predecessor(
+        self,
+        content: ComparableContentT | None,
+    ) -> ComparableContentT | None: ...
+    def range(
+        self,
+        low: ComparableContentT | None = None,
+        high: ComparableContentT | None = None,
+    ) -> Iterator[ComparableContentT]: ...
+
+class AVLTree(Generic[ComparableContentT]):
+    __slots__: Final[tuple[str, str, str]] = ("_is_left", "_node", "_parent")
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self) -> None: ...
+    def __iter__(self) -> Iterator[ComparableContentT]: ...
+    def __reversed__(self) -> Iterator[ComparableContentT]: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, content: object) -> bool: ...
+    @property
+    def is_empty(self) -> bool: ...
+    @property
+    def height(self) -> int: ...
+    @property
+    def content(self) -> ComparableContentT | None: ...
+    @property
+    def left_tree(self) -> AVLTree[ComparableContentT] | None: ...
+    @property
+    def right_tree(self) -> AVLTree[ComparableContentT] | None: ...
+    def insert(self, content: ComparableContentT | None) -> None: ...
+    def remove(self, content: ComparableContentT | None) -> None: ...
+    def search(
+        self,
+        content: ComparableContentT | None,
+    ) -> ComparableContentT | None: ...
+
+class BTree(Generic[ComparableContentT]):
+    __slots__: Final[tuple[str, str, str]] = ("_degree", "_length", "_root")
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, degree: int = ...) -> None: ...
+    @classmethod
+    def from_sorted(
+        cls,
+        iterable: Iterable[ComparableContentT | None],
+        degree: int = ...,
+    ) -> BTree[ComparableContentT]: ...
+    @classmethod
+    def from_iterable(
+        cls,
+        iterable: Iterable[ComparableContentT | None],
+        degree: int = ...,
+    ) -> BTree[ComparableContentT]: ...
+    def __iter__(self) -> Iterator[ComparableContentT]: ...
+    def __reversed__(self) -> Iterator[ComparableContentT]: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, content: object) -> bool: ...
+    @property
+    def is_empty(self) -> bool: ...
+    @property
+    def degree(self) -> int: ...
+    @property
+    def height(self) -> int: ...
+    @property
+    def min(self) -> ComparableContentT | None: ...
+    @property
+    def max(self) -> ComparableContentT | None: ...
+    def insert(self, content: ComparableContentT | None) -> None: ...
+    def remove(self, content: ComparableContentT | None) -> None: ...
+    def search(
+        self,
+        content: ComparableContentT | None,
+    ) -> ComparableContentT | None: ...
+    def range(
+        self,
+        low: ComparableContentT | None = None,
+        high: ComparableContentT | None = None,
+    ) -> Iterator[ComparableContentT]: ...
 
 class Vertex:
     __slots__: Final[tuple[str, str]] = ("_id", "_mark")
@@ -0,0 +1,182 @@
+"""Implementation der generischen Klasse `ArrayQueue[_T]`."""
+
+from __future__ import annotations
+
+__all__: Final[list[str]] = ["ArrayQueue"]
+
+from io import StringIO
+from typing import TYPE_CHECKING, Final, Generic, TypeVar
+
+from nrw.datastructures._list import List
+from nrw.datastructures._utils import write_linked_contents
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from _typeshed import SupportsWrite
+
+_T = TypeVar("_T")
+
+_MIN_CAPACITY: Final[int] = 8
+
+
+class ArrayQueue(Generic[_T]):
+    """Objekte der generischen Klasse `ArrayQueue` verhalten sich wie Objekte der
+    Klasse `Queue`, d. h., sie verwalten beliebige Objekte nach dem
+    First-In-First-Out-Prinzip.
+
+    Die Objekte werden jedoch nicht in einzelnen Knoten, sondern in einem
+    zusammenhängenden Ringpuffer gespeichert, sodass beim Anhängen und Entnehmen
+    keine Objekte erzeugt werden. Ist der Puffer voll, wird seine Kapazität
+    verdoppelt; `enqueue` hat daher eine amortisiert konstante Laufzeit, alle
+    anderen Methoden mit einem Objekt eine konstante Laufzeit.
+    """
+
+    __slots__: Final[tuple[str, str, str]] = ("_buffer", "_head", "_length")
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, capacity: int = _MIN_CAPACITY) -> None:
+        """Eine leere Schlange wird erzeugt, deren Puffer zunächst Platz für
+        `capacity` Objekte bietet. Ist `capacity` kleiner als 8, wird 8 verwendet.
+        """
+        self._buffer: list[_T | None] = [None] * max(capacity, _MIN_CAPACITY)
+        self._head: int = 0
+        self._length: int = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+    def __str__(self) -> str:
+        return self.to_str()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None:
+        """Die Darstellung der Schlange wird schrittweise in `file` geschrieben.
+
+        Ist `limit` nicht `None`, werden nur die ersten und letzten `limit` Objekte
+        sowie die Anzahl aller Objekte geschrieben, sodass der Aufwand nur von
+        `limit` abhängt.
+        """
+        write_linked_contents(
+            file,
+            self.__class__.__name__,
+            self,
+            limit=limit,
+            reversed_contents=reversed(self),
+        )
+
+    def to_str(self, limit: int | None = None) -> str:
+        """Die Anfrage liefert die Darstellung der Schlange wie `write` als
+        Zeichenkette.
+        """
+        with StringIO() as buffer:
+            self.write(buffer, limit)
+            return buffer.getvalue()
+
+    def __iter__(self) -> Iterator[_T]:
+        buffer: list[_T | None] = self._buffer
+        capacity: int = len(buffer)
+        for offset in range(self._length):
+            yield buffer[(self._head + offset) % capacity]  # type: ignore[misc]
+
+    def __reversed__(self) -> Iterator[_T]:
+        buffer: list[_T | None] = self._buffer
+        capacity: int = len(buffer)
+        for offset in range(self._length - 1, -1, -1):
+            yield buffer[(self._head + offset) % capacity]  # type: ignore[misc]
+
+    def __contains__(self, content: object) -> bool:
+        return any(element is content or element == content for element in self)
+
+    @property
+    def capacity(self) -> int:
+        """Die Anfrage liefert die Anzahl an Objekten, für die der Puffer derzeit
+        Platz bietet.
+        """
+        return len(self._buffer)
+
+    @property
+    def is_empty(self) -> bool:
+        """Die Anfrage liefert den Wert `True`, wenn die Schlange keine Objekte enthält,
+        sonst liefert sie den Wert `False`.
+        """
+        return self._length == 0
+
+    def enqueue(self, content: _T) -> None:
+        """Das Objekt `content` wird an die Schlange angehängt.
+        Falls `content` `None` ist, bleibt die Schlange unverändert.
+        """
+        if content is None:
+            return
+
+        if self._length == len(self._buffer):
+            self._resize(2 * self._length)
+        self._buffer[(self._head + self._length) % len(self._buffer)] = content
+        self._length += 1
+
+    def enqueue_many(self, iterable: Iterable[_T | None]) -> None:
+        """Alle Objekte aus `iterable` werden in deren Reihenfolge an die Schlange
+        angehängt, wobei `None` übersprungen wird. Der Puffer wird dabei höchstens
+        einmal vergrößert.
+        """
+        contents: list[_T] = [content for content in iterable if content is not None]
+        required: int = self._length + len(contents)
+        if required > len(self._buffer):
+            capacity: int = len(self._buffer)
+            while capacity < required:
+                capacity *= 2
+            self._resize(capacity)
+
+        buffer: list[_T | None] = self._buffer
+        tail: int = self._head + self._length
+        for content in contents:
+            buffer[tail % len(buffer)] = content
+            tail += 1
+        self._length = required
+
+    def dequeue(self) -> None:
+        """Das erste Objekt wird aus der Schlange entfernt.
+        Falls die Schlange leer ist, wird sie nicht verändert.
+        """
+        if self.is_empty:
+            return
+
+        self._buffer[self._head] = None
+        self._head = (self._head + 1) % len(self._buffer)
+        self._length -= 1
+
+    def dequeue_many(self, count: int | None = None) -> List[_T]:
+        """Die ersten `count` Objekte werden aus der Schlange entfernt und in ihrer
+        Reihenfolge als neue Liste vom Typ `List[_T]` geliefert. Ist `count` `None`
+        oder enthält die Schlange weniger Objekte, wird die Schlange vollständig
+        geleert.
+        """
+        amount: int = (
+            self._length if count is None else max(min(count, self._length), 0)
+        )
+        buffer: list[_T | None] = self._buffer
+        contents: list[_T | None] = []
+        for _ in range(amount):
+            contents.append(buffer[self._head])
+            buffer[self._head] = None
+            self._head = (self._head + 1) % len(buffer)
+        self._length -= amount
+        return List.from_iterable(contents)
+
+    @property
+    def front(self) -> _T | None:
+        """Die Anfrage liefert das erste Objekt der Schlange.
+        Die Schlange bleibt unverändert.
+        Falls die Schlange leer ist, wird `None` zurückgegeben.
+        """
+        return self._buffer[self._head] if not self.is_empty else None
+
+    def _resize(self, capacity: int) -> None:
+        """Kopiert die Objekte der Schlange in ihrer Reihenfolge an den Anfang eines
+        neuen Puffers mit der Kapazität `capacity`.
+        """
+        contents: list[_T | None] = list(self)
+        self._buffer = contents + [None] * (capacity - len(contents))
+        self._head = 0
@@ -0,0 +1,125 @@
+"""Implementation der generischen Klasse `ArrayStack[_T]`."""
+
+from __future__ import annotations
+
+__all__: Final[list[str]] = ["ArrayStack"]
+
+from io import StringIO
+from typing import TYPE_CHECKING, Final, Generic, TypeVar
+
+from nrw.datastructures._list import List
+from nrw.datastructures._utils import write_linked_contents
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from _typeshed import SupportsWrite
+
+_T = TypeVar("_T")
+
+
+class ArrayStack(Generic[_T]):
+    """Objekte der generischen Klasse `ArrayStack` verhalten sich wie Objekte der
+    Klasse `Stack`, d. h., sie verwalten beliebige Objekte nach dem
+    Last-In-First-Out-Prinzip.
+
+    Die Objekte werden jedoch nicht in einzelnen Knoten, sondern zusammenhängend
+    in einem Array gespeichert, sodass beim Ablegen und Entnehmen keine Objekte
+    erzeugt werden. `push` hat eine amortisiert konstante, alle anderen Methoden
+    mit einem Objekt eine konstante Laufzeit.
+    """
+
+    __slots__: Final[tuple[str]] = ("_contents",)
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self) -> None:
+        """Ein leerer Stapel wird erzeugt."""
+        self._contents: list[_T] = []
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(top={self.top!r}, len={len(self)!r})"
+
+    def __str__(self) -> str:
+        return self.to_str()
+
+    def __len__(self) -> int:
+        return len(self._contents)
+
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None:
+        """Die Darstellung des Stapels wird schrittweise in `file` geschrieben.
+
+        Ist `limit` nicht `None`, werden nur die obersten `limit` Objekte sowie die
+        Anzahl aller Objekte geschrieben, sodass der Aufwand nur von `limit`
+        abhängt.
+        """
+        write_linked_contents(
+            file,
+            self.__class__.__name__,
+            self,
+            limit=limit,
+        )
+
+    def to_str(self, limit: int | None = None) -> str:
+        """Die Anfrage liefert die Darstellung des Stapels wie `write` als
+        Zeichenkette.
+        """
+        with StringIO() as buffer:
+            self.write(buffer, limit)
+            return buffer.getvalue()
+
+    def __iter__(self) -> Iterator[_T]:
+        return reversed(self._contents)
+
+    def __reversed__(self) -> Iterator[_T]:
+        return iter(self._contents)
+
+    def __contains__(self, content: object) -> bool:
+        return content in self._contents
+
+    @property
+    def is_empty(self) -> bool:
+        """Die Anfrage liefert den Wert `True`, wenn der Stapel keine Objekte enthält,
+        sonst liefert sie den Wert `False`.
+        """
+        return not self._contents
+
+    def push(self, content: _T) -> None:
+        """Das Objekt `content` wird oben auf den Stapel gelegt.
+        Falls `content` `None` ist, bleibt der Stapel unverändert.
+        """
+        if content is None:
+            return
+        self._contents.append(content)
+
+    def push_many(self, iterable: Iterable[_T | None]) -> None:
+        """Alle Objekte aus `iterable` werden in deren Reihenfolge auf den Stapel
+        gelegt, d. h., das letzte Objekt liegt anschliessend oben.
+        `None` wird dabei übersprungen.
+        """
+        self._contents.extend(content for content in iterable if content is not None)
+
+    def pop(self) -> None:
+        """Das zuletzt eingefügte Objekt wird von dem Stapel entfernt.
+        Falls der Stapel leer ist, bleibt er unverändert.
+        """
+        if self._contents:
+            del self._contents[-1]
+
+    def pop_many(self, count: int | None = None) -> List[_T]:
+        """Die obersten `count` Objekte werden von dem Stapel entfernt und in der
+        Reihenfolge ihrer Entnahme als neue Liste vom Typ `List[_T]` geliefert.
+        Ist `count` `None` oder enthält der Stapel weniger Objekte, wird der Stapel
+        vollständig geleert.
+        """
+        length: int = len(self._contents)
+        start: int = 0 if count is None else length - max(min(count, length), 0)
+        popped: List[_T] = List.from_iterable(reversed(self._contents[start:]))
+        del self._contents[start:]
+        return popped
+
+    @property
+    def top(self) -> _T | None:
+        """Die Anfrage liefert das oberste Stapelobjekt. Der Stapel bleibt unverändert.
+        Falls der Stapel leer ist, wird `None` zurückgegeben.
+        """
+        return self._contents[-1] if self._contents else None
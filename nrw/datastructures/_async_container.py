@@ -0,0 +1,212 @@
+"""Gemeinsame Basisklasse von `AsyncQueue[_T]` und `AsyncStack[_T]`."""
+
+from __future__ import annotations
+
+__all__: Final[list[str]] = ["AsyncContainer"]
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Final, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from nrw.datastructures._list import List
+
+_T = TypeVar("_T")
+
+
+class AsyncContainer(ABC, Generic[_T]):
+    """Gemeinsame Implementation der begrenzbaren Datenstrukturen für Koroutinen
+    einer `asyncio`-Ereignisschleife.
+
+    Die Unterklassen legen fest, in welcher Datenstruktur die Objekte verwaltet
+    werden und in welcher Reihenfolge sie wieder entnommen werden. Das Warten auf
+    Objekte und freien Platz sowie die Begrenzung mit `timeout` übernimmt diese
+    Klasse.
+    """
+
+    __slots__: Final[tuple[str, str, str]] = ("_maxsize", "_not_empty", "_not_full")
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """Eine leere Datenstruktur wird erzeugt, die höchstens `maxsize` Objekte
+        enthält. Ist `maxsize` kleiner oder gleich 0, ist sie unbegrenzt.
+        """
+        self._maxsize: int = max(maxsize, 0)
+        self._not_empty: asyncio.Condition | None = None
+        self._not_full: asyncio.Condition | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(maxsize={self._maxsize!r}, "
+            f"contents={list(self._contents())!r})"
+        )
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @property
+    def maxsize(self) -> int:
+        """Die Anfrage liefert die maximale Anzahl an Objekten. Der Wert 0 steht für
+        eine unbegrenzte Datenstruktur.
+        """
+        return self._maxsize
+
+    @property
+    def is_empty(self) -> bool:
+        """Die Anfrage liefert den Wert `True`, wenn keine Objekte enthalten sind,
+        sonst liefert sie den Wert `False`.
+        """
+        return len(self) == 0
+
+    @property
+    def is_full(self) -> bool:
+        """Die Anfrage liefert den Wert `True`, wenn die Datenstruktur begrenzt ist
+        und `maxsize` Objekte enthält, sonst liefert sie den Wert `False`.
+        """
+        return 0 < self._maxsize <= len(self)
+
+    async def put(
+        self,
+        content: _T | None,
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> bool:
+        """Das Objekt `content` wird hinzugefügt. Ist die Datenstruktur voll, wird
+        höchstens `timeout` Sekunden auf freien Platz gewartet.
+
+        Die Anfrage liefert den Wert `True`, wenn `content` hinzugefügt wurde. Ist
+        `content` `None` oder ist die Wartezeit abgelaufen, bleibt die Datenstruktur
+        unverändert und die Anfrage liefert den Wert `False`.
+        """
+        if content is None:
+            return False
+
+        not_empty, not_full = self._conditions()
+        async with not_full:
+            if not await self._wait(not_full, self._has_space, timeout):
+                return False
+            self._add(content)
+            not_empty.notify()
+        return True
+
+    async def put_many(
+        self,
+        iterable: Iterable[_T | None],
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> int:
+        """Alle Objekte aus `iterable` werden in deren Reihenfolge hinzugefügt, wobei
+        `None` übersprungen wird. Ist die Datenstruktur voll, wird auf freien Platz
+        gewartet, insgesamt jedoch höchstens `timeout` Sekunden.
+
+        Die Anfrage liefert die Anzahl der hinzugefügten Objekte. Ist die Wartezeit
+        abgelaufen, werden die restlichen Objekte nicht hinzugefügt.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        deadline: float | None = None if timeout is None else loop.time() + timeout
+        not_empty, not_full = self._conditions()
+        count: int = 0
+        async with not_full:
+            for content in iterable:
+                if content is None:
+                    continue
+                remaining: float | None = (
+                    None if deadline is None else max(deadline - loop.time(), 0)
+                )
+                if not await self._wait(not_full, self._has_space, remaining):
+                    break
+                self._add(content)
+                not_empty.notify()
+                count += 1
+        return count
+
+    async def get(
+        self,
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> _T | None:
+        """Das nächste Objekt wird entfernt und zurückgegeben. Ist die Datenstruktur
+        leer, wird höchstens `timeout` Sekunden auf ein Objekt gewartet.
+        Ist die Wartezeit abgelaufen, wird `None` zurückgegeben.
+        """
+        not_empty, not_full = self._conditions()
+        async with not_empty:
+            if not await self._wait(not_empty, self._has_contents, timeout):
+                return None
+            content: _T | None = self._remove()
+            not_full.notify()
+            return content
+
+    async def get_batch(
+        self,
+        max_items: int,
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> List[_T]:
+        """Die nächsten höchstens `max_items` Objekte werden entfernt und in der
+        Reihenfolge, in der `get` sie liefern würde, als neue Liste vom Typ
+        `List[_T]` geliefert.
+
+        Ist die Datenstruktur leer, wird höchstens `timeout` Sekunden auf das erste
+        Objekt gewartet; auf weitere Objekte wird nicht gewartet. Ist die Wartezeit
+        abgelaufen oder `max_items` kleiner als 1, wird eine leere Liste geliefert.
+        """
+        not_empty, not_full = self._conditions()
+        async with not_empty:
+            if max_items > 0:
+                await self._wait(not_empty, self._has_contents, timeout)
+            batch: List[_T] = self._remove_many(max(max_items, 0))
+            if not batch.is_empty:
+                not_full.notify_all()
+            return batch
+
+    @abstractmethod
+    def _contents(self) -> Iterator[_T]:
+        """Liefert die enthaltenen Objekte in der Reihenfolge, in der `get` sie
+        liefern würde.
+        """
+
+    @abstractmethod
+    def _add(self, content: _T) -> None:
+        """Fügt `content` der zugrunde liegenden Datenstruktur hinzu."""
+
+    @abstractmethod
+    def _remove(self) -> _T | None:
+        """Entfernt das nächste Objekt und liefert es."""
+
+    @abstractmethod
+    def _remove_many(self, count: int) -> List[_T]:
+        """Entfernt die nächsten höchstens `count` Objekte und liefert sie als
+        neue Liste.
+        """
+
+    def _conditions(self) -> tuple[asyncio.Condition, asyncio.Condition]:
+        """Liefert die Bedingungsvariablen, die sich eine Sperre teilen, und erzeugt
+        sie beim ersten Aufruf.
+        """
+        if self._not_empty is None or self._not_full is None:
+            lock: asyncio.Lock = asyncio.Lock()
+            self._not_empty = asyncio.Condition(lock)
+            self._not_full = asyncio.Condition(lock)
+        return self._not_empty, self._not_full
+
+    @staticmethod
+    async def _wait(
+        condition: asyncio.Condition,
+        predicate: Callable[[], bool],
+        timeout: float | None,  # noqa: ASYNC109
+    ) -> bool:
+        """Wartet höchstens `timeout` Sekunden darauf, dass `predicate` erfüllt ist,
+        und liefert, ob dies der Fall ist. Die Sperre von `condition` muss gehalten
+        werden.
+        """
+        if predicate():
+            return True
+        try:
+            return await asyncio.wait_for(condition.wait_for(predicate), timeout)
+        except asyncio.TimeoutError:  # noqa: UP041
+            return predicate()
+
+    def _has_contents(self) -> bool:
+        return not self.is_empty
+
+    def _has_space(self) -> bool:
+        return not self.is_full
@@ -0,0 +1,70 @@
+"""Implementation der generischen Klasse `AsyncQueue[_T]`."""
+
+from __future__ import annotations
+
+__all__: Final[list[str]] = ["AsyncQueue"]
+
+from typing import TYPE_CHECKING, Final, TypeVar
+
+from nrw.datastructures._async_container import AsyncContainer
+from nrw.datastructures._queue import Queue
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from nrw.datastructures._list import List
+
+_T = TypeVar("_T")
+
+
+class AsyncQueue(AsyncContainer[_T]):
+    """Objekte der generischen Klasse `AsyncQueue` verwalten beliebige Objekte nach
+    dem First-In-First-Out-Prinzip in einer `Queue` und stellen diese für
+    Koroutinen einer `asyncio`-Ereignisschleife bereit.
+
+    Ist `maxsize` größer als 0, enthält die Schlange höchstens `maxsize` Objekte;
+    `await put` wartet dann, bis wieder Platz ist. `await get` wartet, bis ein
+    Objekt vorhanden ist. Wartende Koroutinen werden über Bedingungsvariablen
+    geweckt, statt `is_empty` wiederholt abzufragen. Alle wartenden Aufträge
+    können mit einem `timeout` in Sekunden begrenzt werden; ist `timeout` `None`,
+    wird unbegrenzt gewartet.
+
+    Die Bedingungsvariablen werden erst beim ersten Warten erzeugt, sodass die
+    Schlange auch außerhalb einer laufenden Ereignisschleife erzeugt werden kann.
+    Eine Schlange darf nur von einer Ereignisschleife verwendet werden und ist
+    nicht threadsicher (siehe `BlockingQueue`).
+    """
+
+    __slots__: Final[tuple[str]] = ("_queue",)  # type: ignore[misc]
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """Eine leere Schlange wird erzeugt, die höchstens `maxsize` Objekte
+        enthält. Ist `maxsize` kleiner oder gleich 0, ist die Schlange unbegrenzt.
+        """
+        super().__init__(maxsize)
+        self._queue: Queue[_T] = Queue()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    @property
+    def front(self) -> _T | None:
+        """Die Anfrage liefert das erste Objekt der Schlange, ohne zu warten.
+        Die Schlange bleibt unverändert.
+        Falls die Schlange leer ist, wird `None` zurückgegeben.
+        """
+        return self._queue.front
+
+    def _contents(self) -> Iterator[_T]:
+        return iter(self._queue)
+
+    def _add(self, content: _T) -> None:
+        self._queue.enqueue(content)
+
+    def _remove(self) -> _T | None:
+        content: _T | None = self._queue.front
+        self._queue.dequeue()
+        return content
+
+    def _remove_many(self, count: int) -> List[_T]:
+        return self._queue.dequeue_many(count)
@@ -0,0 +1,70 @@
+"""Implementation der generischen Klasse `AsyncStack[_T]`."""
+
+from __future__ import annotations
+
+__all__: Final[list[str]] = ["AsyncStack"]
+
+from typing import TYPE_CHECKING, Final, TypeVar
+
+from nrw.datastructures._async_container import AsyncContainer
+from nrw.datastructures._stack import Stack
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from nrw.datastructures._list import List
+
+_T = TypeVar("_T")
+
+
+class AsyncStack(AsyncContainer[_T]):
+    """Objekte der generischen Klasse `AsyncStack` verwalten beliebige Objekte nach
+    dem Last-In-First-Out-Prinzip in einem `Stack` und stellen diese für
+    Koroutinen einer `asyncio`-Ereignisschleife bereit.
+
+    Ist `maxsize` größer als 0, enthält der Stapel höchstens `maxsize` Objekte;
+    `await put` wartet dann, bis wieder Platz ist. `await get` wartet, bis ein
+    Objekt vorhanden ist. Wartende Koroutinen werden über Bedingungsvariablen
+    geweckt, statt `is_empty` wiederholt abzufragen. Alle wartenden Aufträge
+    können mit einem `timeout` in Sekunden begrenzt werden; ist `timeout` `None`,
+    wird unbegrenzt gewartet.
+
+    Die Bedingungsvariablen werden erst beim ersten Warten erzeugt, sodass die
+    Stapel auch außerhalb einer laufenden Ereignisschleife erzeugt werden kann.
+    Ein Stapel darf nur von einer Ereignisschleife verwendet werden und ist
+    nicht threadsicher.
+    """
+
+    __slots__: Final[tuple[str]] = ("_stack",)  # type: ignore[misc]
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """Ein leerer Stapel wird erzeugt, der höchstens `maxsize` Objekte
+        enthält. Ist `maxsize` kleiner oder gleich 0, ist der Stapel unbegrenzt.
+        """
+        super().__init__(maxsize)
+        self._stack: Stack[_T] = Stack()
+
+    def __len__(self) -> int:
+        return len(self._stack)
+
+    @property
+    def top(self) -> _T | None:
+        """Die Anfrage liefert das oberste Objekt des Stapels, ohne zu warten.
+        Der Stapel bleibt unverändert.
+        Falls der Stapel leer ist, wird `None` zurückgegeben.
+        """
+        return self._stack.top
+
+    def _contents(self) -> Iterator[_T]:
+        return iter(self._stack)
+
+    def _add(self, content: _T) -> None:
+        self._stack.push(content)
+
+    def _remove(self) -> _T | None:
+        content: _T | None = self._stack.top
+        self._stack.pop()
+        return content
+
+    def _remove_many(self, count: int) -> List[_T]:
+        return self._stack.pop_many(count)
@@ -0,0 +1,345 @@
+"""Implementation der generischen Klasse `AVLTree[ComparableContentT]`."""
+
+from __future__ import annotations
+
+__all__: Final[list[str]] = ["AVLTree"]
+
+from typing import TYPE_CHECKING, Final, Generic
+
+from nrw.datastructures._comparable_content import ComparableContentT
+from nrw.datastructures._utils import display_binary_node, repr_binary_node
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def _height(node: _AVLNode[ComparableContentT] | None) -> int:
+    """Liefert die Höhe des Baums mit der Wurzel `node`."""
+    return node._height if node is not None else 0
+
+
+def _size(node: _AVLNode[ComparableContentT] | None) -> int:
+    """Liefert die Anzahl der Knoten des Baums mit der Wurzel `node`."""
+    return node._size if node is not None else 0
+
+
+def _update(node: _AVLNode[ComparableContentT]) -> None:
+    """Berechnet die Höhe und die Anzahl der Knoten des Baums mit der Wurzel `node`
+    aus denen seiner Teilbäume neu.
+    """
+    node._height = 1 + max(_height(node._left), _height(node._right))
+    node._size = 1 + _size(node._left) + _size(node._right)
+
+
+class _AVLNode(Generic[ComparableContentT]):
+    """Wie beim `BinarySearchTree` sorgt diese innere Klasse dafür, dass ein leerer
+    Baum `None` ist, ein nicht-leerer Baum jedoch immer eine nicht-`None`-Wurzel
+    hat, und verweist direkt auf die Wurzelknoten der Teilbäume. Zusätzlich werden
+    die Höhe des Baums und die Anzahl seiner Knoten gespeichert.
+    """
+
+    __slots__: Final[tuple[str, str, str, str, str]] = (
+        "_content",
+        "_height",
+        "_left",
+        "_right",
+        "_size",
+    )
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, content: ComparableContentT) -> None:
+        self._content: ComparableContentT = content
+        self._height: int = 1
+        self._left: _AVLNode[ComparableContentT] | None = None
+        self._right: _AVLNode[ComparableContentT] | None = None
+        self._size: int = 1
+
+    def __repr__(self) -> str:
+        return repr_binary_node(self, "height")
+
+    def __str__(self) -> str:
+        return display_binary_node(self)
+
+
+class AVLTree(Generic[ComparableContentT]):
+    """Objekte der generischen Klasse `AVLTree` verhalten sich wie Objekte der
+    Klasse `BinarySearchTree`, d. h., sie verwalten beliebig viele Objekte
+    entsprechend einer Ordnungsrelation in einem binären Suchbaum mit derselben
+    Schnittstelle.
+
+    Nach jedem Einfügen und Entfernen wird der Baum jedoch durch Rotationen so
+    ausbalanciert, dass sich die Höhen der beiden Teilbäume jedes Baums um
+    höchstens 1 unterscheiden (AVL-Baum). Die Höhe ist daher auch bei sortiert
+    eingefügten Objekten logarithmisch in der Anzahl der Objekte, sodass
+    `insert`, `remove` und `search` eine logarithmische Laufzeit haben.
+
+    Die Teilbäume werden erst beim Abfragen über `left_tree` und `right_tree` als
+    Objekte erzeugt, die auf den jeweiligen Teil des Suchbaums verweisen.
+    """
+
+    __slots__: Final[tuple[str, str, str]] = ("_is_left", "_node", "_parent")
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self) -> None:
+        """Der Konstruktor erzeugt einen leeren Suchbaum."""
+        self._node: _AVLNode[ComparableContentT] | None = None
+        self._parent: AVLTree[ComparableContentT] | None = None
+        self._is_left: bool = False
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(node={self._node!r})"
+
+    def __str__(self) -> str:
+        return str(self._node) if not self.is_empty else ""
+
+    def __iter__(self) -> Iterator[ComparableContentT]:
+        """Liefert die Inhaltsobjekte des Suchbaums aufsteigend sortiert."""
+        return self._inorder(reverse=False)
+
+    def __reversed__(self) -> Iterator[ComparableContentT]:
+        return self._inorder(reverse=True)
+
+    def __len__(self) -> int:
+        return _size(self._node)
+
+    def __contains__(self, content: object) -> bool:
+        if content is None:
+            return False
+        return self.search(content) is not None  # type: ignore[arg-type]
+
+    def _inorder(self, *, reverse: bool) -> Iterator[ComparableContentT]:
+        stack: list[_AVLNode[ComparableContentT]] = []
+        node: _AVLNode[ComparableContentT] | None = self._node
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node._right if reverse else node._left
+            node = stack.pop()
+            yield node._content
+            node = node._left if reverse else node._right
+
+    @property
+    def is_empty(self) -> bool:
+        """Diese Anfrage liefert den Wahrheitswert `True`, wenn der Suchbaum leer ist,
+        sonst liefert sie den Wert `False`.
+        """
+        return self._node is None
+
+    @property
+    def height(self) -> int:
+        """Diese Anfrage liefert die Höhe des Suchbaums, d. h. die Anzahl der Knoten
+        auf dem längsten Weg von der Wurzel zu einem Blatt. Ein leerer Suchbaum hat
+        die Höhe 0.
+        """
+        return _height(self._node)
+
+    @property
+    def content(self) -> ComparableContentT | None:
+        """Diese Anfrage liefert das Inhaltsobjekt des Suchbaumes. Wenn der Suchbaum
+        leer ist, wird `None` zurückgegeben.
+        """
+        return self._node._content if self._node is not None else None
+
+    @property
+    def left_tree(self) -> AVLTree[ComparableContentT] | None:
+        """Diese Anfrage liefert den linken Teilbaum des Suchbaumes.
+
+        Wenn er leer ist, wird `None` zurückgegeben.
+        """
+        return self._subtree(is_left=True) if self._node is not None else None
+
+    @property
+    def right_tree(self) -> AVLTree[ComparableContentT] | None:
+        """Diese Anfrage liefert den rechten Teilbaum des Suchbaumes.
+
+        Wenn er leer ist, wird `None` zurückgegeben.
+        """
+        return self._subtree(is_left=False) if self._node is not None else None
+
+    def _subtree(self, *, is_left: bool) -> AVLTree[ComparableContentT]:
+        """Erzeugt ein Objekt für den linken bzw. rechten Teilbaum des (nicht-leeren)
+        Suchbaums.
+        """
+        tree: AVLTree[ComparableContentT] = self.__class__()
+        tree._node = self._node._left if is_left else self._node._right
+        tree._parent, tree._is_left = self, is_left
+        return tree
+
+    def insert(self, content: ComparableContentT | None) -> None:
+        """Falls der Parameter `None` ist, geschieht nichts.
+
+        Falls ein bezüglich des verwendeten Vergleichs `==` mit
+        `content` übereinstimmendes Objekt im Suchbaum enthalten ist,
+        passiert nichts.
+
+        Andernfalls wird das Objekt `content` entsprechend der vorgegebenen
+        Ordnungsrelation in den Suchbaum eingeordnet und der Suchbaum
+        anschliessend ausbalanciert.
+        """
+        if content is None:
+            return
+
+        path: list[tuple[_AVLNode[ComparableContentT], bool]] = []
+        node: _AVLNode[ComparableContentT] | None = self._node
+        while node is not None:
+            if content < node._content:
+                path.append((node, True))
+                node = node._left
+            elif content > node._content:
+                path.append((node, False))
+                node = node._right
+            else:
+                return
+        self._rebalance_path(path, _AVLNode(content))
+
+    def remove(self, content: ComparableContentT | None) -> None:
+        """Falls ein bezüglich des verwendeten Vergleichs mit
+        `content` übereinstimmendes Objekt im Suchbaum enthalten
+        ist, wird dieses entfernt und der Suchbaum anschliessend ausbalanciert.
+        Falls der Parameter `None` ist, ändert sich nichts.
+        """
+        if content is None:
+            return
+
+        path: list[tuple[_AVLNode[ComparableContentT], bool]] = []
+        node: _AVLNode[ComparableContentT] | None = self._node
+        while node is not None:
+            if content < node._content:
+                path.append((node, True))
+                node = node._left
+            elif content > node._content:
+                path.append((node, False))
+                node = node._right
+            else:
+                break
+        else:
+            return
+
+        if node._left is None:
+            self._rebalance_path(path, node._right)
+        elif node._right is None:
+            self._rebalance_path(path, node._left)
+        else:
+            path.append((node, False))
+            successor: _AVLNode[ComparableContentT] = node._right
+            while successor._left is not None:
+                path.append((successor, True))
+                successor = successor._left
+            node._content = successor._content
+            self._rebalance_path(path, successor._right)
+
+    def search(self, content: ComparableContentT | None) -> ComparableContentT | None:
+        """Falls ein bezüglich des verwendeten Vergleichs `==` mit
+        `content` übereinstimmendes Objekt im Suchbaum enthalten ist,
+        liefert die Anfrage dieses, ansonsten wird `None` zurückgegeben.
+
+        Falls der Parameter `None` ist, wird `None` zurückgegeben.
+        """
+        if content is None:
+            return None
+
+        node: _AVLNode[ComparableContentT] | None = self._node
+        while node is not None:
+            if content < node._content:
+                node = node._left
+            elif content > node._content:
+                node = node._right
+            elif content == node._content:
+                return node._content
+            else:  # pragma: no cover
+                return None
+        return None
+
+    def _rebalance_path(
+        self,
+        path: list[tuple[_AVLNode[ComparableContentT], bool]],
+        child: _AVLNode[ComparableContentT] | None,
+    ) -> None:
+        """Setzt `child` als Teilbaum des letzten Knotens in `path` ein und
+        balanciert alle Knoten in `path` von unten nach oben aus. Jeder Eintrag von
+        `path` enthält einen Knoten und ob der Weg in dessen linken Teilbaum führt.
+        Die so entstandene Wurzel wird zur Wurzel des Suchbaums.
+
+        Ist der Suchbaum ein Teilbaum, werden anschliessend auch alle übergeordneten
+        Suchbäume ausbalanciert, solange sie noch auf den jeweiligen Teilbaum
+        verweisen, sodass Höhen und Anzahlen im gesamten Baum stimmen.
+        """
+        for node, is_left in reversed(path):
+            if is_left:
+                node._left = child
+            else:
+                node._right = child
+            child = self._rebalance(node)
+
+        tree: AVLTree[ComparableContentT] = self
+        old_node: _AVLNode[ComparableContentT] | None = tree._node
+        tree._node = child
+        while tree._parent is not None:
+            parent: _AVLNode[ComparableContentT] | None = tree._parent._node
+            if parent is None:
+                return
+            if tree._is_left:
+                if parent._left is not old_node:
+                    return
+                parent._left = child
+            else:
+                if parent._right is not old_node:
+                    return
+                parent._right = child
+            tree, old_node = tree._parent, parent
+            child = self._rebalance(parent)
+            tree._node = child
+
+    @staticmethod
+    def _rebalance(
+        node: _AVLNode[ComparableContentT],
+    ) -> _AVLNode[ComparableContentT]:
+        """Aktualisiert die Höhe des Baums mit der Wurzel `node`, stellt durch
+        höchstens zwei Rotationen sicher, dass sich die Höhen seiner Teilbäume um
+        höchstens 1 unterscheiden, und liefert die neue Wurzel.
+        """
+        balance: int = _height(node._left) - _height(node._right)
+        if balance > 1:
+            left: _AVLNode[ComparableContentT] | None = node._left
+            assert left is not None
+            if _height(left._left) < _height(left._right):
+                node._left = AVLTree._rotate_left(left)
+            return AVLTree._rotate_right(node)
+        if balance < -1:
+            right: _AVLNode[ComparableContentT] | None = node._right
+            assert right is not None
+            if _height(right._right) < _height(right._left):
+                node._right = AVLTree._rotate_right(right)
+            return AVLTree._rotate_left(node)
+        _update(node)
+        return node
+
+    @staticmethod
+    def _rotate_right(
+        node: _AVLNode[ComparableContentT],
+    ) -> _AVLNode[ComparableContentT]:
+        """Der linke Teilbaum wird zur Wurzel des Baums mit der Wurzel `node`; die
+        bisherige Wurzel wird dessen rechter Teilbaum. Die neue Wurzel wird
+        zurückgegeben.
+        """
+        left: _AVLNode[ComparableContentT] | None = node._left
+        assert left is not None
+        node._left, left._right = left._right, node
+        _update(node)
+        _update(left)
+        return left
+
+    @staticmethod
+    def _rotate_left(
+        node: _AVLNode[ComparableContentT],
+    ) -> _AVLNode[ComparableContentT]:
+        """Der rechte Teilbaum wird zur Wurzel des Baums mit der Wurzel `node`; die
+        bisherige Wurzel wird dessen linker Teilbaum. Die neue Wurzel wird
+        zurückgegeben.
+        """
+        right: _AVLNode[ComparableContentT] | None = node._right
+        assert right is not None
+        node._right, right._left = right._left, node
+        _update(node)
+        _update(right)
+        return right
@@ -0,0 +1,446 @@
+"""Implementation der generischen Klasse `BTree[ComparableContentT]`."""
+
+from __future__ import annotations
+
+__all__: Final[list[str]] = ["BTree"]
+
+from bisect import bisect_left
+from itertools import chain
+from typing import TYPE_CHECKING, Final, Generic
+
+from nrw.datastructures._comparable_content import ComparableContentT
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+_DEFAULT_DEGREE: Final[int] = 16
+
+
+class _BTreeNode(Generic[ComparableContentT]):
+    """Knoten eines B-Baums, der mehrere aufsteigend sortierte Inhaltsobjekte in
+    einer Liste speichert. Ein innerer Knoten hat genau ein Kind mehr als
+    Inhaltsobjekte, ein Blatt hat keine Kinder.
+    """
+
+    __slots__: Final[tuple[str, str]] = ("_children", "_contents")
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        contents: list[ComparableContentT],
+        children: list[_BTreeNode[ComparableContentT]],
+    ) -> None:
+        self._contents: list[ComparableContentT] = contents
+        self._children: list[_BTreeNode[ComparableContentT]] = children
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(contents={self._contents!r}, "
+            f"children={self._children!r})"
+        )
+
+
+class BTree(Generic[ComparableContentT]):
+    """Objekte der generischen Klasse `BTree` verwalten wie Objekte der Klasse
+    `BinarySearchTree` beliebig viele Objekte entsprechend einer Ordnungsrelation
+    mit derselben Schnittstelle für `insert`, `remove` und `search`. Die Klasse der
+    Objekte muss das Protocol `ComparableContent` implementieren.
+
+    Die Objekte werden in einem B-Baum gespeichert: Jeder Knoten enthält zwischen
+    `degree - 1` und `2 * degree - 1` aufsteigend sortierte Objekte (nur die
+    Wurzel darf weniger enthalten) und alle Blätter liegen auf derselben Tiefe.
+    Eine Suche besucht daher nur etwa log_degree(n) Knoten, deren Objekte jeweils
+    zusammenhängend in einer Liste liegen und binär durchsucht werden.
+    """
+
+    __slots__: Final[tuple[str, str, str]] = ("_degree", "_length", "_root")
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, degree: int = _DEFAULT_DEGREE) -> None:
+        """Der Konstruktor erzeugt einen leeren B-Baum mit dem Mindestgrad `degree`.
+        Ist `degree` kleiner als 2, wird der Mindestgrad 2 verwendet.
+        """
+        self._degree: int = max(degree, 2)
+        self._root: _BTreeNode[ComparableContentT] = _BTreeNode([], [])
+        self._length: int = 0
+
+    @classmethod
+    def from_sorted(
+        cls,
+        iterable: Iterable[ComparableContentT | None],
+        degree: int = _DEFAULT_DEGREE,
+    ) -> BTree[ComparableContentT]:
+        """Ein neuer B-Baum mit dem Mindestgrad `degree` wird erzeugt, der alle
+        Objekte aus dem aufsteigend sortierten `iterable` enthält. `None` und
+        Objekte, die bezüglich `==` mit ihrem Vorgänger übereinstimmen, werden
+        übersprungen. Der Aufbau hat eine lineare Laufzeit.
+
+        Ist `iterable` nicht aufsteigend sortiert, werden die Objekte wie bei
+        `from_iterable` zuerst sortiert.
+        """
+        contents: list[ComparableContentT] = []
+        iterator: Iterator[ComparableContentT | None] = iter(iterable)
+        for content in iterator:
+            if content is None:
+                continue
+            if contents:
+                previous: ComparableContentT = contents[-1]
+                if content == previous:
+                    continue
+                if not previous < content:
+                    return cls.from_iterable(
+                        chain(contents, (content,), iterator),
+                        degree,
+                    )
+            contents.append(content)
+        return cls._from_unique_sorted(contents, degree)
+
+    @classmethod
+    def from_iterable(
+        cls,
+        iterable: Iterable[ComparableContentT | None],
+        degree: int = _DEFAULT_DEGREE,
+    ) -> BTree[ComparableContentT]:
+        """Ein neuer B-Baum mit dem Mindestgrad `degree` wird erzeugt, der alle
+        Objekte aus `iterable` enthält. `None` wird übersprungen. Von Objekten, die
+        bezüglich `==` übereinstimmen, wird wie bei `insert` nur das erste
+        übernommen. Die Objekte werden zuerst sortiert, sodass der Aufbau die
+        Laufzeit des Sortierens hat.
+        """
+        contents: list[ComparableContentT] = sorted(
+            content for content in iterable if content is not None
+        )
+        unique: list[ComparableContentT] = []
+        for content in contents:
+            if not unique or content != unique[-1]:
+                unique.append(content)
+        return cls._from_unique_sorted(unique, degree)
+
+    @classmethod
+    def _from_unique_sorted(
+        cls,
+        contents: list[ComparableContentT],
+        degree: int,
+    ) -> BTree[ComparableContentT]:
+        """Baut aus den streng aufsteigend sortierten `contents` ebenenweise von den
+        Blättern bis zur Wurzel einen B-Baum auf. Die Objekte einer Ebene werden
+        gleichmässig auf möglichst wenige Knoten verteilt; die Objekte zwischen
+        diesen Knoten bilden die nächsthöhere Ebene.
+        """
+        tree: BTree[ComparableContentT] = cls(degree)
+        tree._length = len(contents)
+        capacity: int = 2 * tree._degree - 1
+        children: list[_BTreeNode[ComparableContentT]] = []
+        while len(contents) > capacity:
+            count: int = -(-(len(contents) + 1) // (capacity + 1))
+            size, extra = divmod(len(contents) - count + 1, count)
+            separators: list[ComparableContentT] = []
+            nodes: list[_BTreeNode[ComparableContentT]] = []
+            start: int = 0
+            for index in range(count):
+                stop: int = start + size + int(index < extra)
+                nodes.append(
+                    _BTreeNode(
+                        contents[start:stop],
+                        children[start : stop + 1] if children else [],
+                    ),
+                )
+                if stop < len(contents):
+                    separators.append(contents[stop])
+                start = stop + 1
+            contents, children = separators, nodes
+        tree._root = _BTreeNode(contents, children)
+        return tree
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(degree={self._degree!r}, "
+            f"root={self._root!r})"
+        )
+
+    def __iter__(self) -> Iterator[ComparableContentT]:
+        """Liefert die Inhaltsobjekte des B-Baums aufsteigend sortiert."""
+        return self.range()
+
+    def __reversed__(self) -> Iterator[ComparableContentT]:
+        stack: list[tuple[_BTreeNode[ComparableContentT], int]] = []
+        self._push_rightmost(self._root, stack)
+        while stack:
+            node, index = stack.pop()
+            if index == 0:
+                continue
+            yield node._contents[index - 1]
+            stack.append((node, index - 1))
+            if node._children:
+                self._push_rightmost(node._children[index - 1], stack)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __contains__(self, content: object) -> bool:
+        if content is None:
+            return False
+        return self.search(content) is not None  # type: ignore[arg-type]
+
+    @staticmethod
+    def _push_rightmost(
+        node: _BTreeNode[ComparableContentT],
+        stack: list[tuple[_BTreeNode[ComparableContentT], int]],
+    ) -> None:
+        """Legt `node` und alle Knoten auf dem Weg zu dessen grösstem Objekt auf
+        `stack`.
+        """
+        while True:
+            stack.append((node, len(node._contents)))
+            if not node._children:
+                return
+            node = node._children[-1]
+
+    @property
+    def is_empty(self) -> bool:
+        """Diese Anfrage liefert den Wahrheitswert `True`, wenn der B-Baum leer ist,
+        sonst liefert sie den Wert `False`.
+        """
+        return self._length == 0
+
+    @property
+    def degree(self) -> int:
+        """Diese Anfrage liefert den Mindestgrad des B-Baums."""
+        return self._degree
+
+    @property
+    def height(self) -> int:
+        """Diese Anfrage liefert die Höhe des B-Baums, d. h. die Anzahl der Knoten
+        auf dem Weg von der Wurzel zu einem Blatt. Ein leerer B-Baum hat die Höhe 0.
+        """
+        if self.is_empty:
+            return 0
+        height: int = 1
+        node: _BTreeNode[ComparableContentT] = self._root
+        while node._children:
+            node = node._children[0]
+            height += 1
+        return height
+
+    @property
+    def min(self) -> ComparableContentT | None:
+        """Diese Anfrage liefert das kleinste Objekt des B-Baums. Wenn der B-Baum
+        leer ist, wird `None` zurückgegeben.
+        """
+        return self._min_of(self._root) if not self.is_empty else None
+
+    @property
+    def max(self) -> ComparableContentT | None:
+        """Diese Anfrage liefert das größte Objekt des B-Baums. Wenn der B-Baum leer
+        ist, wird `None` zurückgegeben.
+        """
+        return self._max_of(self._root) if not self.is_empty else None
+
+    def insert(self, content: ComparableContentT | None) -> None:
+        """Falls der Parameter `None` ist, geschieht nichts.
+
+        Falls ein bezüglich des verwendeten Vergleichs `==` mit
+        `content` übereinstimmendes Objekt im B-Baum enthalten ist,
+        passiert nichts.
+
+        Andernfalls wird das Objekt `content` entsprechend der vorgegebenen
+        Ordnungsrelation in ein Blatt des B-Baums eingeordnet. Volle Knoten auf dem
+        Weg dorthin werden dabei geteilt.
+        """
+        if content is None:
+            return
+
+        capacity: int = 2 * self._degree - 1
+        if len(self._root._contents) == capacity:
+            self._root = _BTreeNode([], [self._root])
+            self._split_child(self._root, 0)
+
+        node: _BTreeNode[ComparableContentT] = self._root
+        while True:
+            index: int = bisect_left(node._contents, content)
+            if index < len(node._contents) and node._contents[index] == content:
+                return
+            if not node._children:
+                node._contents.insert(index, content)
+                self._length += 1
+                return
+            if len(node._children[index]._contents) == capacity:
+                self._split_child(node, index)
+                middle: ComparableContentT = node._contents[index]
+                if middle == content:
+                    return
+                if middle < content:
+                    index += 1
+            node = node._children[index]
+
+    def remove(self, content: ComparableContentT | None) -> None:
+        """Falls ein bezüglich des verwendeten Vergleichs mit
+        `content` übereinstimmendes Objekt im B-Baum enthalten
+        ist, wird dieses entfernt. Falls der Parameter `None` ist, ändert sich
+        nichts.
+
+        Knoten auf dem Weg, die nur die Mindestanzahl an Objekten enthalten, werden
+        dabei vorher aufgefüllt, sodass der B-Baum in einem Durchlauf angepasst
+        wird.
+        """
+        if content is None:
+            return
+
+        degree: int = self._degree
+        node: _BTreeNode[ComparableContentT] = self._root
+        while True:
+            index: int = bisect_left(node._contents, content)
+            found: bool = (
+                index < len(node._contents) and node._contents[index] == content
+            )
+            if not node._children:
+                if found:
+                    del node._contents[index]
+                    self._length -= 1
+                break
+            if not found:
+                if len(node._children[index]._contents) < degree:
+                    index = self._fill_child(node, index)
+                node = node._children[index]
+                continue
+
+            left: _BTreeNode[ComparableContentT] = node._children[index]
+            right: _BTreeNode[ComparableContentT] = node._children[index + 1]
+            if len(left._contents) >= degree:
+                content = self._max_of(left)
+                node._contents[index] = content
+                node = left
+            elif len(right._contents) >= degree:
+                content = self._min_of(right)
+                node._contents[index] = content
+                node = right
+            else:
+                self._merge_children(node, index)
+                node = left
+
+        if not self._root._contents and self._root._children:
+            self._root = self._root._children[0]
+
+    def search(self, content: ComparableContentT | None) -> ComparableContentT | None:
+        """Falls ein bezüglich des verwendeten Vergleichs `==` mit
+        `content` übereinstimmendes Objekt im B-Baum enthalten ist,
+        liefert die Anfrage dieses, ansonsten wird `None` zurückgegeben.
+
+        Falls der Parameter `None` ist, wird `None` zurückgegeben.
+        """
+        if content is None:
+            return None
+
+        node: _BTreeNode[ComparableContentT] = self._root
+        while True:
+            index: int = bisect_left(node._contents, content)
+            if index < len(node._contents) and node._contents[index] == content:
+                return node._contents[index]
+            if not node._children:
+                return None
+            node = node._children[index]
+
+    def range(
+        self,
+        low: ComparableContentT | None = None,
+        high: ComparableContentT | None = None,
+    ) -> Iterator[ComparableContentT]:
+        """Liefert nacheinander und aufsteigend sortiert alle Objekte des B-Baums,
+        die nicht kleiner als `low` und nicht größer als `high` sind. Ist eine der
+        Grenzen `None`, ist der Bereich auf dieser Seite unbegrenzt.
+
+        Die Objekte werden erst beim Durchlaufen gesucht; dabei werden nur die
+        Knoten auf dem Weg zu `low` sowie die Knoten der gelieferten Objekte
+        besucht.
+        """
+        stack: list[tuple[_BTreeNode[ComparableContentT], int]] = []
+        node: _BTreeNode[ComparableContentT] = self._root
+        while True:
+            index: int = 0 if low is None else bisect_left(node._contents, low)
+            stack.append((node, index))
+            if not node._children:
+                break
+            node = node._children[index]
+
+        while stack:
+            node, index = stack.pop()
+            if index == len(node._contents):
+                continue
+            content: ComparableContentT = node._contents[index]
+            if high is not None and content > high:
+                return
+            yield content
+            stack.append((node, index + 1))
+            if node._children:
+                child: _BTreeNode[ComparableContentT] = node._children[index + 1]
+                while True:
+                    stack.append((child, 0))
+                    if not child._children:
+                        break
+                    child = child._children[0]
+
+    def _split_child(self, node: _BTreeNode[ComparableContentT], index: int) -> None:
+        """Teilt das volle Kind `index` von `node` in zwei Knoten; das mittlere
+        Objekt wird in `node` verschoben.
+        """
+        degree: int = self._degree
+        child: _BTreeNode[ComparableContentT] = node._children[index]
+        sibling: _BTreeNode[ComparableContentT] = _BTreeNode(
+            child._contents[degree:],
+            child._children[degree:],
+        )
+        node._contents.insert(index, child._contents[degree - 1])
+        node._children.insert(index + 1, sibling)
+        del child._contents[degree - 1 :]
+        del child._children[degree:]
+
+    def _fill_child(self, node: _BTreeNode[ComparableContentT], index: int) -> int:
+        """Sorgt dafür, dass das Kind `index` von `node` mindestens `degree` Objekte
+        enthält, indem ein Objekt von einem Geschwisterknoten übernommen wird oder
+        zwei Kinder verschmolzen werden. Liefert den Index des Kindes, in dem die
+        Objekte des bisherigen Kindes danach liegen.
+        """
+        children: list[_BTreeNode[ComparableContentT]] = node._children
+        child: _BTreeNode[ComparableContentT] = children[index]
+        if index > 0 and len(children[index - 1]._contents) >= self._degree:
+            left: _BTreeNode[ComparableContentT] = children[index - 1]
+            child._contents.insert(0, node._contents[index - 1])
+            node._contents[index - 1] = left._contents.pop()
+            if left._children:
+                child._children.insert(0, left._children.pop())
+            return index
+        if index < len(node._contents):
+            right: _BTreeNode[ComparableContentT] = children[index + 1]
+            if len(right._contents) >= self._degree:
+                child._contents.append(node._contents[index])
+                node._contents[index] = right._contents.pop(0)
+                if right._children:
+                    child._children.append(right._children.pop(0))
+                return index
+            self._merge_children(node, index)
+            return index
+        self._merge_children(node, index - 1)
+        return index - 1
+
+    @staticmethod
+    def _merge_children(node: _BTreeNode[ComparableContentT], index: int) -> None:
+        """Verschmilzt die Kinder `index` und `index + 1` von `node` zusammen mit dem
+        Objekt zwischen ihnen zu einem Knoten.
+        """
+        left: _BTreeNode[ComparableContentT] = node._children[index]
+        right: _BTreeNode[ComparableContentT] = node._children.pop(index + 1)
+        left._contents.append(node._contents.pop(index))
+        left._contents.extend(right._contents)
+        left._children.extend(right._children)
+
+    @staticmethod
+    def _min_of(node: _BTreeNode[ComparableContentT]) -> ComparableContentT:
+        while node._children:
+            node = node._children[0]
+        return node._contents[0]
+
+    @staticmethod
+    def _max_of(node: _BTreeNode[ComparableContentT]) -> ComparableContentT:
+        while node._children:
+            node = node._children[-1]
+        return node._contents[-1]
@@ -4,31 +4,46 @@ from __future__ import annotations
 
 __all__: Final[list[str]] = ["BinarySearchTree"]
 
-from typing import Final, Generic
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Final, Generic
 
+from nrw.datastructures._avl_tree import AVLTree
 from nrw.datastructures._comparable_content import ComparableContentT
-from nrw.datastructures._utils import display_binary_node
+from nrw.datastructures._utils import display_binary_node, repr_binary_node
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+def _size(node: _BSTNode[ComparableContentT] | None) -> int:
+    """Liefert die Anzahl der Objekte des Baums mit der Wurzel `node`."""
+    return node._size if node is not None else 0
 
 
 class _BSTNode(Generic[ComparableContentT]):
     """Durch diese innere Klasse kann man dafür sorgen, dass ein leerer Baum
-    `None` ist, ein nicht-leerer Baum jedoch immer eine nicht-`None`-Wurzel sowie
-    nicht-`None`-Teilbäume hat.
+    `None` ist, ein nicht-leerer Baum jedoch immer eine nicht-`None`-Wurzel hat.
+    Die Knoten verweisen direkt auf die Wurzelknoten ihrer Teilbäume; ein leerer
+    Teilbaum wird durch `None` dargestellt. Zusätzlich wird die Anzahl der Objekte
+    des Baums gespeichert.
     """
 
-    __slots__: Final[tuple[str, str, str]] = ("_content", "_left", "_right")
+    __slots__: Final[tuple[str, str, str, str]] = (
+        "_content",
+        "_left",
+        "_right",
+        "_size",
+    )
     __hash__ = None  # type: ignore[assignment]
 
     def __init__(self, content: ComparableContentT) -> None:
         self._content: ComparableContentT = content
-        self._left: BinarySearchTree[ComparableContentT] = BinarySearchTree()
-        self._right: BinarySearchTree[ComparableContentT] = BinarySearchTree()
+        self._left: _BSTNode[ComparableContentT] | None = None
+        self._right: _BSTNode[ComparableContentT] | None = None
+        self._size: int = 1
 
     def __repr__(self) -> str:
-        return (
-            f"{self.__class__.__name__}(content={self._content!r}, "
-            f"left_tree={self._left!r}, right_tree={self._right!r})"
-        )
+        return repr_binary_node(self, "size")
 
     def __str__(self) -> str:
         return display_binary_node(self)
@@ -54,15 +69,104 @@ class BinarySearchTree(Generic[ComparableContentT]):
     Inhaltsobjekt des binären Suchbaums. Diese Bedingung gilt (rekursiv) auch in
     beiden Teilbäumen.
 
+    Die Teilbäume werden erst beim Abfragen über `left_tree` und `right_tree` als
+    Objekte erzeugt, die auf den jeweiligen Teil des Suchbaums verweisen.
+
     Hinweis: In dieser Version wird die Klasse `BinaryTree` nicht benutzt.
     """
 
-    __slots__: Final[tuple[str]] = ("_node",)
+    __slots__: Final[tuple[str, str, str]] = ("_is_left", "_node", "_parent")
     __hash__ = None  # type: ignore[assignment]
 
     def __init__(self) -> None:
         """Der Konstruktor erzeugt einen leeren Suchbaum."""
         self._node: _BSTNode[ComparableContentT] | None = None
+        self._parent: BinarySearchTree[ComparableContentT] | None = None
+        self._is_left: bool = False
+
+    @classmethod
+    def from_sorted(
+        cls,
+        iterable: Iterable[ComparableContentT | None],
+    ) -> BinarySearchTree[ComparableContentT]:
+        """Ein neuer, perfekt ausbalancierter Suchbaum wird erzeugt, der alle Objekte
+        aus dem aufsteigend sortierten `iterable` enthält. `None` und Objekte, die
+        bezüglich `==` mit ihrem Vorgänger übereinstimmen, werden übersprungen. Der
+        Aufbau hat eine lineare Laufzeit.
+
+        Ist `iterable` nicht aufsteigend sortiert, werden die Objekte wie bei
+        `from_iterable` zuerst sortiert.
+        """
+        contents: list[ComparableContentT] = []
+        iterator: Iterator[ComparableContentT | None] = iter(iterable)
+        for content in iterator:
+            if content is None:
+                continue
+            if contents:
+                previous: ComparableContentT = contents[-1]
+                if content == previous:
+                    continue
+                if not previous < content:
+                    return cls.from_iterable(chain(contents, (content,), iterator))
+            contents.append(content)
+        return cls._from_unique_sorted(contents)
+
+    @classmethod
+    def from_iterable(
+        cls,
+        iterable: Iterable[ComparableContentT | None],
+    ) -> BinarySearchTree[ComparableContentT]:
+        """Ein neuer, perfekt ausbalancierter Suchbaum wird erzeugt, der alle Objekte
+        aus `iterable` enthält. `None` wird übersprungen. Von Objekten, die
+        bezüglich `==` übereinstimmen, wird wie bei `insert` nur das erste
+        übernommen. Die Objekte werden zuerst sortiert, sodass der Aufbau die
+        Laufzeit des Sortierens hat.
+        """
+        contents: list[ComparableContentT] = sorted(
+            content for content in iterable if content is not None
+        )
+        unique: list[ComparableContentT] = []
+        for content in contents:
+            if not unique or content != unique[-1]:
+                unique.append(content)
+        return cls._from_unique_sorted(unique)
+
+    @classmethod
+    def _from_unique_sorted(
+        cls,
+        contents: list[ComparableContentT],
+    ) -> BinarySearchTree[ComparableContentT]:
+        """Baut aus den streng aufsteigend sortierten `contents` einen perfekt
+        ausbalancierten Suchbaum auf, indem jeweils das mittlere Objekt eines
+        Abschnitts zur Wurzel des zugehörigen Teilbaums wird.
+        """
+        tree: BinarySearchTree[ComparableContentT] = cls()
+        sections: list[tuple[_BSTNode[ComparableContentT] | None, bool, int, int]] = [
+            (None, False, 0, len(contents)),
+        ]
+        while sections:
+            parent, is_left, low, high = sections.pop()
+            if low >= high:
+                continue
+            middle: int = (low + high) // 2
+            node: _BSTNode[ComparableContentT] = _BSTNode(contents[middle])
+            node._size = high - low
+            if parent is None:
+                tree._node = node
+            elif is_left:
+                parent._left = node
+            else:
+                parent._right = node
+            sections.append((node, True, low, middle))
+            sections.append((node, False, middle + 1, high))
+        return tree
+
+    @staticmethod
+    def balanced() -> AVLTree[Any]:
+        """Die Anfrage liefert einen neuen, leeren Suchbaum vom Typ `AVLTree`, der
+        sich nach jedem Einfügen und Entfernen selbst ausbalanciert.
+        """
+        return AVLTree()
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(node={self._node!r})"
@@ -70,6 +174,32 @@ class BinarySearchTree(Generic[ComparableContentT]):
     def __str__(self) -> str:
         return str(self._node) if not self.is_empty else ""
 
+    def __iter__(self) -> Iterator[ComparableContentT]:
+        """Liefert die Inhaltsobjekte des Suchbaums aufsteigend sortiert."""
+        return self._inorder(reverse=False)
+
+    def __reversed__(self) -> Iterator[ComparableContentT]:
+        return self._inorder(reverse=True)
+
+    def __len__(self) -> int:
+        return self._node._size if self._node is not None else 0
+
+    def __contains__(self, content: object) -> bool:
+        if content is None:
+            return False
+        return self.search(content) is not None  # type: ignore[arg-type]
+
+    def _inorder(self, *, reverse: bool) -> Iterator[ComparableContentT]:
+        stack: list[_BSTNode[ComparableContentT]] = []
+        node: _BSTNode[ComparableContentT] | None = self._node
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node._right if reverse else node._left
+            node = stack.pop()
+            yield node._content
+            node = node._left if reverse else node._right
+
     @property
     def is_empty(self) -> bool:
         """Diese Anfrage liefert den Wahrheitswert `True`, wenn der Suchbaum leer ist,
@@ -90,7 +220,7 @@ class BinarySearchTree(Generic[ComparableContentT]):
 
         Wenn er leer ist, wird `None` zurückgegeben.
         """
-        return self._node._left if not self.is_empty else None
+        return self._subtree(is_left=True) if not self.is_empty else None
 
     @property
     def right_tree(self) -> BinarySearchTree[ComparableContentT] | None:
@@ -98,7 +228,16 @@ class BinarySearchTree(Generic[ComparableContentT]):
 
         Wenn er leer ist, wird `None` zurückgegeben.
         """
-        return self._node._right if not self.is_empty else None
+        return self._subtree(is_left=False) if not self.is_empty else None
+
+    def _subtree(self, *, is_left: bool) -> BinarySearchTree[ComparableContentT]:
+        """Erzeugt ein Objekt für den linken bzw. rechten Teilbaum des (nicht-leeren)
+        Suchbaums.
+        """
+        tree: BinarySearchTree[ComparableContentT] = self.__class__()
+        tree._node = self._node._left if is_left else self._node._right
+        tree._parent, tree._is_left = self, is_left
+        return tree
 
     def insert(self, content: ComparableContentT | None) -> None:
         """Falls der Parameter `None` ist, geschieht nichts.
@@ -116,12 +255,23 @@ class BinarySearchTree(Generic[ComparableContentT]):
         if content is None:
             return
 
-        if self.is_empty:
-            self._node = _BSTNode(content)
-        elif content < self._node._content:
-            self._node._left.insert(content)
-        elif content > self._node._content:
-            self._node._right.insert(content)
+        path: list[_BSTNode[ComparableContentT]] = []
+        node: _BSTNode[ComparableContentT] | None = self._node
+        is_left: bool = False
+        while node is not None:
+            if content < node._content:
+                is_left = True
+            elif content > node._content:
+                is_left = False
+            else:
+                return
+            path.append(node)
+            node = node._left if is_left else node._right
+
+        self._link(path[-1] if path else None, _BSTNode(content), is_left=is_left)
+        for node in path:
+            node._size += 1
+        self._resize_ancestors(1)
 
     def remove(self, content: ComparableContentT | None) -> None:
         """Falls ein bezüglich des verwendeten Vergleichs mit
@@ -129,31 +279,83 @@ class BinarySearchTree(Generic[ComparableContentT]):
         ist, wird dieses entfernt. Falls der Parameter `None` ist, ändert sich
         nichts.
         """
-        if self.is_empty or content is None:
+        if content is None:
+            return
+
+        path: list[_BSTNode[ComparableContentT]] = []
+        node: _BSTNode[ComparableContentT] | None = self._node
+        is_left: bool = False
+        while node is not None:
+            if content < node._content:
+                is_left = True
+            elif content > node._content:
+                is_left = False
+            else:
+                break
+            path.append(node)
+            node = node._left if is_left else node._right
+        else:
             return
 
-        if content < self._node._content:
-            self._node._left.remove(content)
-        elif content > self._node._content:
-            self._node._right.remove(content)
-        elif self._node._left.is_empty and self._node._right.is_empty:
-            self._node = None
-        elif self._node._left.is_empty and not self._node._right.is_empty:
-            self._node = self._node_of_right_successor
-        elif not self._node._left.is_empty and self._node._right.is_empty:
-            self._node = self._node_of_left_successor
-        elif self._node_of_right_successor._left.is_empty:
-            self._node._content, self._node._right = (
-                self._node_of_right_successor._content,
-                self._node_of_right_successor._right,
-            )
+        for ancestor in path:
+            ancestor._size -= 1
+        self._resize_ancestors(-1)
+        parent: _BSTNode[ComparableContentT] | None = path[-1] if path else None
+        if node._left is None:
+            self._link(parent, node._right, is_left=is_left)
+        elif node._right is None:
+            self._link(parent, node._left, is_left=is_left)
         else:
-            previous: BinarySearchTree[ComparableContentT] = (
-                self._node._right._ancestor_of_small_right()
-            )
-            smallest: BinarySearchTree[ComparableContentT] | None = previous._node._left
-            self._node._content = smallest._node._content
-            previous.remove(smallest._node._content)
+            node._size -= 1
+            parent, is_left = node, False
+            smallest: _BSTNode[ComparableContentT] | None = node._right
+            while smallest._left is not None:
+                smallest._size -= 1
+                parent, is_left = smallest, True
+                smallest = smallest._left
+            node._content = smallest._content
+            self._link(parent, smallest._right, is_left=is_left)
+
+    def _link(
+        self,
+        parent: _BSTNode[ComparableContentT] | None,
+        node: _BSTNode[ComparableContentT] | None,
+        *,
+        is_left: bool,
+    ) -> None:
+        """Setzt `node` als linken bzw. rechten Teilbaum von `parent` ein. Ist
+        `parent` `None`, wird `node` zur Wurzel des Suchbaums; verweist der
+        übergeordnete Suchbaum noch auf die bisherige Wurzel, wird auch dieser
+        Verweis ersetzt.
+        """
+        if parent is not None:
+            if is_left:
+                parent._left = node
+            else:
+                parent._right = node
+            return
+
+        old_node: _BSTNode[ComparableContentT] | None = self._node
+        self._node = node
+        parent = self._parent._node if self._parent is not None else None
+        if parent is None:
+            return
+        if self._is_left:
+            if parent._left is old_node:
+                parent._left = node
+        elif parent._right is old_node:
+            parent._right = node
+
+    def _resize_ancestors(self, delta: int) -> None:
+        """Passt die Anzahl der Objekte aller übergeordneten Suchbäume um `delta`
+        an, wenn der Suchbaum als Teilbaum über `left_tree` bzw. `right_tree`
+        verändert wird.
+        """
+        tree: BinarySearchTree[ComparableContentT] | None = self._parent
+        while tree is not None:
+            if tree._node is not None:
+                tree._node._size += delta
+            tree = tree._parent
 
     def search(self, content: ComparableContentT | None) -> ComparableContentT | None:
         """Falls ein bezüglich des verwendeten Vergleichs `==` mit
@@ -162,30 +364,222 @@ class BinarySearchTree(Generic[ComparableContentT]):
 
         Falls der Parameter `None` ist, wird `None` zurückgegeben.
         """
-        if self.is_empty or content is None:
+        if content is None:
+            return None
+
+        node: _BSTNode[ComparableContentT] | None = self._node
+        while node is not None:
+            if content < node._content:
+                node = node._left
+            elif content > node._content:
+                node = node._right
+            elif content == node._content:
+                return node._content
+            else:  # pragma: no cover
+                return None
+        return None
+
+    def rank(self, content: ComparableContentT | None) -> int:
+        """Die Anfrage liefert die Anzahl der Objekte des Suchbaumes, die kleiner als
+        `content` sind. `content` muss dabei nicht im Suchbaum enthalten sein. Falls
+        der Parameter `None` ist, wird 0 zurückgegeben.
+        """
+        return self._count_smaller(content, inclusive=False)
+
+    def select(self, index: int) -> ComparableContentT | None:
+        """Die Anfrage liefert das Objekt, vor dem genau `index` kleinere Objekte im
+        Suchbaum enthalten sind, d. h. für `index` 0 das kleinste Objekt. Liegt
+        `index` nicht zwischen 0 und `len(self) - 1`, wird `None` zurückgegeben.
+        """
+        if not 0 <= index < len(self):
             return None
 
-        if content < self._node._content:
-            return self.left_tree.search(content)
-        if content > self._node._content:
-            return self.right_tree.search(content)
-        if content == self._node._content:
-            return self._node._content
+        node: _BSTNode[ComparableContentT] | None = self._node
+        while node is not None:
+            left_size: int = _size(node._left)
+            if index < left_size:
+                node = node._left
+            elif index > left_size:
+                index -= left_size + 1
+                node = node._right
+            else:
+                return node._content
         return None  # pragma: no cover
 
-    def _ancestor_of_small_right(self) -> BinarySearchTree[ComparableContentT]:
-        """Die Methode liefert denjenigen Baum, dessen linker Nachfolger keinen linken
-        Nachfolger mehr hat. Es ist also später möglich, in einem Baum im
-        rechten Nachfolger den Vorgänger des linkesten Nachfolgers zu finden.
+    def count_between(
+        self,
+        low: ComparableContentT | None = None,
+        high: ComparableContentT | None = None,
+    ) -> int:
+        """Die Anfrage liefert die Anzahl der Objekte des Suchbaumes, die nicht
+        kleiner als `low` und nicht größer als `high` sind, d. h. die Anzahl der
+        Objekte, die `range(low, high)` liefert. Ist eine der Grenzen `None`, ist
+        der Bereich auf dieser Seite unbegrenzt.
         """
-        if self._node_of_left_successor._left.is_empty:
-            return self
-        return self._node._left._ancestor_of_small_right()
+        if low is not None and high is not None and low > high:
+            return 0
+        upper: int = len(self)
+        if high is not None:
+            upper = self._count_smaller(high, inclusive=True)
+        return upper - self._count_smaller(low, inclusive=False)
+
+    def _count_smaller(
+        self,
+        content: ComparableContentT | None,
+        *,
+        inclusive: bool,
+    ) -> int:
+        """Liefert die Anzahl der Objekte, die kleiner als `content` bzw. bei
+        `inclusive` nicht größer als `content` sind.
+        """
+        if content is None:
+            return 0
+
+        count: int = 0
+        node: _BSTNode[ComparableContentT] | None = self._node
+        while node is not None:
+            if content < node._content:
+                node = node._left
+            elif content > node._content:
+                count += _size(node._left) + 1
+                node = node._right
+            else:
+                return count + _size(node._left) + int(inclusive)
+        return count
 
     @property
-    def _node_of_left_successor(self) -> _BSTNode[ComparableContentT] | None:
-        return self._node._left._node
+    def min(self) -> ComparableContentT | None:
+        """Diese Anfrage liefert das kleinste Objekt des Suchbaumes. Wenn der
+        Suchbaum leer ist, wird `None` zurückgegeben.
+        """
+        node: _BSTNode[ComparableContentT] | None = self._node
+        if node is None:
+            return None
+        while node._left is not None:
+            node = node._left
+        return node._content
 
     @property
-    def _node_of_right_successor(self) -> _BSTNode[ComparableContentT] | None:
-        return self._node._right._node
+    def max(self) -> ComparableContentT | None:
+        """Diese Anfrage liefert das größte Objekt des Suchbaumes. Wenn der Suchbaum
+        leer ist, wird `None` zurückgegeben.
+        """
+        node: _BSTNode[ComparableContentT] | None = self._node
+        if node is None:
+            return None
+        while node._right is not None:
+            node = node._right
+        return node._content
+
+    def floor(self, content: ComparableContentT | None) -> ComparableContentT | None:
+        """Die Anfrage liefert das größte Objekt des Suchbaumes, das nicht größer als
+        `content` ist. Gibt es kein solches Objekt oder ist der Parameter `None`,
+        wird `None` zurückgegeben.
+        """
+        if content is None:
+            return None
+
+        result: ComparableContentT | None = None
+        node: _BSTNode[ComparableContentT] | None = self._node
+        while node is not None:
+            if content < node._content:
+                node = node._left
+            elif content > node._content:
+                result = node._content
+                node = node._right
+            else:
+                return node._content
+        return result
+
+    def ceiling(self, content: ComparableContentT | None) -> ComparableContentT | None:
+        """Die Anfrage liefert das kleinste Objekt des Suchbaumes, das nicht kleiner
+        als `content` ist. Gibt es kein solches Objekt oder ist der Parameter
+        `None`, wird `None` zurückgegeben.
+        """
+        if content is None:
+            return None
+
+        result: ComparableContentT | None = None
+        node: _BSTNode[ComparableContentT] | None = self._node
+        while node is not None:
+            if content < node._content:
+                result = node._content
+                node = node._left
+            elif content > node._content:
+                node = node._right
+            else:
+                return node._content
+        return result
+
+    def successor(
+        self,
+        content: ComparableContentT | None,
+    ) -> ComparableContentT | None:
+        """Die Anfrage liefert das kleinste Objekt des Suchbaumes, das größer als
+        `content` ist. `content` muss dabei nicht im Suchbaum enthalten sein. Gibt es
+        kein solches Objekt oder ist der Parameter `None`, wird `None`
+        zurückgegeben.
+        """
+        if content is None:
+            return None
+
+        result: ComparableContentT | None = None
+        node: _BSTNode[ComparableContentT] | None = self._node
+        while node is not None:
+            if content < node._content:
+                result = node._content
+                node = node._left
+            else:
+                node = node._right
+        return result
+
+    def predecessor(
+        self,
+        content: ComparableContentT | None,
+    ) -> ComparableContentT | None:
+        """Die Anfrage liefert das größte Objekt des Suchbaumes, das kleiner als
+        `content` ist. `content` muss dabei nicht im Suchbaum enthalten sein. Gibt es
+        kein solches Objekt oder ist der Parameter `None`, wird `None`
+        zurückgegeben.
+        """
+        if content is None:
+            return None
+
+        result: ComparableContentT | None = None
+        node: _BSTNode[ComparableContentT] | None = self._node
+        while node is not None:
+            if content > node._content:
+                result = node._content
+                node = node._right
+            else:
+                node = node._left
+        return result
+
+    def range(
+        self,
+        low: ComparableContentT | None = None,
+        high: ComparableContentT | None = None,
+    ) -> Iterator[ComparableContentT]:
+        """Liefert nacheinander und aufsteigend sortiert alle Objekte des Suchbaumes,
+        die nicht kleiner als `low` und nicht größer als `high` sind. Ist eine der
+        Grenzen `None`, ist der Bereich auf dieser Seite unbegrenzt.
+
+        Die Objekte werden erst beim Durchlaufen gesucht; dabei werden nur die
+        Knoten auf dem Weg zu `low` sowie die gelieferten Objekte besucht.
+        """
+        stack: list[_BSTNode[ComparableContentT]] = []
+        node: _BSTNode[ComparableContentT] | None = self._node
+        while True:
+            while node is not None:
+                if low is not None and node._content < low:
+                    node = node._right
+                else:
+                    stack.append(node)
+                    node = node._left
+            if not stack:
+                return
+            node = stack.pop()
+            if high is not None and node._content > high:
+                return
+            yield node._content
+            node = node._right
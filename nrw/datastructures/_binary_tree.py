@@ -4,17 +4,21 @@ from __future__ import annotations
 
 __all__: Final[list[str]] = ["BinaryTree"]
 
-from typing import Final, Generic, TypeVar
+from typing import TYPE_CHECKING, Final, Generic, TypeVar
 
-from nrw.datastructures._utils import display_binary_node
+from nrw.datastructures._utils import display_binary_node, repr_binary_node
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 _T = TypeVar("_T")
 
 
 class _BTNode(Generic[_T]):
     """Durch diese innere Klasse kann man dafür sorgen, dass ein leerer Baum `None`
-    ist, ein nicht-leerer Baum jedoch immer eine nicht-`None`-Wurzel sowie
-    nicht-`None`-Teilbäume, ggf. leere Teilbäume hat.
+    ist, ein nicht-leerer Baum jedoch immer eine nicht-`None`-Wurzel hat. Die
+    Knoten verweisen direkt auf die Wurzelknoten ihrer Teilbäume; ein leerer
+    Teilbaum wird durch `None` dargestellt.
     """
 
     __slots__: Final[tuple[str, str, str]] = ("_content", "_left", "_right")
@@ -22,14 +26,11 @@ class _BTNode(Generic[_T]):
 
     def __init__(self, content: _T) -> None:
         self._content: _T = content
-        self._left: BinaryTree[_T] | None = BinaryTree()
-        self._right: BinaryTree[_T] | None = BinaryTree()
+        self._left: _BTNode[_T] | None = None
+        self._right: _BTNode[_T] | None = None
 
     def __repr__(self) -> str:
-        return (
-            f"{self.__class__.__name__}(content={self._content!r}, "
-            f"left_tree={self._left!r}, right_tree={self._right!r})"
-        )
+        return repr_binary_node(self)
 
     def __str__(self) -> str:
         return display_binary_node(self)
@@ -41,9 +42,16 @@ class BinaryTree(Generic[_T]):
     Objekt der Klasse stellt entweder einen leeren Baum dar oder verwaltet ein
     Inhaltsobjekt sowie einen linken und einen rechten Teilbaum, die ebenfalls
     Objekte der generischen Klasse `BinaryTree` sind.
+
+    Abweichend von der Vorgabe des Landes werden die Teilbäume erst beim Abfragen
+    über `left_tree` und `right_tree` als neue Objekte erzeugt, die auf den
+    jeweiligen Teil des Baumes verweisen. Änderungen an einem solchen Teilbaum
+    wirken sich auf den gesamten Baum aus, jedoch ist `tree.left_tree is
+    tree.left_tree` `False`. Wird ein leerer Baum in mehrere Bäume eingesetzt, ist
+    er nur mit dem zuletzt verbundenen Baum verknüpft.
     """
 
-    __slots__: Final[tuple[str]] = ("_node",)
+    __slots__: Final[tuple[str, str, str]] = ("_is_left", "_node", "_parent")
     __hash__ = None  # type: ignore[assignment]
 
     def __init__(
@@ -70,12 +78,13 @@ class BinaryTree(Generic[_T]):
         dass linke oder rechte Teilbäume `None` sind. Wenn der Parameter `content`
         `None` ist, wird ein leerer Binaerbaum erzeugt.
         """
-        if content is None:
-            self._node: _BTNode[_T] | None = None
-        else:
+        self._node: _BTNode[_T] | None = None
+        self._parent: BinaryTree[_T] | None = None
+        self._is_left: bool = False
+        if content is not None:
             self._node = _BTNode(content)
-            self._node._left = left_tree if left_tree is not None else BinaryTree()
-            self._node._right = right_tree if right_tree is not None else BinaryTree()
+            self._attach(left_tree, is_left=True)
+            self._attach(right_tree, is_left=False)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(node={self._node!r})"
@@ -85,6 +94,27 @@ class BinaryTree(Generic[_T]):
             return ""
         return str(self._node)
 
+    def __iter__(self) -> Iterator[_T]:
+        """Liefert die Inhaltsobjekte des Binaerbaums in Inorder-Reihenfolge."""
+        return self._inorder(reverse=False)
+
+    def __reversed__(self) -> Iterator[_T]:
+        return self._inorder(reverse=True)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def _inorder(self, *, reverse: bool) -> Iterator[_T]:
+        stack: list[_BTNode[_T]] = []
+        node: _BTNode[_T] | None = self._node
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node._right if reverse else node._left
+            node = stack.pop()
+            yield node._content
+            node = node._left if reverse else node._right
+
     @property
     def is_empty(self) -> bool:
         """Diese Anfrage liefert das Inhaltsobjekt des Binaerbaums. Wenn der Binaerbaum
@@ -104,10 +134,8 @@ class BinaryTree(Generic[_T]):
         if new_content is None:
             return
 
-        if self.is_empty:
-            self._node = _BTNode(new_content)
-            self._node._left = BinaryTree()
-            self._node._right = BinaryTree()
+        if self._node is None:
+            self._replace_node(_BTNode(new_content))
         else:
             self._node._content = new_content
 
@@ -116,23 +144,69 @@ class BinaryTree(Generic[_T]):
         """Diese Anfrage liefert den linken Teilbaum des Binaerbaumes. Wenn der
         Binaerbaum leer ist, wird `None` zurückgegeben.
         """
-        return self._node._left if not self.is_empty else None
+        return self._subtree(is_left=True) if not self.is_empty else None
 
     @left_tree.setter
     def left_tree(self, new_tree: BinaryTree[_T] | None) -> None:
-        if self.is_empty or new_tree is None:
+        if self.is_empty:
             return
-        self._node._left = new_tree
+        self._attach(new_tree, is_left=True)
 
     @property
     def right_tree(self) -> BinaryTree[_T] | None:
         """Diese Anfrage liefert den rechten Teilbaum des Binaerbaumes. Wenn der
         Binaerbaum leer ist, wird `None` zurückgegeben.
         """
-        return self._node._right if not self.is_empty else None
+        return self._subtree(is_left=False) if not self.is_empty else None
 
     @right_tree.setter
     def right_tree(self, new_tree: BinaryTree[_T] | None) -> None:
-        if self.is_empty or new_tree is None:
+        if self.is_empty:
+            return
+        self._attach(new_tree, is_left=False)
+
+    def _subtree(self, *, is_left: bool) -> BinaryTree[_T]:
+        """Erzeugt ein Objekt für den linken bzw. rechten Teilbaum des (nicht-leeren)
+        Binaerbaums.
+        """
+        tree: BinaryTree[_T] = self.__class__()
+        tree._node = self._node._left if is_left else self._node._right
+        tree._parent, tree._is_left = self, is_left
+        return tree
+
+    def _attach(self, tree: BinaryTree[_T] | None, *, is_left: bool) -> None:
+        """Setzt `tree` als linken bzw. rechten Teilbaum des (nicht-leeren)
+        Binaerbaums ein, sodass spätere Änderungen an `tree` den Binaerbaum
+        betreffen. Ist `tree` `None`, geschieht nichts.
+
+        Ein Baum merkt sich nur den Binaerbaum, in den er zuletzt eingesetzt wurde.
+        Wird derselbe leere Baum mehrfach eingesetzt, erhält daher nur dieser
+        Binaerbaum die Wurzel, die `tree` später über `content` bekommt; alle
+        anderen behalten einen leeren Teilbaum. Bei einem nicht-leeren Baum teilen
+        sich dagegen alle Binaerbäume dessen Knoten.
+        """
+        if tree is None:
+            return
+        if is_left:
+            self._node._left = tree._node
+        else:
+            self._node._right = tree._node
+        tree._parent, tree._is_left = self, is_left
+
+    def _replace_node(self, new_node: _BTNode[_T]) -> None:
+        """Ersetzt die Wurzel des Binaerbaums durch `new_node`. Verweist der
+        übergeordnete Baum noch auf die bisherige Wurzel, wird auch dieser Verweis
+        ersetzt.
+        """
+        old_node: _BTNode[_T] | None = self._node
+        self._node = new_node
+        parent: _BTNode[_T] | None = (
+            self._parent._node if self._parent is not None else None
+        )
+        if parent is None:
             return
-        self._node._right = new_tree
+        if self._is_left:
+            if parent._left is old_node:
+                parent._left = new_node
+        elif parent._right is old_node:
+            parent._right = new_node
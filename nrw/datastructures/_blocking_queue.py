@@ -0,0 +1,177 @@
+"""Implementation der generischen Klasse `BlockingQueue[_T]`."""
+
+from __future__ import annotations
+
+__all__: Final[list[str]] = ["BlockingQueue"]
+
+import threading
+import time
+from typing import TYPE_CHECKING, Final, Generic, TypeVar
+
+from nrw.datastructures._array_queue import ArrayQueue
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from nrw.datastructures._list import List
+
+_T = TypeVar("_T")
+
+
+class BlockingQueue(Generic[_T]):
+    """Objekte der generischen Klasse `BlockingQueue` verwalten beliebige Objekte
+    nach dem First-In-First-Out-Prinzip und können gefahrlos von mehreren Threads
+    gleichzeitig verwendet werden, z. B. um Threads, die Nachrichten empfangen,
+    von Threads zu entkoppeln, die diese verarbeiten.
+
+    Ist `maxsize` größer als 0, enthält die Schlange höchstens `maxsize` Objekte;
+    `put` wartet dann, bis wieder Platz ist (*backpressure*). `get` wartet, bis
+    ein Objekt vorhanden ist. Wartende Threads werden über Bedingungsvariablen
+    geweckt. Alle wartenden Aufträge können mit einem `timeout` in Sekunden
+    begrenzt werden; ist `timeout` `None`, wird unbegrenzt gewartet.
+    """
+
+    __slots__: Final[tuple[str, str, str, str]] = (
+        "_maxsize",
+        "_not_empty",
+        "_not_full",
+        "_queue",
+    )
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """Eine leere Schlange wird erzeugt, die höchstens `maxsize` Objekte
+        enthält. Ist `maxsize` kleiner oder gleich 0, ist die Schlange unbegrenzt.
+        """
+        self._maxsize: int = max(maxsize, 0)
+        self._queue: ArrayQueue[_T] = ArrayQueue()
+        lock: threading.Lock = threading.Lock()
+        self._not_empty: threading.Condition = threading.Condition(lock)
+        self._not_full: threading.Condition = threading.Condition(lock)
+
+    def __repr__(self) -> str:
+        with self._not_empty:
+            return (
+                f"{self.__class__.__name__}(maxsize={self._maxsize!r}, "
+                f"contents={list(self._queue)!r})"
+            )
+
+    def __len__(self) -> int:
+        with self._not_empty:
+            return len(self._queue)
+
+    @property
+    def maxsize(self) -> int:
+        """Die Anfrage liefert die maximale Anzahl an Objekten der Schlange. Der
+        Wert 0 steht für eine unbegrenzte Schlange.
+        """
+        return self._maxsize
+
+    @property
+    def is_empty(self) -> bool:
+        """Die Anfrage liefert den Wert `True`, wenn die Schlange keine Objekte enthält,
+        sonst liefert sie den Wert `False`.
+        """
+        with self._not_empty:
+            return self._queue.is_empty
+
+    @property
+    def is_full(self) -> bool:
+        """Die Anfrage liefert den Wert `True`, wenn die Schlange begrenzt ist und
+        `maxsize` Objekte enthält, sonst liefert sie den Wert `False`.
+        """
+        with self._not_empty:
+            return self._is_full()
+
+    @property
+    def front(self) -> _T | None:
+        """Die Anfrage liefert das erste Objekt der Schlange, ohne zu warten.
+        Die Schlange bleibt unverändert.
+        Falls die Schlange leer ist, wird `None` zurückgegeben.
+        """
+        with self._not_empty:
+            return self._queue.front
+
+    def put(self, content: _T | None, timeout: float | None = None) -> bool:
+        """Das Objekt `content` wird an die Schlange angehängt. Ist die Schlange voll,
+        wird höchstens `timeout` Sekunden auf freien Platz gewartet.
+
+        Die Anfrage liefert den Wert `True`, wenn `content` angehängt wurde. Ist
+        `content` `None` oder ist die Wartezeit abgelaufen, bleibt die Schlange
+        unverändert und die Anfrage liefert den Wert `False`.
+        """
+        if content is None:
+            return False
+
+        with self._not_full:
+            if not self._not_full.wait_for(self._has_space, timeout):
+                return False
+            self._queue.enqueue(content)
+            self._not_empty.notify()
+        return True
+
+    def put_many(
+        self,
+        iterable: Iterable[_T | None],
+        timeout: float | None = None,
+    ) -> int:
+        """Alle Objekte aus `iterable` werden in deren Reihenfolge an die Schlange
+        angehängt, wobei `None` übersprungen wird. Ist die Schlange voll, wird auf
+        freien Platz gewartet, insgesamt jedoch höchstens `timeout` Sekunden.
+
+        Die Anfrage liefert die Anzahl der angehängten Objekte. Ist die Wartezeit
+        abgelaufen, werden die restlichen Objekte nicht angehängt.
+        """
+        deadline: float | None = None if timeout is None else time.monotonic() + timeout
+        count: int = 0
+        with self._not_full:
+            for content in iterable:
+                if content is None:
+                    continue
+                remaining: float | None = (
+                    None if deadline is None else deadline - time.monotonic()
+                )
+                if not self._not_full.wait_for(self._has_space, remaining):
+                    break
+                self._queue.enqueue(content)
+                self._not_empty.notify()
+                count += 1
+        return count
+
+    def get(self, timeout: float | None = None) -> _T | None:
+        """Das erste Objekt wird aus der Schlange entfernt und zurückgegeben. Ist die
+        Schlange leer, wird höchstens `timeout` Sekunden auf ein Objekt gewartet.
+        Ist die Wartezeit abgelaufen, wird `None` zurückgegeben.
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._has_contents, timeout):
+                return None
+            content: _T | None = self._queue.front
+            self._queue.dequeue()
+            self._not_full.notify()
+            return content
+
+    def get_batch(self, max_items: int, timeout: float | None = None) -> List[_T]:
+        """Die ersten höchstens `max_items` Objekte werden aus der Schlange entfernt
+        und in ihrer Reihenfolge als neue Liste vom Typ `List[_T]` geliefert.
+
+        Ist die Schlange leer, wird höchstens `timeout` Sekunden auf das erste
+        Objekt gewartet; auf weitere Objekte wird nicht gewartet. Ist die Wartezeit
+        abgelaufen oder `max_items` kleiner als 1, wird eine leere Liste geliefert.
+        """
+        with self._not_empty:
+            if max_items > 0:
+                self._not_empty.wait_for(self._has_contents, timeout)
+            batch: List[_T] = self._queue.dequeue_many(max(max_items, 0))
+            if not batch.is_empty:
+                self._not_full.notify_all()
+            return batch
+
+    def _has_contents(self) -> bool:
+        return not self._queue.is_empty
+
+    def _has_space(self) -> bool:
+        return not self._is_full()
+
+    def _is_full(self) -> bool:
+        return 0 < self._maxsize <= len(self._queue)
@@ -0,0 +1,337 @@
+"""Implementation der generischen Klasse `ChunkedList[_T]`."""
+
+from __future__ import annotations
+
+__all__: Final[list[str]] = ["ChunkedList"]
+
+from io import StringIO
+from typing import TYPE_CHECKING, Final, Generic, TypeVar
+
+from nrw.datastructures._utils import write_linked_contents
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from _typeshed import SupportsWrite
+
+_T = TypeVar("_T")
+
+_DEFAULT_CHUNK_SIZE: Final[int] = 64
+
+
+class _ListChunk(Generic[_T]):
+    __slots__: Final[tuple[str, str, str]] = (
+        "_contents",
+        "_next_chunk",
+        "_previous_chunk",
+    )
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, contents: list[_T]) -> None:
+        """Ein neues Objekt vom Typ `_ListChunk[_T]` wird erschaffen.
+        Die Inhalte werden per Parameter gesetzt. Die Verweise sind leer.
+        """
+        self._contents: list[_T] = contents
+        self._next_chunk: _ListChunk[_T] | None = None
+        self._previous_chunk: _ListChunk[_T] | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(contents={self._contents!r})"
+
+
+class ChunkedList(Generic[_T]):
+    """Objekte der generischen Klasse `ChunkedList` verhalten sich wie Objekte der
+    Klasse `List`, d. h., sie verwalten beliebig viele linear angeordnete Objekte,
+    auf die über ein aktuelles Objekt zugegriffen werden kann.
+
+    Intern werden die Objekte jedoch nicht in einzelnen Knoten, sondern in
+    verketteten Blöcken (*unrolled linked list*) von höchstens `chunk_size`
+    Objekten gespeichert. Dadurch werden deutlich weniger Objekte erzeugt und
+    das Durchlaufen der Liste ist schneller.
+    """
+
+    __slots__: Final[tuple[str, str, str, str, str, str]] = (
+        "_chunk_size",
+        "_current_chunk",
+        "_current_index",
+        "_first",
+        "_last",
+        "_length",
+    )
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, chunk_size: int = _DEFAULT_CHUNK_SIZE) -> None:
+        """Eine leere Liste wird erzeugt, deren Blöcke höchstens `chunk_size`
+        Objekte enthalten. Ist `chunk_size` kleiner als 2, wird 2 verwendet.
+        """
+        self._chunk_size: int = max(chunk_size, 2)
+        self._first: _ListChunk[_T] | None = None
+        self._last: _ListChunk[_T] | None = None
+        self._current_chunk: _ListChunk[_T] | None = None
+        self._current_index: int = 0
+        self._length: int = 0
+
+    def __repr__(self) -> str:
+        chunks: list[_ListChunk[_T]] = []
+        chunk: _ListChunk[_T] | None = self._first
+        while chunk is not None:
+            chunks.append(chunk)
+            chunk = chunk._next_chunk
+        return (
+            f"{self.__class__.__name__}(chunk_size={self._chunk_size!r}, "
+            f"chunks={chunks!r}, current={self.content!r})"
+        )
+
+    def __str__(self) -> str:
+        return self.to_str()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None:
+        """Die Darstellung der Liste wird schrittweise in `file` geschrieben.
+
+        Ist `limit` nicht `None`, werden nur die ersten und letzten `limit` Objekte
+        sowie die Anzahl aller Objekte geschrieben, sodass der Aufwand nur von
+        `limit` abhängt.
+        """
+        write_linked_contents(
+            file,
+            self.__class__.__name__,
+            self,
+            limit=limit,
+            reversed_contents=reversed(self),
+        )
+
+    def to_str(self, limit: int | None = None) -> str:
+        """Die Anfrage liefert die Darstellung der Liste wie `write` als
+        Zeichenkette.
+        """
+        with StringIO() as buffer:
+            self.write(buffer, limit)
+            return buffer.getvalue()
+
+    def __iter__(self) -> Iterator[_T]:
+        chunk: _ListChunk[_T] | None = self._first
+        while chunk is not None:
+            yield from chunk._contents
+            chunk = chunk._next_chunk
+
+    def __reversed__(self) -> Iterator[_T]:
+        chunk: _ListChunk[_T] | None = self._last
+        while chunk is not None:
+            yield from reversed(chunk._contents)
+            chunk = chunk._previous_chunk
+
+    def __contains__(self, content: object) -> bool:
+        chunk: _ListChunk[_T] | None = self._first
+        while chunk is not None:
+            if content in chunk._contents:
+                return True
+            chunk = chunk._next_chunk
+        return False
+
+    @property
+    def chunk_size(self) -> int:
+        """Die Anfrage liefert die maximale Anzahl an Objekten pro Block."""
+        return self._chunk_size
+
+    @property
+    def is_empty(self) -> bool:
+        """Die Anfrage liefert den Wert `True`, wenn die Liste keine Objekte enthält,
+        sonst liefert sie den Wert `False`.
+        """
+        return self._first is None
+
+    @property
+    def has_access(self) -> bool:
+        """Die Anfrage liefert den Wert `True`, wenn es ein aktuelles Objekt gibt,
+        sonst liefert sie den Wert `False`.
+        """
+        return self._current_chunk is not None
+
+    def next(self) -> None:
+        """Falls die Liste nicht leer ist, es ein aktuelles Objekt gibt und dieses
+        nicht das letzte Objekt der Liste ist, wird das dem aktuellen Objekt in
+        der Liste folgende Objekt zum aktuellen Objekt, andernfalls gibt es nach
+        Ausführung des Auftrags kein aktuelles Objekt, d. h. `has_access` liefert
+        den Wert `False`.
+        """
+        if not self.has_access:
+            return
+
+        self._current_index += 1
+        if self._current_index == len(self._current_chunk._contents):
+            self._current_chunk = self._current_chunk._next_chunk
+            self._current_index = 0
+
+    def to_first(self) -> None:
+        """Falls die Liste nicht leer ist, wird das erste Objekt der Liste aktuelles
+        Objekt. Ist die Liste leer, geschieht nichts.
+        """
+        if self.is_empty:
+            return
+        self._current_chunk, self._current_index = self._first, 0
+
+    def to_last(self) -> None:
+        """Falls die Liste nicht leer ist, wird das letzte Objekt der Liste
+        aktuelles Objekt. Ist die Liste leer, geschieht nichts.
+        """
+        if self.is_empty:
+            return
+        self._current_chunk = self._last
+        self._current_index = len(self._last._contents) - 1
+
+    @property
+    def content(self) -> _T | None:
+        """Falls es ein aktuelles Objekt gibt (`has_access is True`), wird das
+        aktuelle Objekt zurückgegeben, andernfalls (`has_access is False`) gibt
+        die Anfrage den Wert `None` zurück.
+        """
+        if not self.has_access:
+            return None
+        return self._current_chunk._contents[self._current_index]
+
+    @content.setter
+    def content(self, new_content: _T | None) -> None:
+        if new_content is None or not self.has_access:
+            return
+        self._current_chunk._contents[self._current_index] = new_content
+
+    def insert(self, content: _T | None) -> None:
+        """Falls es ein aktuelles Objekt gibt (`has_access is True`), wird ein neues
+        Objekt vor dem aktuellen Objekt in die Liste eingefügt. Das aktuelle
+        Objekt bleibt unverändert.
+
+        Wenn die Liste leer ist, wird `content` in die Liste eingefügt und es
+        gibt weiterhin kein aktuelles Objekt (`has_access is False`).
+
+        Falls es kein aktuelles Objekt gibt (`has_access is False`) und die Liste
+        nicht leer ist oder `content` `None` ist, geschieht nichts.
+        """
+        if content is None:
+            return
+
+        if self.has_access:
+            chunk: _ListChunk[_T] | None = self._current_chunk
+            assert chunk is not None
+            chunk._contents.insert(self._current_index, content)
+            self._current_index += 1
+            self._length += 1
+            if len(chunk._contents) > self._chunk_size:
+                self._split_chunk(chunk)
+        elif self.is_empty:
+            self._first = self._last = _ListChunk([content])
+            self._length = 1
+
+    def append(self, content: _T | None) -> None:
+        """Falls `content` `None` ist, geschieht nichts.
+
+        Ansonsten wird ein neues Objekt `content` am Ende der Liste eingefügt.
+        Das aktuelle Objekt bleibt unverändert.
+
+        Wenn die Liste leer ist, wird das Objekt `content` in die Liste eingefügt
+        und es gibt weiterhin kein aktuelles Objekt (`has_access is False`).
+        """
+        if content is None:
+            return
+
+        if self.is_empty:
+            self._first = self._last = _ListChunk([content])
+        elif len(self._last._contents) < self._chunk_size:
+            self._last._contents.append(content)
+        else:
+            new_chunk: _ListChunk[_T] = _ListChunk([content])
+            new_chunk._previous_chunk = self._last
+            self._last._next_chunk = self._last = new_chunk
+        self._length += 1
+
+    def concat(self, other_list: ChunkedList[_T] | None) -> None:
+        """Falls es sich bei der Liste und `other_list` um dasselbe Objekt handelt,
+        `other_list` `None` oder eine leere Liste ist, geschieht nichts.
+
+        Ansonsten wird die Liste `other_list` an die aktuelle Liste angehängt.
+        Anschliessend wird `other_list` eine leere Liste. Das aktuelle Objekt bleibt
+        unverändert. Insbesondere bleibt `has_access` identisch.
+        """
+        if other_list is self or other_list is None or other_list.is_empty:
+            return
+
+        if self.is_empty:
+            self._first, self._last = other_list._first, other_list._last
+        else:
+            other_list._first._previous_chunk = self._last
+            self._last._next_chunk, self._last = other_list._first, other_list._last
+        self._length += other_list._length
+
+        other_list._first = other_list._last = other_list._current_chunk = None
+        other_list._current_index = other_list._length = 0
+
+    def remove(self) -> None:
+        """Wenn die Liste leer ist oder es kein aktuelles Objekt gibt (`has_access
+        is False`), geschieht nichts.
+
+        Falls es ein aktuelles Objekt gibt (`has_access is True`), wird das
+        aktuelle Objekt gelöscht und das Objekt hinter dem gelöschten Objekt
+        wird zum aktuellen Objekt.
+
+        Wird das Objekt, das am Ende der Liste steht, gelöscht, gibt es kein
+        aktuelles Objekt mehr.
+        """
+        if not self.has_access or self.is_empty:
+            return
+
+        chunk: _ListChunk[_T] | None = self._current_chunk
+        assert chunk is not None
+        del chunk._contents[self._current_index]
+        self._length -= 1
+
+        if not chunk._contents:
+            self._current_chunk, self._current_index = chunk._next_chunk, 0
+            self._unlink_chunk(chunk)
+            return
+
+        following: _ListChunk[_T] | None = chunk._next_chunk
+        if (
+            following is not None
+            and len(chunk._contents) + len(following._contents) <= self._chunk_size // 2
+        ):
+            chunk._contents.extend(following._contents)
+            self._unlink_chunk(following)
+
+        if self._current_index == len(chunk._contents):
+            self._current_chunk, self._current_index = chunk._next_chunk, 0
+
+    def _split_chunk(self, chunk: _ListChunk[_T]) -> None:
+        """Teilt den Block `chunk` in zwei Hälften, wobei das aktuelle Objekt
+        erhalten bleibt.
+        """
+        half: int = len(chunk._contents) // 2
+        new_chunk: _ListChunk[_T] = _ListChunk(chunk._contents[half:])
+        del chunk._contents[half:]
+
+        new_chunk._previous_chunk, new_chunk._next_chunk = chunk, chunk._next_chunk
+        if chunk._next_chunk is not None:
+            chunk._next_chunk._previous_chunk = new_chunk
+        else:
+            self._last = new_chunk
+        chunk._next_chunk = new_chunk
+
+        if self._current_chunk is chunk and self._current_index >= half:
+            self._current_chunk = new_chunk
+            self._current_index -= half
+
+    def _unlink_chunk(self, chunk: _ListChunk[_T]) -> None:
+        """Entfernt den Block `chunk` aus der Verkettung der Blöcke."""
+        previous: _ListChunk[_T] | None = chunk._previous_chunk
+        following: _ListChunk[_T] | None = chunk._next_chunk
+
+        if previous is not None:
+            previous._next_chunk = following
+        else:
+            self._first = following
+
+        if following is not None:
+            following._previous_chunk = previous
+        else:
+            self._last = previous
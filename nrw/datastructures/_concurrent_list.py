@@ -0,0 +1,174 @@
+"""Implementation der generischen Klasse `ConcurrentList[_T]`."""
+
+from __future__ import annotations
+
+__all__: Final[list[str]] = ["ConcurrentList"]
+
+import threading
+from io import StringIO
+from typing import TYPE_CHECKING, Final, Generic, TypeVar
+
+from nrw.datastructures._list import List
+from nrw.datastructures._utils import write_linked_contents
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from _typeshed import SupportsWrite
+
+_T = TypeVar("_T")
+
+
+class ConcurrentList(Generic[_T]):
+    """Objekte der generischen Klasse `ConcurrentList` verwalten beliebig viele
+    linear angeordnete Objekte und können gefahrlos von mehreren Threads
+    gleichzeitig verwendet werden.
+
+    Die Objekte werden als unveränderliche Momentaufnahme (`tuple`) gespeichert,
+    die bei jeder Änderung unter einer Sperre ersetzt wird (*copy-on-write*).
+    Lesende Zugriffe (`snapshot`, Iteration, `find`, `len`, `in`) benötigen daher
+    keine Sperre und werden von gleichzeitigen Änderungen nicht beeinflusst; sie
+    sehen stets einen vollständigen Zustand der Liste. Schreibende Zugriffe haben
+    dafür eine lineare Laufzeit, weshalb sich die Liste für Daten eignet, die
+    häufig gelesen und selten verändert werden.
+
+    Da ein gemeinsames aktuelles Objekt nicht sicher von mehreren Threads
+    verwendet werden kann, bietet die Liste keinen Cursor an. Über `to_list` kann
+    eine `List` mit den Objekten der aktuellen Momentaufnahme erzeugt werden.
+    """
+
+    __slots__: Final[tuple[str, str]] = ("_lock", "_snapshot")
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self) -> None:
+        """Eine leere Liste wird erzeugt."""
+        self._lock: threading.Lock = threading.Lock()
+        self._snapshot: tuple[_T, ...] = ()
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[_T | None]) -> ConcurrentList[_T]:
+        """Eine neue Liste wird erzeugt, die alle Objekte aus `iterable` in deren
+        Reihenfolge enthält. `None` wird dabei übersprungen.
+        """
+        lst: ConcurrentList[_T] = cls()
+        lst.extend(iterable)
+        return lst
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._snapshot)!r})"
+
+    def __str__(self) -> str:
+        return self.to_str()
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None:
+        """Die Darstellung der Liste wird schrittweise in `file` geschrieben.
+
+        Ist `limit` nicht `None`, werden nur die ersten und letzten `limit` Objekte
+        sowie die Anzahl aller Objekte geschrieben, sodass der Aufwand nur von
+        `limit` abhängt.
+        """
+        snapshot: tuple[_T, ...] = self._snapshot
+        write_linked_contents(
+            file,
+            self.__class__.__name__,
+            snapshot,
+            limit=limit,
+            reversed_contents=reversed(snapshot),
+        )
+
+    def to_str(self, limit: int | None = None) -> str:
+        """Die Anfrage liefert die Darstellung der Liste wie `write` als
+        Zeichenkette.
+        """
+        with StringIO() as buffer:
+            self.write(buffer, limit)
+            return buffer.getvalue()
+
+    def __iter__(self) -> Iterator[_T]:
+        return iter(self._snapshot)
+
+    def __reversed__(self) -> Iterator[_T]:
+        return reversed(self._snapshot)
+
+    def __contains__(self, content: object) -> bool:
+        return content in self._snapshot
+
+    @property
+    def is_empty(self) -> bool:
+        """Die Anfrage liefert den Wert `True`, wenn die Liste keine Objekte enthält,
+        sonst liefert sie den Wert `False`.
+        """
+        return not self._snapshot
+
+    def snapshot(self) -> tuple[_T, ...]:
+        """Die Anfrage liefert eine unveränderliche Momentaufnahme aller Objekte der
+        Liste. Die Anfrage hat eine konstante Laufzeit.
+        """
+        return self._snapshot
+
+    def to_list(self) -> List[_T]:
+        """Die Anfrage liefert eine neue `List` mit allen Objekten der aktuellen
+        Momentaufnahme.
+        """
+        return List.from_iterable(self._snapshot)
+
+    def find(self, predicate: Callable[[_T], bool]) -> _T | None:
+        """Die Anfrage liefert das erste Objekt der Liste, für das `predicate` den
+        Wert `True` liefert. Gibt es kein solches Objekt, wird `None`
+        zurückgegeben.
+        """
+        for content in self._snapshot:
+            if predicate(content):
+                return content
+        return None
+
+    def append(self, content: _T | None) -> None:
+        """Falls `content` `None` ist, geschieht nichts. Ansonsten wird `content` am
+        Ende der Liste eingefügt.
+        """
+        if content is None:
+            return
+        with self._lock:
+            self._snapshot = (*self._snapshot, content)
+
+    def extend(self, iterable: Iterable[_T | None]) -> None:
+        """Alle Objekte aus `iterable` werden in deren Reihenfolge am Ende der Liste
+        eingefügt, wobei `None` übersprungen wird. Die Objekte werden gemeinsam
+        eingefügt, sodass lesende Zugriffe entweder alle oder keines sehen.
+        """
+        contents: tuple[_T, ...] = tuple(
+            content for content in iterable if content is not None
+        )
+        if not contents:
+            return
+        with self._lock:
+            self._snapshot += contents
+
+    def remove(self, content: _T | None) -> bool:
+        """Das erste Objekt der Liste, das mit `content` identisch ist (`is`), wird
+        aus der Liste gelöscht. Die Anfrage liefert den Wert `True`, wenn ein
+        Objekt gelöscht wurde, sonst liefert sie den Wert `False`.
+        """
+        if content is None:
+            return False
+        with self._lock:
+            for index, element in enumerate(self._snapshot):
+                if element is content:
+                    self._snapshot = (
+                        self._snapshot[:index] + self._snapshot[index + 1 :]
+                    )
+                    return True
+        return False
+
+    def clear(self) -> tuple[_T, ...]:
+        """Alle Objekte werden aus der Liste gelöscht. Die Anfrage liefert die
+        gelöschten Objekte, sodass diese ohne weitere Sperre verarbeitet werden
+        können.
+        """
+        with self._lock:
+            snapshot: tuple[_T, ...] = self._snapshot
+            self._snapshot = ()
+        return snapshot
@@ -0,0 +1,228 @@
+"""Implementation der generischen Klasse `Deque[_T]`."""
+
+from __future__ import annotations
+
+__all__: Final[list[str]] = ["Deque"]
+
+from io import StringIO
+from typing import TYPE_CHECKING, Final, Generic, TypeVar
+
+from nrw.datastructures._utils import write_linked_contents
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from _typeshed import SupportsWrite
+
+_T = TypeVar("_T")
+
+_BLOCK_SIZE: Final[int] = 64
+
+
+class _DequeBlock(Generic[_T]):
+    __slots__: Final[tuple[str, str, str]] = (
+        "_contents",
+        "_next_block",
+        "_previous_block",
+    )
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self) -> None:
+        """Ein neues Objekt vom Typ `_DequeBlock[_T]` wird erschaffen.
+        Alle Plätze des Blocks und die Verweise sind leer.
+        """
+        self._contents: list[_T | None] = [None] * _BLOCK_SIZE
+        self._next_block: _DequeBlock[_T] | None = None
+        self._previous_block: _DequeBlock[_T] | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(contents={self._contents!r})"
+
+
+class Deque(Generic[_T]):
+    """Objekte der generischen Klasse `Deque` (Doppelschlange) verwalten beliebige
+    Objekte so, dass an beiden Enden Objekte angehängt und entnommen werden
+    können. Alle Methoden haben eine konstante Laufzeit, unabhängig von der Anzahl
+    der verwalteten Objekte.
+
+    Die Objekte werden in verketteten Blöcken von jeweils 64 Plätzen gespeichert,
+    sodass nur beim Überschreiten einer Blockgrenze ein neues Objekt erzeugt
+    wird.
+    """
+
+    __slots__: Final[tuple[str, str, str, str, str]] = (
+        "_first_block",
+        "_first_index",
+        "_last_block",
+        "_last_index",
+        "_length",
+    )
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self) -> None:
+        """Eine leere Doppelschlange wird erzeugt."""
+        block: _DequeBlock[_T] = _DequeBlock()
+        self._first_block: _DequeBlock[_T] = block
+        self._last_block: _DequeBlock[_T] = block
+        self._first_index: int = _BLOCK_SIZE // 2
+        self._last_index: int = self._first_index - 1
+        self._length: int = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+    def __str__(self) -> str:
+        return self.to_str()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None:
+        """Die Darstellung der Doppelschlange wird schrittweise in `file`
+        geschrieben.
+
+        Ist `limit` nicht `None`, werden nur die ersten und letzten `limit` Objekte
+        sowie die Anzahl aller Objekte geschrieben, sodass der Aufwand nur von
+        `limit` abhängt.
+        """
+        write_linked_contents(
+            file,
+            self.__class__.__name__,
+            self,
+            limit=limit,
+            reversed_contents=reversed(self),
+        )
+
+    def to_str(self, limit: int | None = None) -> str:
+        """Die Anfrage liefert die Darstellung der Doppelschlange wie `write` als
+        Zeichenkette.
+        """
+        with StringIO() as buffer:
+            self.write(buffer, limit)
+            return buffer.getvalue()
+
+    def __iter__(self) -> Iterator[_T]:
+        block: _DequeBlock[_T] | None = self._first_block
+        index: int = self._first_index
+        for _ in range(self._length):
+            if index == _BLOCK_SIZE:
+                block, index = block._next_block, 0
+            yield block._contents[index]  # type: ignore[misc]
+            index += 1
+
+    def __reversed__(self) -> Iterator[_T]:
+        block: _DequeBlock[_T] | None = self._last_block
+        index: int = self._last_index
+        for _ in range(self._length):
+            if index < 0:
+                block, index = block._previous_block, _BLOCK_SIZE - 1
+            yield block._contents[index]  # type: ignore[misc]
+            index -= 1
+
+    def __contains__(self, content: object) -> bool:
+        return any(element is content or element == content for element in self)
+
+    @property
+    def is_empty(self) -> bool:
+        """Die Anfrage liefert den Wert `True`, wenn die Doppelschlange keine Objekte
+        enthält, sonst liefert sie den Wert `False`.
+        """
+        return self._length == 0
+
+    @property
+    def front(self) -> _T | None:
+        """Die Anfrage liefert das erste Objekt der Doppelschlange. Die
+        Doppelschlange bleibt unverändert. Falls sie leer ist, wird `None`
+        zurückgegeben.
+        """
+        if self.is_empty:
+            return None
+        return self._first_block._contents[self._first_index]
+
+    @property
+    def back(self) -> _T | None:
+        """Die Anfrage liefert das letzte Objekt der Doppelschlange. Die
+        Doppelschlange bleibt unverändert. Falls sie leer ist, wird `None`
+        zurückgegeben.
+        """
+        if self.is_empty:
+            return None
+        return self._last_block._contents[self._last_index]
+
+    def push_front(self, content: _T | None) -> None:
+        """Das Objekt `content` wird vorne an die Doppelschlange angehängt.
+        Falls `content` `None` ist, bleibt die Doppelschlange unverändert.
+        """
+        if content is None:
+            return
+
+        if self._first_index == 0:
+            block: _DequeBlock[_T] = _DequeBlock()
+            block._next_block = self._first_block
+            self._first_block._previous_block = self._first_block = block
+            self._first_index = _BLOCK_SIZE
+        self._first_index -= 1
+        self._first_block._contents[self._first_index] = content
+        self._length += 1
+
+    def push_back(self, content: _T | None) -> None:
+        """Das Objekt `content` wird hinten an die Doppelschlange angehängt.
+        Falls `content` `None` ist, bleibt die Doppelschlange unverändert.
+        """
+        if content is None:
+            return
+
+        if self._last_index == _BLOCK_SIZE - 1:
+            block: _DequeBlock[_T] = _DequeBlock()
+            block._previous_block = self._last_block
+            self._last_block._next_block = self._last_block = block
+            self._last_index = -1
+        self._last_index += 1
+        self._last_block._contents[self._last_index] = content
+        self._length += 1
+
+    def pop_front(self) -> None:
+        """Das erste Objekt wird aus der Doppelschlange entfernt.
+        Falls die Doppelschlange leer ist, wird sie nicht verändert.
+        """
+        if self.is_empty:
+            return
+
+        self._first_block._contents[self._first_index] = None
+        self._first_index += 1
+        self._length -= 1
+        if self.is_empty:
+            self._recenter()
+        elif self._first_index == _BLOCK_SIZE:
+            next_block: _DequeBlock[_T] | None = self._first_block._next_block
+            assert next_block is not None
+            next_block._previous_block = None
+            self._first_block, self._first_index = next_block, 0
+
+    def pop_back(self) -> None:
+        """Das letzte Objekt wird aus der Doppelschlange entfernt.
+        Falls die Doppelschlange leer ist, wird sie nicht verändert.
+        """
+        if self.is_empty:
+            return
+
+        self._last_block._contents[self._last_index] = None
+        self._last_index -= 1
+        self._length -= 1
+        if self.is_empty:
+            self._recenter()
+        elif self._last_index < 0:
+            previous_block: _DequeBlock[_T] | None = self._last_block._previous_block
+            assert previous_block is not None
+            previous_block._next_block = None
+            self._last_block, self._last_index = previous_block, _BLOCK_SIZE - 1
+
+    def _recenter(self) -> None:
+        """Setzt eine leere Doppelschlange auf die Mitte ihres ersten Blocks zurück,
+        damit an beiden Enden Platz ist.
+        """
+        block: _DequeBlock[_T] = self._first_block
+        block._next_block = block._previous_block = None
+        self._last_block = block
+        self._first_index = _BLOCK_SIZE // 2
+        self._last_index = self._first_index - 1
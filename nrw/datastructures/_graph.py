@@ -49,48 +49,38 @@ class Graph:
 
         with StringIO() as buffer:
             buffer.write(f"{self.__class__.__name__}(")
-            self._vertices.to_first()
-            while self._vertices.has_access:
-                current: Vertex | None = self._vertices.content
-                assert current is not None
-                buffer.write(f"{current} -> {self.get_neighbours(current)}, ")
-                self._vertices.next()
+            for vertex in self._vertices:
+                buffer.write(f"{vertex} -> {self.get_neighbours(vertex)}, ")
             return f"{buffer.getvalue().rstrip(', ')})"
 
     @property
     def vertices(self) -> List[Vertex]:
         """Die Anfrage liefert eine neue Liste aller Knotenobjekte
         vom Typ `List[Vertex]`.
+        Die Liste teilt sich ihre Knoten mit dem Graphen, sodass die Anfrage
+        eine konstante Laufzeit hat. Kopiert wird erst, wenn die Liste oder
+        der Graph verändert wird.
         """
-        result: List[Vertex] = List()
-        self._vertices.to_first()
-        while self._vertices.has_access:
-            result.append(self._vertices.content)
-            self._vertices.next()
-        return result
+        return self._vertices._share()
 
     @property
     def edges(self) -> List[Edge]:
         """Die Anfrage liefert eine neue Liste aller Kantenobjekte
         vom Typ `List[Edge]`.
+        Die Liste teilt sich ihre Knoten mit dem Graphen, sodass die Anfrage
+        eine konstante Laufzeit hat. Kopiert wird erst, wenn die Liste oder
+        der Graph verändert wird.
         """
-        result: List[Edge] = List()
-        self._edges.to_first()
-        while self._edges.has_access:
-            result.append(self._edges.content)
-            self._edges.next()
-        return result
+        return self._edges._share()
 
     def get_vertex(self, id_: str) -> Vertex | None:
         """Die Anfrage liefert das Knotenobjekt mit `id_` als ID.
         Ist ein solchen Knotenobjekt nicht im Graphen enthalten,
         wird `None` zurückgeliefert.
         """
-        self._vertices.to_first()
-        while self._vertices.has_access:
-            if self._vertices.content.id == id_:
-                return self._vertices.content
-            self._vertices.next()
+        for vertex in self._vertices:
+            if vertex.id == id_:
+                return vertex
         return None
 
     def add_vertex(self, vertex: Vertex | None) -> None:
@@ -102,11 +92,9 @@ class Graph:
         if vertex is None or vertex.id is None:
             return
 
-        self._vertices.to_first()
-        while self._vertices.has_access:
-            if self._vertices.content.id == vertex.id:
+        for current in self._vertices:
+            if current.id == vertex.id:
                 return
-            self._vertices.next()
 
         self._vertices.append(vertex)
 
@@ -136,14 +124,12 @@ class Graph:
         im Graphen enthalten oder gibt es keine Kante, die beide Knoten verbindet,
         so wird `None` zurückgeliefert.
         """
-        self._edges.to_first()
-        while self._edges.has_access:
-            vertex1, vertex2 = self._edges.content.vertices
+        for edge in self._edges:
+            vertex1, vertex2 = edge.vertices
             if (vertex1 is vertex and vertex2 is another_vertex) or (
                 vertex1 is another_vertex and vertex2 is vertex
             ):
-                return self._edges.content
-            self._edges.next()
+                return edge
         return None
 
     def add_edge(self, edge: Edge | None) -> None:
@@ -180,39 +166,25 @@ class Graph:
 
     def set_all_vertex_marks(self, mark: bool) -> None:
         """Der Auftrag setzt die Markierungen aller Knoten des Graphen auf `mark`."""
-        self._vertices.to_first()
-        while self._vertices.has_access:
-            self._vertices.content.mark = mark
-            self._vertices.next()
+        for vertex in self._vertices:
+            vertex.mark = mark
 
     def all_vertices_marked(self) -> bool:
         """Die Anfrage liefert `True`,
         wenn alle Knoten des Graphen mit `True` markiert sind, ansonsten `False`.
         """
-        self._vertices.to_first()
-        while self._vertices.has_access:
-            if not self._vertices.content.is_marked:
-                return False
-            self._vertices.next()
-        return True
+        return all(vertex.is_marked for vertex in self._vertices)
 
     def set_all_edge_marks(self, mark: bool) -> None:
         """Der Auftrag setzt die Markierungen aller Kanten des Graphen auf `mark`."""
-        self._edges.to_first()
-        while self._edges.has_access:
-            self._edges.content.mark = mark
-            self._edges.next()
+        for edge in self._edges:
+            edge.mark = mark
 
     def all_edges_marked(self) -> bool:
         """Die Anfrage liefert `True`,
         wenn alle Kanten des Graphen mit `True` markiert sind, ansonsten `False`.
         """
-        self._edges.to_first()
-        while self._edges.has_access:
-            if not self._edges.content.mark:
-                return False
-            self._edges.next()
-        return True
+        return all(edge.mark for edge in self._edges)
 
     def get_neighbours(self, vertex: Vertex) -> List[Vertex]:
         """Die Anfrage liefert alle Nachbarn des Knotens `vertex`
@@ -223,14 +195,12 @@ class Graph:
         """
         result: List[Vertex] = List()
 
-        self._edges.to_first()
-        while self._edges.has_access:
-            vertex1, vertex2 = self._edges.content.vertices
+        for edge in self._edges:
+            vertex1, vertex2 = edge.vertices
             if vertex is vertex1:
                 result.append(vertex2)
             elif vertex is vertex2:
                 result.append(vertex1)
-            self._edges.next()
         return result
 
     def get_edges(self, vertex: Vertex) -> List[Edge]:
@@ -240,14 +210,9 @@ class Graph:
         oder ist gar nicht in diesem Graphen enthalten,
         so wird eine leere Liste zurückgeliefert.
         """
-        result: List[Edge] = List()
-
-        self._edges.to_first()
-        while self._edges.has_access:
-            if vertex in self._edges.content.vertices:
-                result.append(self._edges.content)
-            self._edges.next()
-        return result
+        return List.from_iterable(
+            edge for edge in self._edges if vertex in edge.vertices
+        )
 
     @property
     def is_empty(self) -> bool:
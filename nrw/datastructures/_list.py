@@ -2,30 +2,46 @@
 
 from __future__ import annotations
 
-__all__: Final[list[str]] = ["List"]
+__all__: Final[list[str]] = ["List", "ListCursor"]
 
 from io import StringIO
-from typing import Final, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Final, Generic, TypeVar
+
+from nrw.datastructures._node_pool import NodePool
+from nrw.datastructures._typed_list import TypedList
+from nrw.datastructures._utils import display_linked_node, write_linked_contents
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from _typeshed import SupportsWrite
 
 _T = TypeVar("_T")
 
 
 class _ListNode(Generic[_T]):
-    __slots__: Final[tuple[str, str]] = ("_content", "_next_node")
+    __slots__: Final[tuple[str, str, str]] = (
+        "_content",
+        "_next_node",
+        "_previous_node",
+    )
     __hash__ = None  # type: ignore[assignment]
 
     def __init__(self, content: _T) -> None:
         """Ein neues Objekt vom Typ `_ListNode[_T]` wird erschaffen.
-        Der Inhalt wird per Parameter gesetzt. Der Verweis ist leer.
+        Der Inhalt wird per Parameter gesetzt. Die Verweise sind leer.
         """
         self._content: _T = content
         self._next_node: _ListNode[_T] | None = None
+        self._previous_node: _ListNode[_T] | None = None
 
     def __repr__(self) -> str:
-        return (
-            f"{self.__class__.__name__}(content={self._content!r}, "
-            f"next_node={self._next_node!r})"
-        )
+        return display_linked_node(self)
+
+    def _clear(self) -> None:
+        """Entfernt den Inhalt und die Verweise des Knotens."""
+        self._content = None  # type: ignore[assignment]
+        self._next_node = self._previous_node = None
 
     @property
     def content(self) -> _T:
@@ -45,6 +61,15 @@ class _ListNode(Generic[_T]):
     def next_node(self, new_next_node: _ListNode[_T] | None) -> None:
         self._next_node = new_next_node
 
+    @property
+    def previous_node(self) -> _ListNode[_T] | None:
+        """Liefert das vorherige Element des aktuellen Knotens."""
+        return self._previous_node
+
+    @previous_node.setter
+    def previous_node(self, new_previous_node: _ListNode[_T] | None) -> None:
+        self._previous_node = new_previous_node
+
 
 class List(Generic[_T]):
     """Objekt der generischen Klasse `List` verwalten beliebig viele linear
@@ -59,16 +84,57 @@ class List(Generic[_T]):
     folgende Listenobjekt zum neuen aktuellen Objekt werden.
     Das aktuelle Objekt kann gelesen, verändert oder gelöscht werden. Außerdem
     kann vor dem aktuellen Objekt ein Listenobjekt eingefügt werden.
+
+    Die Liste kennt ihre Länge (`len`); nur nach `split_at_current` wird sie bei
+    der nächsten Anfrage einmalig neu gezählt. Über `to_index` kann ein Objekt
+    anhand seiner Position zum aktuellen Objekt gemacht werden. Dafür wird bei Bedarf
+    eine Positionstabelle aufgebaut, die bis zur nächsten strukturellen Änderung
+    der Liste gültig bleibt.
+
+    Gelöschte Knoten können über den gemeinsamen `node_pool` aller Listen
+    wiederverwendet werden, sobald dessen Kapazität größer als 0 ist.
+
+    Neben dem eingebauten aktuellen Objekt können über `cursor` beliebig viele
+    unabhängige Cursor (`ListCursor`) auf die Liste erzeugt werden.
     """
 
-    __slots__: Final[tuple[str, str, str]] = ("_current", "_first", "_last")
+    __slots__: Final[tuple[str, str, str, str, str, str]] = (
+        "_current",
+        "_first",
+        "_last",
+        "_length",
+        "_positions",
+        "_shared",
+    )
     __hash__ = None  # type: ignore[assignment]
 
+    node_pool: ClassVar[NodePool[Any, _ListNode[Any]]] = NodePool(_ListNode)
+
     def __init__(self) -> None:
         """Eine leere Liste wird erzeugt."""
         self._first: _ListNode[_T] | None = None
         self._last: _ListNode[_T] | None = None
         self._current: _ListNode[_T] | None = None
+        self._length: int | None = 0
+        self._positions: list[_ListNode[_T]] | None = None
+        self._shared: bool = False
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[_T | None]) -> List[_T]:
+        """Eine neue Liste wird erzeugt, die alle Objekte aus `iterable` in deren
+        Reihenfolge enthält. `None` wird dabei übersprungen. Es gibt kein aktuelles
+        Objekt (`has_access is False`).
+        """
+        lst: List[_T] = cls()
+        lst.extend(iterable)
+        return lst
+
+    @staticmethod
+    def typed(typecode: str) -> TypedList[Any]:
+        """Die Anfrage liefert eine neue, leere `TypedList`, welche Zahlen mit dem
+        Typcode `typecode` (siehe `array.array`) kompakt speichert.
+        """
+        return TypedList(typecode)
 
     def __repr__(self) -> str:
         return (
@@ -77,18 +143,60 @@ class List(Generic[_T]):
         )
 
     def __str__(self) -> str:
-        if self.is_empty:
-            return f"{self.__class__.__name__}()"
+        return self.to_str()
+
+    def __len__(self) -> int:
+        if self._length is None:
+            self._length = 0
+            node: _ListNode[_T] | None = self._first
+            while node is not None:
+                self._length += 1
+                node = node._next_node
+        return self._length
+
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None:
+        """Die Darstellung der Liste wird schrittweise in `file` geschrieben.
+
+        Ist `limit` nicht `None`, werden nur die ersten und letzten `limit` Objekte
+        sowie die Anzahl aller Objekte geschrieben, sodass der Aufwand nur von
+        `limit` abhängt.
+        """
+        write_linked_contents(
+            file,
+            self.__class__.__name__,
+            self,
+            limit=limit,
+            reversed_contents=reversed(self),
+        )
 
+    def to_str(self, limit: int | None = None) -> str:
+        """Die Anfrage liefert die Darstellung der Liste wie `write` als
+        Zeichenkette.
+        """
         with StringIO() as buffer:
-            buffer.write(f"{self.__class__.__name__}(")
-            temp: _ListNode[_T] | None = self._first
-            while temp is not self._last:
-                buffer.write(f"{temp.content} -> ")
-                temp = temp.next_node
-            buffer.write(f"{temp.content})")
+            self.write(buffer, limit)
             return buffer.getvalue()
 
+    def __iter__(self) -> Iterator[_T]:
+        node: _ListNode[_T] | None = self._first
+        while node is not None:
+            yield node._content
+            node = node._next_node
+
+    def __reversed__(self) -> Iterator[_T]:
+        node: _ListNode[_T] | None = self._last
+        while node is not None:
+            yield node._content
+            node = node._previous_node
+
+    def __contains__(self, content: object) -> bool:
+        node: _ListNode[_T] | None = self._first
+        while node is not None:
+            if node._content is content or node._content == content:
+                return True
+            node = node._next_node
+        return False
+
     @property
     def is_empty(self) -> bool:
         """Die Anfrage liefert den Wert `True`, wenn die Liste keine Objekte enthält,
@@ -130,6 +238,47 @@ class List(Generic[_T]):
             return
         self._current = self._last
 
+    def to_index(self, index: int) -> None:
+        """Falls `index` eine gültige Position der Liste ist (`0 <= index <
+        len(lst)`), wird das Objekt an dieser Position zum aktuellen Objekt,
+        andernfalls gibt es nach Ausführung des Auftrags kein aktuelles Objekt.
+
+        Der erste Aufruf nach einer strukturellen Änderung der Liste baut die
+        Positionstabelle in linearer Laufzeit neu auf; jeder weitere Aufruf hat
+        eine konstante Laufzeit. Solange die Liste nur über `append` wächst, wird
+        die Tabelle fortgeschrieben statt verworfen. Amortisiert über mehrere
+        Aufrufe ohne andere strukturelle Änderungen ist die Laufzeit somit
+        konstant.
+        """
+        if not 0 <= index < len(self):
+            self._current = None
+            return
+
+        if self._positions is None:
+            self._positions = self._build_positions()
+        self._current = self._positions[index]
+
+    def index_of(self, content: _T | None) -> int | None:
+        """Die Anfrage liefert die Position des ersten Objekts der Liste, das
+        bezüglich `==` mit `content` übereinstimmt. Ist kein solches Objekt in der
+        Liste enthalten oder ist `content` `None`, wird `None` zurückgegeben.
+        Das aktuelle Objekt bleibt unverändert.
+
+        Da die Objekte dazu verglichen werden müssen, hat die Anfrage im Gegensatz
+        zu `to_index` eine lineare Laufzeit.
+        """
+        if content is None:
+            return None
+
+        index: int = 0
+        node: _ListNode[_T] | None = self._first
+        while node is not None:
+            if node._content == content:
+                return index
+            index += 1
+            node = node._next_node
+        return None
+
     @property
     def content(self) -> _T | None:
         """Falls es ein aktuelles Objekt gibt (`has_access is True`), wird das
@@ -142,6 +291,7 @@ class List(Generic[_T]):
     def content(self, new_content: _T | None) -> None:
         if new_content is None or not self.has_access:
             return
+        self._own_nodes()
         self._current.content = new_content
 
     def insert(self, content: _T | None) -> None:
@@ -158,18 +308,14 @@ class List(Generic[_T]):
         if content is None:
             return
 
-        new_node: _ListNode[_T] = _ListNode(content)
-        if self.has_access:
-            if self._current is not self._first:
-                previous: _ListNode[_T] | None = self._get_previous(
-                    self._current,
-                )
-                assert previous is not None
-                new_node.next_node, previous.next_node = previous.next_node, new_node
-            else:
-                new_node.next_node, self._first = self._first, new_node
+        self._own_nodes()
+        current: _ListNode[_T] | None = self._current
+        if current is not None:
+            self._insert_before(current, content)
         elif self.is_empty:
-            self._first = self._last = new_node
+            self._first = self._last = self.node_pool.acquire(content)
+            self._length = 1
+            self._positions = None
 
     def append(self, content: _T | None) -> None:
         """Falls `content` `None` ist, geschieht nichts.
@@ -183,11 +329,43 @@ class List(Generic[_T]):
         if content is None:
             return
 
-        new_node: _ListNode[_T] = _ListNode(content)
+        self._own_nodes()
+        self._append_node(self.node_pool.acquire(content))
+
+    def extend(self, iterable: Iterable[_T | None]) -> None:
+        """Alle Objekte aus `iterable` werden in deren Reihenfolge am Ende der Liste
+        eingefügt, wobei `None` übersprungen wird. Die neuen Knoten werden in einem
+        Durchlauf verkettet und anschliessend als Ganzes angehängt. Das aktuelle
+        Objekt bleibt unverändert.
+        """
+        acquire: Callable[[_T], _ListNode[_T]] = self.node_pool.acquire
+        first: _ListNode[_T] | None = None
+        last: _ListNode[_T] | None = None
+        count: int = 0
+        for content in iterable:
+            if content is None:
+                continue
+            new_node: _ListNode[_T] = acquire(content)
+            if last is None:
+                first = new_node
+            else:
+                new_node._previous_node = last
+                last._next_node = new_node
+            last = new_node
+            count += 1
+
+        if first is None:
+            return
+
+        self._own_nodes()
         if self.is_empty:
-            self._first = self._last = new_node
+            self._first = first
         else:
-            self._last.next_node = self._last = new_node
+            first._previous_node = self._last
+            self._last._next_node = first
+        self._last = last
+        self._add_length(count)
+        self._positions = None
 
     def concat(self, other_list: List[_T] | None) -> None:
         """Falls es sich bei der Liste und `other_list` um dasselbe Objekt handelt,
@@ -200,12 +378,97 @@ class List(Generic[_T]):
         if other_list is self or other_list is None or other_list.is_empty:
             return
 
+        self._own_nodes()
+        other_list._own_nodes()
         if self.is_empty:
             self._first, self._last = other_list._first, other_list._last
         else:
+            other_list._first.previous_node = self._last
             self._last.next_node, self._last = other_list._first, other_list._last
 
-        other_list._first = other_list._last = other_list._current = None
+        self._add_length(other_list._length)
+        self._positions = None
+        other_list._reset()
+
+    def splice(
+        self,
+        other_list: List[_T] | None,
+        *,
+        at_current: bool = False,
+    ) -> None:
+        """Falls es sich bei der Liste und `other_list` um dasselbe Objekt handelt,
+        `other_list` `None` oder eine leere Liste ist, geschieht nichts.
+
+        Ist `at_current` `True` und gibt es ein aktuelles Objekt, werden alle
+        Objekte aus `other_list` vor dem aktuellen Objekt in die Liste eingefügt,
+        andernfalls werden sie wie bei `concat` am Ende angehängt. Anschliessend
+        wird `other_list` eine leere Liste. Das aktuelle Objekt bleibt unverändert.
+
+        Die Knoten von `other_list` werden dabei nicht kopiert, sondern nur
+        umgehängt, sodass der Auftrag eine konstante Laufzeit hat.
+        """
+        if other_list is self or other_list is None or other_list.is_empty:
+            return
+
+        if not at_current or self._current is None:
+            self.concat(other_list)
+            return
+
+        self._own_nodes()
+        other_list._own_nodes()
+        current: _ListNode[_T] | None = self._current
+        assert current is not None
+        first: _ListNode[_T] | None = other_list._first
+        last: _ListNode[_T] | None = other_list._last
+        assert first is not None
+        assert last is not None
+        previous: _ListNode[_T] | None = current.previous_node
+        first.previous_node, last.next_node = previous, current
+        current.previous_node = last
+        if previous is not None:
+            previous.next_node = first
+        else:
+            self._first = first
+
+        self._add_length(other_list._length)
+        self._positions = None
+        other_list._reset()
+
+    def split_at_current(self) -> List[_T]:
+        """Falls es ein aktuelles Objekt gibt (`has_access is True`), werden das
+        aktuelle Objekt und alle ihm folgenden Objekte aus der Liste entfernt und
+        in ihrer Reihenfolge als neue Liste zurückgegeben. Anschliessend gibt es in
+        beiden Listen kein aktuelles Objekt.
+
+        Falls es kein aktuelles Objekt gibt, wird eine leere Liste zurückgegeben
+        und die Liste bleibt unverändert.
+
+        Die Knoten werden dabei nicht kopiert, sondern nur umgehängt, sodass der
+        Auftrag eine konstante Laufzeit hat. Cursor auf die abgetrennten Objekte
+        sind anschliessend ungültig.
+        """
+        tail: List[_T] = self.__class__()
+        if self._current is None:
+            return tail
+
+        self._own_nodes()
+        split: _ListNode[_T] | None = self._current
+        assert split is not None
+
+        previous: _ListNode[_T] | None = split.previous_node
+        tail._first, tail._last = split, self._last
+        split.previous_node = None
+        if previous is None:
+            tail._length = self._length
+            self._reset()
+            return tail
+
+        previous.next_node = None
+        self._last = previous
+        self._current = None
+        self._positions = None
+        self._length = tail._length = None
+        return tail
 
     def remove(self) -> None:
         """Wenn die Liste leer ist oder es kein aktuelles Objekt gibt (`has_access
@@ -221,29 +484,282 @@ class List(Generic[_T]):
         if not self.has_access or self.is_empty:
             return
 
-        if self._current is self._first:
-            self._first = self._first.next_node
+        self._own_nodes()
+        removed: _ListNode[_T] | None = self._current
+        assert removed is not None
+        self._current = self._remove_node(removed)
+
+    def cursor(self) -> ListCursor[_T]:
+        """Die Anfrage liefert einen neuen, vom aktuellen Objekt unabhängigen Cursor
+        auf die Liste, der auf dem aktuellen Objekt steht. Gibt es kein aktuelles
+        Objekt, hat auch der Cursor keinen Zugriff.
+        """
+        self._own_nodes()
+        return ListCursor(self, self._current)
+
+    def _share(self) -> List[_T]:
+        """Liefert in konstanter Laufzeit eine neue Liste mit denselben Objekten, die
+        sich die Knoten mit dieser Liste teilt. Beide Listen kopieren die Knoten erst
+        vor ihrer nächsten Veränderung (Copy-on-Write). In der neuen Liste gibt es
+        kein aktuelles Objekt; vorhandene Cursor auf diese Liste sind nach deren
+        nächster Veränderung ungültig.
+        """
+        lst: List[_T] = self.__class__()
+        lst._first, lst._last, lst._length = self._first, self._last, self._length
+        lst._shared = self._shared = True
+        return lst
+
+    def _own_nodes(self) -> None:
+        """Kopiert die Knoten einmalig, falls sie mit einer anderen Liste geteilt
+        werden, sodass sie anschliessend nur zu dieser Liste gehören. Das aktuelle
+        Objekt bleibt unverändert.
+        """
+        if not self._shared:
+            return
+
+        self._shared = False
+        current: _ListNode[_T] | None = self._current
+        node: _ListNode[_T] | None = self._first
+        self._reset()
+        while node is not None:
+            copy: _ListNode[_T] = self.node_pool.acquire(node.content)
+            self._append_node(copy)
+            if node is current:
+                self._current = copy
+            node = node.next_node
+
+    def _insert_before(self, node: _ListNode[_T], content: _T) -> None:
+        """Fügt vor dem Knoten `node` einen neuen Knoten mit dem Inhalt `content`
+        ein.
+        """
+        new_node: _ListNode[_T] = self.node_pool.acquire(content)
+        previous: _ListNode[_T] | None = node.previous_node
+        new_node.previous_node, new_node.next_node = previous, node
+        node.previous_node = new_node
+        if previous is not None:
+            previous.next_node = new_node
         else:
-            previous: _ListNode[_T] | None = self._get_previous(self._current)
-            assert previous is not None
-            if self._current is self._last:
-                self._last = previous
-            previous.next_node = self._current.next_node
+            self._first = new_node
+        self._add_length(1)
+        self._positions = None
 
-        self._current = self._current.next_node
+    def _remove_node(self, node: _ListNode[_T]) -> _ListNode[_T] | None:
+        """Entfernt den Knoten `node` aus der Liste, gibt ihn an den `node_pool`
+        zurück und liefert dessen Nachfolger.
+        """
+        following: _ListNode[_T] | None = self._unlink_node(node)
+        self.node_pool.release(node)
+        return following
 
-        if self.is_empty:
-            self._last = None
+    def _unlink_node(self, node: _ListNode[_T]) -> _ListNode[_T] | None:
+        """Hängt den Knoten `node` aus der Liste aus und liefert dessen Nachfolger.
+        Der Knoten selbst wird nicht verändert.
+        """
+        previous: _ListNode[_T] | None = node.previous_node
+        following: _ListNode[_T] | None = node.next_node
+
+        if previous is not None:
+            previous.next_node = following
+        else:
+            self._first = following
+
+        if following is not None:
+            following.previous_node = previous
+        else:
+            self._last = previous
+
+        self._add_length(-1)
+        self._positions = None
+        return following
+
+    def _append_node(self, node: _ListNode[_T]) -> None:
+        """Hängt den (ausgehängten) Knoten `node` an das Ende der Liste an."""
+        node.previous_node, node.next_node = self._last, None
+        if self._last is None:
+            self._first = node
+        else:
+            self._last.next_node = node
+        self._last = node
+        self._add_length(1)
+        if self._positions is not None:
+            self._positions.append(node)
+
+    def _add_length(self, delta: int | None) -> None:
+        """Passt die gespeicherte Länge der Liste um `delta` an. Ist die Länge oder
+        `delta` unbekannt (`None`), ist die Länge anschliessend unbekannt.
+        """
+        if self._length is None or delta is None:
+            self._length = None
+        else:
+            self._length += delta
+
+    def _reset(self) -> None:
+        """Macht die Liste zu einer leeren Liste, ohne die Knoten freizugeben."""
+        self._first = self._last = self._current = None
+        self._length = 0
+        self._positions = None
 
     def _get_previous(self, node: _ListNode[_T] | None) -> _ListNode[_T] | None:
         """Liefert den Vorgängerknoten des Knotens `node`. Ist die Liste leer, `node
-        is None`, `node` nicht in der Liste oder `node` der erste Knoten der Liste,
-        wird `None` zurückgegeben.
+        is None` oder `node` der erste Knoten der Liste, wird `None` zurückgegeben.
+
+        Da jeder Knoten seinen Vorgänger kennt, hat die Anfrage eine konstante
+        Laufzeit.
         """
         if node is None or node is self._first or self.is_empty:
             return None
+        return node.previous_node
+
+    def _build_positions(self) -> list[_ListNode[_T]]:
+        """Liefert alle Knoten der Liste in ihrer Reihenfolge."""
+        positions: list[_ListNode[_T]] = []
+        node: _ListNode[_T] | None = self._first
+        while node is not None:
+            positions.append(node)
+            node = node._next_node
+        return positions
+
+
+class ListCursor(Generic[_T]):
+    """Objekte der generischen Klasse `ListCursor` sind Cursor (Lesezeichen) auf
+    eine Liste, die unabhängig vom aktuellen Objekt der Liste positioniert werden
+    können. Sie werden über `List.cursor` erzeugt.
+
+    Wie beim aktuellen Objekt der Liste kann über einen Cursor das Objekt an
+    seiner Position gelesen, verändert oder gelöscht werden und vor dieser
+    Position ein Objekt eingefügt werden. Das Speichern (`copy`) und
+    Wiederherstellen (`make_current`) einer Position hat eine konstante
+    Laufzeit.
+
+    Wird das Objekt eines Cursors über die Liste oder einen anderen Cursor
+    gelöscht, ist der Cursor ungültig und darf nicht mehr verwendet werden, da
+    der Knoten über den `node_pool` bereits wiederverwendet worden sein kann.
+    Dasselbe gilt für alle Cursor einer Liste `other_list` nach `concat`.
+    """
+
+    __slots__: Final[tuple[str, str]] = ("_list", "_node")
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, lst: List[_T], node: _ListNode[_T] | None = None) -> None:
+        """Ein neuer Cursor auf die Liste `lst` wird erzeugt, der auf dem Knoten
+        `node` steht.
+        """
+        self._list: List[_T] = lst
+        self._node: _ListNode[_T] | None = node
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(content={self.content!r})"
+
+    @property
+    def list(self) -> List[_T]:
+        """Die Anfrage liefert die Liste, auf die der Cursor verweist."""
+        return self._list
+
+    @property
+    def has_access(self) -> bool:
+        """Die Anfrage liefert den Wert `True`, wenn der Cursor auf einem Objekt
+        steht, sonst liefert sie den Wert `False`.
+        """
+        return self._node is not None
+
+    def copy(self) -> ListCursor[_T]:
+        """Die Anfrage liefert einen neuen Cursor auf dieselbe Liste und dieselbe
+        Position.
+        """
+        return self.__class__(self._list, self._node)
+
+    def next(self) -> None:
+        """Falls der Cursor auf einem Objekt steht, das nicht das letzte Objekt der
+        Liste ist, wird er auf das folgende Objekt gesetzt, andernfalls hat der
+        Cursor anschliessend keinen Zugriff (`has_access is False`).
+        """
+        if not self.has_access:
+            return
+        self._node = self._node.next_node
+
+    def previous(self) -> None:
+        """Falls der Cursor auf einem Objekt steht, das nicht das erste Objekt der
+        Liste ist, wird er auf das vorherige Objekt gesetzt, andernfalls hat der
+        Cursor anschliessend keinen Zugriff (`has_access is False`).
+        """
+        if not self.has_access:
+            return
+        self._node = self._node.previous_node
+
+    def to_first(self) -> None:
+        """Falls die Liste nicht leer ist, wird der Cursor auf das erste Objekt der
+        Liste gesetzt. Ist die Liste leer, geschieht nichts.
+        """
+        if self._list.is_empty:
+            return
+        self._node = self._list._first
+
+    def to_last(self) -> None:
+        """Falls die Liste nicht leer ist, wird der Cursor auf das letzte Objekt der
+        Liste gesetzt. Ist die Liste leer, geschieht nichts.
+        """
+        if self._list.is_empty:
+            return
+        self._node = self._list._last
+
+    def to_current(self) -> None:
+        """Der Cursor wird auf das aktuelle Objekt der Liste gesetzt. Gibt es kein
+        aktuelles Objekt, hat der Cursor anschliessend keinen Zugriff.
+        """
+        self._node = self._list._current
+
+    def make_current(self) -> None:
+        """Das Objekt des Cursors wird zum aktuellen Objekt der Liste. Steht der
+        Cursor auf keinem Objekt, gibt es anschliessend kein aktuelles Objekt.
+        """
+        self._list._current = self._node
+
+    @property
+    def content(self) -> _T | None:
+        """Falls der Cursor auf einem Objekt steht (`has_access is True`), wird
+        dieses zurückgegeben, andernfalls gibt die Anfrage den Wert `None` zurück.
+        """
+        return self._node.content if self.has_access else None
+
+    @content.setter
+    def content(self, new_content: _T | None) -> None:
+        if new_content is None or not self.has_access:
+            return
+        self._node.content = new_content
+
+    def insert(self, content: _T | None) -> None:
+        """Falls der Cursor auf einem Objekt steht (`has_access is True`), wird ein
+        neues Objekt vor diesem Objekt in die Liste eingefügt. Der Cursor bleibt
+        unverändert.
+
+        Wenn die Liste leer ist, wird `content` in die Liste eingefügt und der
+        Cursor hat weiterhin keinen Zugriff (`has_access is False`).
+
+        Falls der Cursor keinen Zugriff hat und die Liste nicht leer ist oder
+        `content` `None` ist, geschieht nichts.
+        """
+        if content is None:
+            return
+
+        node: _ListNode[_T] | None = self._node
+        if node is not None:
+            self._list._insert_before(node, content)
+        elif self._list.is_empty:
+            self._list.insert(content)
+
+    def remove(self) -> None:
+        """Falls der Cursor auf einem Objekt steht (`has_access is True`), wird
+        dieses Objekt aus der Liste gelöscht und der Cursor auf das folgende Objekt
+        gesetzt. Ist das gelöschte Objekt zugleich das aktuelle Objekt der Liste,
+        wird auch dieses auf das folgende Objekt gesetzt.
+
+        Hat der Cursor keinen Zugriff, geschieht nichts.
+        """
+        if not self.has_access:
+            return
 
-        temp: _ListNode[_T] | None = self._first
-        while temp is not None and temp.next_node is not node:
-            temp = temp.next_node
-        return temp
+        removed: _ListNode[_T] | None = self._node
+        assert removed is not None
+        self._node = self._list._remove_node(removed)
+        if self._list._current is removed:
+            self._list._current = self._node
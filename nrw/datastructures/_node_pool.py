@@ -0,0 +1,128 @@
+"""Implementation der generischen Klasse `NodePool[_ContentT, _NodeT]`."""
+
+from __future__ import annotations
+
+__all__: Final[list[str]] = ["NodePool"]
+
+from typing import TYPE_CHECKING, Any, Final, Generic, Protocol, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+_ContentT = TypeVar("_ContentT")
+
+
+class _PoolableNode(Protocol[_ContentT]):
+    _content: _ContentT
+
+    def _clear(self) -> None: ...
+
+
+_NodeT = TypeVar("_NodeT", bound=_PoolableNode[Any])
+
+
+class NodePool(Generic[_ContentT, _NodeT]):
+    """Objekte der generischen Klasse `NodePool` verwalten nicht mehr benötigte
+    Knoten einer Datenstruktur in einer Freiliste, damit diese wiederverwendet
+    werden können, anstatt neue Knoten zu erzeugen.
+
+    Die Freiliste enthält höchstens `capacity` Knoten; bei einer Kapazität von 0
+    (Standard) werden keine Knoten aufbewahrt. Über `hits`, `misses` und
+    `hit_rate` kann abgefragt werden, wie oft ein Knoten wiederverwendet werden
+    konnte. Die Zähler werden nicht synchronisiert und sind bei nebenläufiger
+    Verwendung daher nur Näherungswerte.
+    """
+
+    __slots__: Final[tuple[str, str, str, str, str]] = (
+        "_capacity",
+        "_factory",
+        "_free",
+        "_hits",
+        "_misses",
+    )
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        factory: Callable[[_ContentT], _NodeT],
+        capacity: int = 0,
+    ) -> None:
+        """Ein leerer Pool wird erzeugt, der neue Knoten mit `factory` erzeugt und
+        höchstens `capacity` freie Knoten aufbewahrt.
+        """
+        self._factory: Callable[[_ContentT], _NodeT] = factory
+        self._capacity: int = max(capacity, 0)
+        self._free: list[_NodeT] = []
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(capacity={self._capacity!r}, "
+            f"free={len(self._free)!r}, hits={self._hits!r}, "
+            f"misses={self._misses!r})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    @property
+    def capacity(self) -> int:
+        """Die Anfrage liefert die maximale Anzahl an aufbewahrten Knoten.
+
+        Wird die Kapazität verringert, werden überzählige freie Knoten verworfen.
+        Negative Werte werden als 0 behandelt.
+        """
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, new_capacity: int) -> None:
+        self._capacity = max(new_capacity, 0)
+        del self._free[self._capacity :]
+
+    @property
+    def hits(self) -> int:
+        """Die Anfrage liefert, wie oft ein Knoten wiederverwendet wurde."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Die Anfrage liefert, wie oft ein neuer Knoten erzeugt werden musste."""
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Die Anfrage liefert den Anteil der wiederverwendeten Knoten an allen
+        angeforderten Knoten. Wurde noch kein Knoten angefordert, wird `0.0`
+        zurückgegeben.
+        """
+        requests: int = self._hits + self._misses
+        return self._hits / requests if requests else 0.0
+
+    def acquire(self, content: _ContentT) -> _NodeT:
+        """Die Anfrage liefert einen Knoten mit dem Inhalt `content`. Falls
+        möglich, wird dafür ein freier Knoten wiederverwendet.
+        """
+        try:
+            node: _NodeT = self._free.pop()
+        except IndexError:
+            self._misses += 1
+            return self._factory(content)
+        self._hits += 1
+        node._content = content
+        return node
+
+    def release(self, node: _NodeT) -> None:
+        """Der Knoten `node` wird geleert und in die Freiliste aufgenommen, sofern
+        diese ihre Kapazität noch nicht erreicht hat. Der Knoten darf danach von
+        keiner Datenstruktur mehr verwendet werden.
+        """
+        if len(self._free) < self._capacity:
+            node._clear()
+            self._free.append(node)
+
+    def clear(self) -> None:
+        """Alle freien Knoten werden verworfen und die Zähler zurückgesetzt."""
+        self._free.clear()
+        self._hits = self._misses = 0
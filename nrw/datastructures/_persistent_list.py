@@ -0,0 +1,351 @@
+"""Implementation der generischen Klasse `PersistentList[_T]`."""
+
+from __future__ import annotations
+
+__all__: Final[list[str]] = ["PersistentList"]
+
+from io import StringIO
+from typing import TYPE_CHECKING, Final, Generic, TypeVar
+
+from nrw.datastructures._list import List
+from nrw.datastructures._persistent_stack import _PersistentNode
+from nrw.datastructures._utils import write_linked_contents
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from _typeshed import SupportsWrite
+
+_T = TypeVar("_T")
+
+
+class PersistentList(Generic[_T]):
+    """Objekte der generischen Klasse `PersistentList` verhalten sich wie Objekte
+    der Klasse `List`, d. h., sie verwalten beliebig viele linear angeordnete
+    Objekte, auf die über ein aktuelles Objekt zugegriffen werden kann.
+
+    Die Knoten der Liste werden jedoch nie verändert, sondern nur gemeinsam
+    verwendet. Über `snapshot` kann daher in konstanter Laufzeit eine
+    Momentaufnahme der Liste erzeugt werden, die von späteren Änderungen der
+    Liste (und umgekehrt) nicht beeinflusst wird.
+
+    Das Lesen und Durchlaufen der Liste hat dieselbe Laufzeit wie bei `List`.
+    Bei `insert`, `remove` und dem Verändern des aktuellen Objekts werden die
+    Knoten vor dem aktuellen Objekt kopiert; der Rest der Liste wird weiterhin
+    gemeinsam verwendet. `append` und `concat` kopieren nur dann alle Knoten der
+    Liste, wenn diese seit der letzten Kopie mit einer anderen Liste geteilt
+    werden, ansonsten haben sie eine konstante Laufzeit. Das schrittweise Aufbauen
+    einer Liste mit `append` ist daher linear.
+    """
+
+    __slots__: Final[tuple[str, str, str, str, str]] = (
+        "_current",
+        "_first",
+        "_last",
+        "_length",
+        "_shared",
+    )
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self) -> None:
+        """Eine leere Liste wird erzeugt."""
+        self._first: _PersistentNode[_T] | None = None
+        self._last: _PersistentNode[_T] | None = None
+        self._current: _PersistentNode[_T] | None = None
+        self._length: int = 0
+        self._shared: bool = False
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[_T | None]) -> PersistentList[_T]:
+        """Eine neue Liste wird erzeugt, die alle Objekte aus `iterable` in deren
+        Reihenfolge enthält. `None` wird dabei übersprungen. Es gibt kein aktuelles
+        Objekt (`has_access is False`).
+        """
+        contents: list[_T] = [content for content in iterable if content is not None]
+        lst: PersistentList[_T] = cls()
+        node: _PersistentNode[_T] | None = None
+        for content in reversed(contents):
+            node = _PersistentNode(content, node)
+            if lst._last is None:
+                lst._last = node
+        lst._first, lst._length = node, len(contents)
+        return lst
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(first={self._first!r}, last={self._last!r}, "
+            f"current={self._current!r})"
+        )
+
+    def __str__(self) -> str:
+        return self.to_str()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None:
+        """Die Darstellung der Liste wird schrittweise in `file` geschrieben.
+
+        Ist `limit` nicht `None`, werden nur die ersten `limit` Objekte sowie die
+        Anzahl aller Objekte geschrieben, sodass der Aufwand nur von `limit`
+        abhängt.
+        """
+        write_linked_contents(
+            file,
+            self.__class__.__name__,
+            self,
+            limit=limit,
+        )
+
+    def to_str(self, limit: int | None = None) -> str:
+        """Die Anfrage liefert die Darstellung der Liste wie `write` als
+        Zeichenkette.
+        """
+        with StringIO() as buffer:
+            self.write(buffer, limit)
+            return buffer.getvalue()
+
+    def __iter__(self) -> Iterator[_T]:
+        node: _PersistentNode[_T] | None = self._first
+        while node is not None:
+            yield node._content
+            node = node._next_node
+
+    def __reversed__(self) -> Iterator[_T]:
+        return reversed(list(self))
+
+    def __contains__(self, content: object) -> bool:
+        return any(element is content or element == content for element in self)
+
+    def snapshot(self) -> PersistentList[_T]:
+        """Die Anfrage liefert in konstanter Laufzeit eine neue Liste mit denselben
+        Objekten, die sich die Knoten mit dieser Liste teilt. In der neuen Liste
+        gibt es kein aktuelles Objekt.
+        """
+        lst: PersistentList[_T] = self.__class__()
+        lst._first, lst._last, lst._length = self._first, self._last, self._length
+        lst._shared = self._shared = True
+        return lst
+
+    def to_list(self) -> List[_T]:
+        """Die Anfrage liefert eine neue `List` mit allen Objekten der Liste."""
+        return List.from_iterable(self)
+
+    @property
+    def is_empty(self) -> bool:
+        """Die Anfrage liefert den Wert `True`, wenn die Liste keine Objekte enthält,
+        sonst liefert sie den Wert `False`.
+        """
+        return self._first is None
+
+    @property
+    def has_access(self) -> bool:
+        """Die Anfrage liefert den Wert `True`, wenn es ein aktuelles Objekt gibt,
+        sonst liefert sie den Wert `False`.
+        """
+        return self._current is not None
+
+    def next(self) -> None:
+        """Falls die Liste nicht leer ist, es ein aktuelles Objekt gibt und dieses
+        nicht das letzte Objekt der Liste ist, wird das dem aktuellen Objekt in
+        der Liste folgende Objekt zum aktuellen Objekt, andernfalls gibt es nach
+        Ausführung des Auftrags kein aktuelles Objekt, d. h. `has_access` liefert
+        den Wert `False`.
+        """
+        if self._current is None:
+            return
+        self._current = self._current._next_node
+
+    def to_first(self) -> None:
+        """Falls die Liste nicht leer ist, wird das erste Objekt der Liste aktuelles
+        Objekt. Ist die Liste leer, geschieht nichts.
+        """
+        if self.is_empty:
+            return
+        self._current = self._first
+
+    def to_last(self) -> None:
+        """Falls die Liste nicht leer ist, wird das letzte Objekt der Liste
+        aktuelles Objekt. Ist die Liste leer, geschieht nichts.
+        """
+        if self.is_empty:
+            return
+        self._current = self._last
+
+    @property
+    def content(self) -> _T | None:
+        """Falls es ein aktuelles Objekt gibt (`has_access is True`), wird das
+        aktuelle Objekt zurückgegeben, andernfalls (`has_access is False`) gibt
+        die Anfrage den Wert `None` zurück.
+        """
+        return self._current.content if self._current is not None else None
+
+    @content.setter
+    def content(self, new_content: _T | None) -> None:
+        current: _PersistentNode[_T] | None = self._current
+        if new_content is None or current is None:
+            return
+
+        replacement: _PersistentNode[_T] = _PersistentNode(
+            new_content,
+            current._next_node,
+        )
+        self._link_prefix(current, replacement)
+        if current is self._last:
+            self._last = replacement
+        self._current = replacement
+
+    def insert(self, content: _T | None) -> None:
+        """Falls es ein aktuelles Objekt gibt (`has_access is True`), wird ein neues
+        Objekt vor dem aktuellen Objekt in die Liste eingefügt. Das aktuelle
+        Objekt bleibt unverändert.
+
+        Wenn die Liste leer ist, wird `content` in die Liste eingefügt und es
+        gibt weiterhin kein aktuelles Objekt (`has_access is False`).
+
+        Falls es kein aktuelles Objekt gibt (`has_access is False`) und die Liste
+        nicht leer ist oder `content` `None` ist, geschieht nichts.
+        """
+        if content is None:
+            return
+
+        current: _PersistentNode[_T] | None = self._current
+        if current is not None:
+            self._link_prefix(current, _PersistentNode(content, current))
+            self._length += 1
+        elif self.is_empty:
+            self._first = self._last = _PersistentNode(content, None)
+            self._length = 1
+            self._shared = False
+
+    def append(self, content: _T | None) -> None:
+        """Falls `content` `None` ist, geschieht nichts.
+
+        Ansonsten wird ein neues Objekt `content` am Ende der Liste eingefügt.
+        Das aktuelle Objekt bleibt unverändert.
+
+        Wenn die Liste leer ist, wird das Objekt `content` in die Liste eingefügt
+        und es gibt weiterhin kein aktuelles Objekt (`has_access is False`).
+        """
+        if content is None:
+            return
+        self._append_nodes(_PersistentNode(content, None), None, 1)
+
+    def concat(self, other_list: PersistentList[_T] | None) -> None:
+        """Falls es sich bei der Liste und `other_list` um dasselbe Objekt handelt,
+        `other_list` `None` oder eine leere Liste ist, geschieht nichts.
+
+        Ansonsten wird die Liste `other_list` an die aktuelle Liste angehängt.
+        Anschliessend wird `other_list` eine leere Liste. Das aktuelle Objekt bleibt
+        unverändert. Insbesondere bleibt `has_access` identisch. Die Knoten von
+        `other_list` werden dabei nicht kopiert.
+        """
+        if other_list is self or other_list is None or other_list.is_empty:
+            return
+
+        first: _PersistentNode[_T] | None = other_list._first
+        assert first is not None
+        shared: bool = other_list._shared
+        self._append_nodes(first, other_list._last, other_list._length)
+        self._shared = self._shared or shared
+        other_list._first = other_list._last = other_list._current = None
+        other_list._length = 0
+        other_list._shared = False
+
+    def remove(self) -> None:
+        """Wenn die Liste leer ist oder es kein aktuelles Objekt gibt (`has_access
+        is False`), geschieht nichts.
+
+        Falls es ein aktuelles Objekt gibt (`has_access is True`), wird das
+        aktuelle Objekt gelöscht und das Objekt hinter dem gelöschten Objekt
+        wird zum aktuellen Objekt.
+
+        Wird das Objekt, das am Ende der Liste steht, gelöscht, gibt es kein
+        aktuelles Objekt mehr.
+        """
+        current: _PersistentNode[_T] | None = self._current
+        if current is None:
+            return
+
+        previous: _PersistentNode[_T] | None = self._link_prefix(
+            current,
+            current._next_node,
+        )
+        if current is self._last:
+            self._last = previous
+        self._current = current._next_node
+        self._length -= 1
+
+    def _link_prefix(
+        self,
+        stop: _PersistentNode[_T],
+        following: _PersistentNode[_T] | None,
+    ) -> _PersistentNode[_T] | None:
+        """Ersetzt alle Knoten vor dem Knoten `stop` durch Kopien, deren letzte auf
+        `following` verweist, und liefert diese letzte Kopie. Liegt kein Knoten
+        vor `stop`, wird `following` zum ersten Knoten und `None` geliefert.
+        """
+        first: _PersistentNode[_T] | None = None
+        last: _PersistentNode[_T] | None = None
+        node: _PersistentNode[_T] | None = self._first
+        while node is not None and node is not stop:
+            copy: _PersistentNode[_T] = _PersistentNode(node._content, None)
+            if last is None:
+                first = copy
+            else:
+                last._next_node = copy
+            last = copy
+            node = node._next_node
+
+        if last is None:
+            self._first = following
+        else:
+            last._next_node = following
+            self._first = first
+        return last
+
+    def _append_nodes(
+        self,
+        first: _PersistentNode[_T],
+        last: _PersistentNode[_T] | None,
+        count: int,
+    ) -> None:
+        """Hängt die Knotenkette ab `first` an die Liste an. Ist `last` `None`, ist
+        `first` der einzige Knoten der Kette.
+
+        Werden die Knoten der Liste mit einer anderen Liste geteilt, wird die
+        Kette an eine Kopie aller Knoten angehängt, ansonsten direkt an den letzten
+        Knoten.
+        """
+        if not self._shared:
+            if self._last is None:
+                self._first = first
+            else:
+                self._last._next_node = first
+            self._last = first if last is None else last
+            self._length += count
+            return
+
+        current: _PersistentNode[_T] | None = self._current
+        new_current: _PersistentNode[_T] | None = None
+        copied_last: _PersistentNode[_T] | None = None
+        node: _PersistentNode[_T] | None = self._first
+        while node is not None:
+            copy: _PersistentNode[_T] = _PersistentNode(node._content, None)
+            if copied_last is None:
+                self._first = copy
+            else:
+                copied_last._next_node = copy
+            if node is current:
+                new_current = copy
+            copied_last = copy
+            node = node._next_node
+
+        if copied_last is None:
+            self._first = first
+        else:
+            copied_last._next_node = first
+        self._last = first if last is None else last
+        self._current = new_current
+        self._length += count
+        self._shared = False
@@ -0,0 +1,151 @@
+"""Implementation der generischen Klasse `PersistentStack[_T]`."""
+
+from __future__ import annotations
+
+__all__: Final[list[str]] = ["PersistentStack"]
+
+from io import StringIO
+from typing import TYPE_CHECKING, Final, Generic, TypeVar
+
+from nrw.datastructures._utils import display_linked_node, write_linked_contents
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from _typeshed import SupportsWrite
+
+_T = TypeVar("_T")
+
+
+class _PersistentNode(Generic[_T]):
+    """Unveränderlicher Knoten, der von beliebig vielen persistenten
+    Datenstrukturen gemeinsam verwendet werden kann. Ein Knoten wird nach dem
+    Verketten nicht mehr verändert.
+    """
+
+    __slots__: Final[tuple[str, str]] = ("_content", "_next_node")
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, content: _T, next_node: _PersistentNode[_T] | None) -> None:
+        """Ein neues Objekt vom Typ `_PersistentNode[_T]` wird erschaffen.
+        Der Inhalt und der Nachfolger werden per Parameter gesetzt.
+        """
+        self._content: _T = content
+        self._next_node: _PersistentNode[_T] | None = next_node
+
+    def __repr__(self) -> str:
+        return display_linked_node(self)
+
+    @property
+    def content(self) -> _T:
+        """Liefert das Inhaltsobjekt des Knotens."""
+        return self._content
+
+    @property
+    def next_node(self) -> _PersistentNode[_T] | None:
+        """Liefert das nächste Element des aktuellen Knotens."""
+        return self._next_node
+
+
+class PersistentStack(Generic[_T]):
+    """Objekte der generischen Klasse `PersistentStack` verhalten sich wie Objekte
+    der Klasse `Stack`, d. h., sie verwalten beliebige Objekte nach dem
+    Last-In-First-Out-Prinzip.
+
+    Die Knoten des Stapels werden jedoch nie verändert, sondern nur gemeinsam
+    verwendet. Über `snapshot` kann daher in konstanter Laufzeit eine
+    Momentaufnahme des Stapels erzeugt werden, die von späteren Änderungen des
+    Stapels (und umgekehrt) nicht beeinflusst wird. Alle Methoden haben eine
+    konstante Laufzeit.
+    """
+
+    __slots__: Final[tuple[str, str]] = ("_head", "_length")
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self) -> None:
+        """Ein leerer Stapel wird erzeugt."""
+        self._head: _PersistentNode[_T] | None = None
+        self._length: int = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(head={self._head!r})"
+
+    def __str__(self) -> str:
+        return self.to_str()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None:
+        """Die Darstellung des Stapels wird schrittweise in `file` geschrieben.
+
+        Ist `limit` nicht `None`, werden nur die ersten `limit` Objekte sowie die
+        Anzahl aller Objekte geschrieben, sodass der Aufwand nur von `limit`
+        abhängt.
+        """
+        write_linked_contents(
+            file,
+            self.__class__.__name__,
+            self,
+            limit=limit,
+        )
+
+    def to_str(self, limit: int | None = None) -> str:
+        """Die Anfrage liefert die Darstellung des Stapels wie `write` als
+        Zeichenkette.
+        """
+        with StringIO() as buffer:
+            self.write(buffer, limit)
+            return buffer.getvalue()
+
+    def __iter__(self) -> Iterator[_T]:
+        node: _PersistentNode[_T] | None = self._head
+        while node is not None:
+            yield node._content
+            node = node._next_node
+
+    def __reversed__(self) -> Iterator[_T]:
+        return reversed(list(self))
+
+    def __contains__(self, content: object) -> bool:
+        return any(element is content or element == content for element in self)
+
+    @property
+    def is_empty(self) -> bool:
+        """Die Anfrage liefert den Wert `True`, wenn der Stapel keine Objekte enthält,
+        sonst liefert sie den Wert `False`.
+        """
+        return self._head is None
+
+    def snapshot(self) -> PersistentStack[_T]:
+        """Die Anfrage liefert in konstanter Laufzeit einen neuen Stapel mit
+        denselben Objekten, der sich die Knoten mit diesem Stapel teilt.
+        """
+        stack: PersistentStack[_T] = self.__class__()
+        stack._head, stack._length = self._head, self._length
+        return stack
+
+    def push(self, content: _T) -> None:
+        """Das Objekt `content` wird oben auf den Stapel gelegt.
+        Falls `content` `None` ist, bleibt der Stapel unverändert.
+        """
+        if content is None:
+            return
+        self._head = _PersistentNode(content, self._head)
+        self._length += 1
+
+    def pop(self) -> None:
+        """Das zuletzt eingefügte Objekt wird von dem Stapel entfernt.
+        Falls der Stapel leer ist, bleibt er unverändert.
+        """
+        if self._head is None:
+            return
+        self._head = self._head._next_node
+        self._length -= 1
+
+    @property
+    def top(self) -> _T | None:
+        """Die Anfrage liefert das oberste Stapelobjekt. Der Stapel bleibt unverändert.
+        Falls der Stapel leer ist, wird `None` zurückgegeben.
+        """
+        return self._head.content if self._head is not None else None
@@ -0,0 +1,218 @@
+"""Implementation der generischen Klasse `PriorityQueue[ComparableContentT]`."""
+
+from __future__ import annotations
+
+__all__: Final[list[str]] = ["PriorityQueue", "PriorityQueueHandle"]
+
+from typing import TYPE_CHECKING, Final, Generic
+
+from nrw.datastructures._comparable_content import ComparableContentT
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class PriorityQueueHandle(Generic[ComparableContentT]):
+    """Objekte der generischen Klasse `PriorityQueueHandle` verweisen auf ein
+    Objekt einer `PriorityQueue`. Sie werden von `PriorityQueue.insert` geliefert
+    und ermöglichen es, das Objekt über `PriorityQueue.decrease_key` durch ein
+    kleineres Objekt zu ersetzen.
+    """
+
+    __slots__: Final[tuple[str, str]] = ("_content", "_index")
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, content: ComparableContentT, index: int) -> None:
+        self._content: ComparableContentT = content
+        self._index: int | None = index
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(content={self._content!r})"
+
+    @property
+    def content(self) -> ComparableContentT:
+        """Die Anfrage liefert das Objekt, auf das verwiesen wird."""
+        return self._content
+
+    @property
+    def is_queued(self) -> bool:
+        """Die Anfrage liefert den Wert `True`, solange sich das Objekt in der
+        Schlange befindet, sonst liefert sie den Wert `False`.
+        """
+        return self._index is not None
+
+
+class PriorityQueue(Generic[ComparableContentT]):
+    """Objekte der generischen Klasse `PriorityQueue` (Vorrangwarteschlange)
+    verwalten beliebig viele Objekte so, dass jeweils das kleinste Objekt als
+    erstes entnommen wird. Gleiche Objekte sind erlaubt; ihre Reihenfolge ist
+    nicht festgelegt.
+
+    Die Klasse der Objekte muss, wie beim `BinarySearchTree`, das Protocol
+    `ComparableContent` implementieren.
+
+    Die Objekte werden in einem binären Heap in einem Array gespeichert. `front`
+    hat eine konstante, `insert`, `remove_front` und `decrease_key` haben eine
+    logarithmische Laufzeit. Über `heapify` können viele Objekte in linearer
+    Laufzeit eingefügt werden. Beim Durchlaufen (`iter`) werden die Objekte in der
+    Reihenfolge des Heaps, also nicht sortiert, geliefert.
+    """
+
+    __slots__: Final[tuple[str]] = ("_heap",)
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self) -> None:
+        """Eine leere Schlange wird erzeugt."""
+        self._heap: list[PriorityQueueHandle[ComparableContentT]] = []
+
+    @classmethod
+    def from_iterable(
+        cls,
+        iterable: Iterable[ComparableContentT | None],
+    ) -> PriorityQueue[ComparableContentT]:
+        """Eine neue Schlange wird erzeugt, die alle Objekte aus `iterable` enthält.
+        `None` wird dabei übersprungen. Der Aufbau hat eine lineare Laufzeit.
+        """
+        queue: PriorityQueue[ComparableContentT] = cls()
+        queue.heapify(iterable)
+        return queue
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({[entry._content for entry in self._heap]!r})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[ComparableContentT]:
+        return (entry._content for entry in self._heap)
+
+    def __contains__(self, content: object) -> bool:
+        return any(
+            entry._content is content or entry._content == content
+            for entry in self._heap
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        """Die Anfrage liefert den Wert `True`, wenn die Schlange keine Objekte enthält,
+        sonst liefert sie den Wert `False`.
+        """
+        return not self._heap
+
+    @property
+    def front(self) -> ComparableContentT | None:
+        """Die Anfrage liefert das kleinste Objekt der Schlange.
+        Die Schlange bleibt unverändert.
+        Falls die Schlange leer ist, wird `None` zurückgegeben.
+        """
+        return self._heap[0]._content if self._heap else None
+
+    def insert(
+        self,
+        content: ComparableContentT | None,
+    ) -> PriorityQueueHandle[ComparableContentT] | None:
+        """Das Objekt `content` wird in die Schlange eingefügt. Die Anfrage liefert
+        einen Verweis auf das Objekt, der für `decrease_key` verwendet werden kann.
+        Falls `content` `None` ist, bleibt die Schlange unverändert und es wird
+        `None` zurückgegeben.
+        """
+        if content is None:
+            return None
+
+        entry: PriorityQueueHandle[ComparableContentT] = PriorityQueueHandle(
+            content,
+            len(self._heap),
+        )
+        self._heap.append(entry)
+        self._sift_up(len(self._heap) - 1)
+        return entry
+
+    def heapify(self, iterable: Iterable[ComparableContentT | None]) -> None:
+        """Alle Objekte aus `iterable` werden in die Schlange eingefügt, wobei `None`
+        übersprungen wird. Der Heap wird anschliessend als Ganzes neu aufgebaut,
+        sodass der Auftrag eine lineare Laufzeit hat.
+        """
+        heap: list[PriorityQueueHandle[ComparableContentT]] = self._heap
+        for content in iterable:
+            if content is not None:
+                heap.append(PriorityQueueHandle(content, len(heap)))
+        for index in range(len(heap) // 2 - 1, -1, -1):
+            self._sift_down(index)
+
+    def remove_front(self) -> None:
+        """Das kleinste Objekt wird aus der Schlange entfernt.
+        Falls die Schlange leer ist, wird sie nicht verändert.
+        """
+        if not self._heap:
+            return
+
+        heap: list[PriorityQueueHandle[ComparableContentT]] = self._heap
+        removed: PriorityQueueHandle[ComparableContentT] = heap[0]
+        last: PriorityQueueHandle[ComparableContentT] = heap.pop()
+        if heap:
+            heap[0], last._index = last, 0
+            self._sift_down(0)
+        removed._index = None
+
+    def decrease_key(
+        self,
+        handle: PriorityQueueHandle[ComparableContentT] | None,
+        new_content: ComparableContentT | None,
+    ) -> bool:
+        """Falls `handle` auf ein Objekt dieser Schlange verweist und `new_content`
+        kleiner als dieses Objekt ist, wird das Objekt durch `new_content` ersetzt
+        und die Anfrage liefert den Wert `True`. Andernfalls geschieht nichts und
+        die Anfrage liefert den Wert `False`.
+        """
+        if handle is None or new_content is None or handle._index is None:
+            return False
+        index: int = handle._index
+        if index >= len(self._heap) or self._heap[index] is not handle:
+            return False
+        if not new_content < handle._content:
+            return False
+
+        handle._content = new_content
+        self._sift_up(index)
+        return True
+
+    def _sift_up(self, index: int) -> None:
+        """Bewegt den Eintrag an der Position `index` so weit nach oben, bis er
+        nicht kleiner als sein Elterneintrag ist.
+        """
+        heap: list[PriorityQueueHandle[ComparableContentT]] = self._heap
+        entry: PriorityQueueHandle[ComparableContentT] = heap[index]
+        while index > 0:
+            parent_index: int = (index - 1) // 2
+            parent: PriorityQueueHandle[ComparableContentT] = heap[parent_index]
+            if not entry._content < parent._content:
+                break
+            heap[index], parent._index = parent, index
+            index = parent_index
+        heap[index], entry._index = entry, index
+
+    def _sift_down(self, index: int) -> None:
+        """Bewegt den Eintrag an der Position `index` so weit nach unten, bis keiner
+        seiner Kindeinträge kleiner ist.
+        """
+        heap: list[PriorityQueueHandle[ComparableContentT]] = self._heap
+        length: int = len(heap)
+        entry: PriorityQueueHandle[ComparableContentT] = heap[index]
+        while True:
+            child_index: int = 2 * index + 1
+            if child_index >= length:
+                break
+            right_index: int = child_index + 1
+            if (
+                right_index < length
+                and heap[right_index]._content < heap[child_index]._content
+            ):
+                child_index = right_index
+            child: PriorityQueueHandle[ComparableContentT] = heap[child_index]
+            if not child._content < entry._content:
+                break
+            heap[index], child._index = child, index
+            index = child_index
+        heap[index], entry._index = entry, index
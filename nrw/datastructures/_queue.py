@@ -5,7 +5,16 @@ from __future__ import annotations
 __all__: Final[list[str]] = ["Queue"]
 
 from io import StringIO
-from typing import Final, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Final, Generic, TypeVar
+
+from nrw.datastructures._list import List
+from nrw.datastructures._node_pool import NodePool
+from nrw.datastructures._utils import display_linked_node, write_linked_contents
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from _typeshed import SupportsWrite
 
 _T = TypeVar("_T")
 
@@ -22,10 +31,12 @@ class _QueueNode(Generic[_T]):
         self._next_node: _QueueNode[_T] | None = None
 
     def __repr__(self) -> str:
-        return (
-            f"{self.__class__.__name__}(content={self._content!r}, "
-            f"next_node={self._next_node!r})"
-        )
+        return display_linked_node(self)
+
+    def _clear(self) -> None:
+        """Entfernt den Inhalt und die Verweise des Knotens."""
+        self._content = None  # type: ignore[assignment]
+        self._next_node = None
 
     @property
     def content(self) -> _T:
@@ -47,32 +58,70 @@ class Queue(Generic[_T]):
     Objekte nach dem First-In-First-Out-Prinzip, d. h., das
     zuerst abgelegte Objekt wird als erstes wieder entnommen. Alle Methoden haben
     eine konstante Laufzeit, unabhängig von der Anzahl der verwalteten Objekte.
+
+    Entnommene Knoten können über den gemeinsamen `node_pool` aller Schlangen
+    wiederverwendet werden, sobald dessen Kapazität größer als 0 ist.
     """
 
-    __slots__: Final[tuple[str, str]] = ("_head", "_tail")
+    __slots__: Final[tuple[str, str, str]] = ("_head", "_length", "_tail")
     __hash__ = None  # type: ignore[assignment]
 
+    node_pool: ClassVar[NodePool[Any, _QueueNode[Any]]] = NodePool(_QueueNode)
+
     def __init__(self) -> None:
         """Eine leere Schlange wird erzeugt."""
         self._head: _QueueNode[_T] | None = None
         self._tail: _QueueNode[_T] | None = None
+        self._length: int = 0
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(head={self._head!r}, tail={self._tail!r})"
 
     def __str__(self) -> str:
-        if self.is_empty:
-            return f"{self.__class__.__name__}()"
+        return self.to_str()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None:
+        """Die Darstellung der Schlange wird schrittweise in `file` geschrieben.
+
+        Ist `limit` nicht `None`, werden nur die ersten `limit` Objekte sowie die
+        Anzahl aller Objekte geschrieben, sodass der Aufwand nur von `limit`
+        abhängt.
+        """
+        write_linked_contents(
+            file,
+            self.__class__.__name__,
+            self,
+            limit=limit,
+        )
 
+    def to_str(self, limit: int | None = None) -> str:
+        """Die Anfrage liefert die Darstellung der Schlange wie `write` als
+        Zeichenkette.
+        """
         with StringIO() as buffer:
-            buffer.write(f"{self.__class__.__name__}(")
-            temp: _QueueNode[_T] | None = self._head
-            while temp is not self._tail:
-                buffer.write(f"{temp.content} -> ")
-                temp = temp.next_node
-            buffer.write(f"{temp.content})")
+            self.write(buffer, limit)
             return buffer.getvalue()
 
+    def __iter__(self) -> Iterator[_T]:
+        node: _QueueNode[_T] | None = self._head
+        while node is not None:
+            yield node._content
+            node = node._next_node
+
+    def __reversed__(self) -> Iterator[_T]:
+        return reversed(list(self))
+
+    def __contains__(self, content: object) -> bool:
+        node: _QueueNode[_T] | None = self._head
+        while node is not None:
+            if node._content is content or node._content == content:
+                return True
+            node = node._next_node
+        return False
+
     @property
     def is_empty(self) -> bool:
         """Die Anfrage liefert den Wert `True`, wenn die Schlange keine Objekte enthält,
@@ -87,12 +136,43 @@ class Queue(Generic[_T]):
         if content is None:
             return
 
-        new_node: _QueueNode[_T] = _QueueNode(content)
+        new_node: _QueueNode[_T] = self.node_pool.acquire(content)
 
         if self.is_empty:
             self._head = self._tail = new_node
         else:
             self._tail.next_node, self._tail = new_node, new_node
+        self._length += 1
+
+    def enqueue_many(self, iterable: Iterable[_T | None]) -> None:
+        """Alle Objekte aus `iterable` werden in deren Reihenfolge an die Schlange
+        angehängt, wobei `None` übersprungen wird. Die neuen Knoten werden in einem
+        Durchlauf verkettet und anschliessend als Ganzes angehängt.
+        """
+        acquire: Callable[[_T], _QueueNode[_T]] = self.node_pool.acquire
+        head: _QueueNode[_T] | None = None
+        tail: _QueueNode[_T] | None = None
+        count: int = 0
+        for content in iterable:
+            if content is None:
+                continue
+            new_node: _QueueNode[_T] = acquire(content)
+            if tail is None:
+                head = new_node
+            else:
+                tail._next_node = new_node
+            tail = new_node
+            count += 1
+
+        if head is None:
+            return
+
+        if self.is_empty:
+            self._head = head
+        else:
+            self._tail._next_node = head
+        self._tail = tail
+        self._length += count
 
     def dequeue(self) -> None:
         """Das erste Objekt wird aus der Schlange entfernt.
@@ -101,11 +181,34 @@ class Queue(Generic[_T]):
         if self.is_empty:
             return
 
-        self._head = self._head.next_node
+        old_head: _QueueNode[_T] | None = self._head
+        assert old_head is not None
+        self._head = old_head.next_node
+        self._length -= 1
+        self.node_pool.release(old_head)
 
         if self.is_empty:
             self._head = self._tail = None
 
+    def dequeue_many(self, count: int | None = None) -> List[_T]:
+        """Die ersten `count` Objekte werden aus der Schlange entfernt und in ihrer
+        Reihenfolge als neue Liste vom Typ `List[_T]` geliefert. Ist `count` `None`
+        oder enthält die Schlange weniger Objekte, wird die Schlange vollständig
+        geleert.
+        """
+        release: Callable[[_QueueNode[_T]], None] = self.node_pool.release
+        contents: list[_T] = []
+        head: _QueueNode[_T] | None = self._head
+        while head is not None and (count is None or len(contents) < count):
+            contents.append(head._content)
+            old_head, head = head, head._next_node
+            release(old_head)
+        self._head = head
+        self._length -= len(contents)
+        if head is None:
+            self._tail = None
+        return List.from_iterable(contents)
+
     @property
     def front(self) -> _T | None:
         """Die Anfrage liefert das erste Objekt der Schlange.
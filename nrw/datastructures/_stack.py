@@ -5,7 +5,17 @@ from __future__ import annotations
 __all__: Final[list[str]] = ["Stack"]
 
 from io import StringIO
-from typing import Final, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Final, Generic, TypeVar
+
+from nrw.datastructures._array_stack import ArrayStack
+from nrw.datastructures._list import List
+from nrw.datastructures._node_pool import NodePool
+from nrw.datastructures._utils import display_linked_node, write_linked_contents
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from _typeshed import SupportsWrite
 
 _T = TypeVar("_T")
 
@@ -22,10 +32,12 @@ class _StackNode(Generic[_T]):
         self._next_node: _StackNode[_T] | None = None
 
     def __repr__(self) -> str:
-        return (
-            f"{self.__class__.__name__}(content={self._content!r}, "
-            f"next_node={self._next_node!r})"
-        )
+        return display_linked_node(self)
+
+    def _clear(self) -> None:
+        """Entfernt den Inhalt und die Verweise des Knotens."""
+        self._content = None  # type: ignore[assignment]
+        self._next_node = None
 
     @property
     def content(self) -> _T:
@@ -48,31 +60,78 @@ class Stack(Generic[_T]):
     zuletzt abgelegte Objekt wird als erstes wieder entnommen. Alle Methoden
     haben eine konstante Laufzeit, unabhängig von der Anzahl der verwalteten
     Objekte.
+
+    Entnommene Knoten können über den gemeinsamen `node_pool` aller Stapel
+    wiederverwendet werden, sobald dessen Kapazität größer als 0 ist. Über
+    `array_backed` kann stattdessen ein Stapel mit zusammenhängender Speicherung
+    (`ArrayStack`) erzeugt werden.
     """
 
-    __slots__: Final[tuple[str]] = ("_head",)
+    __slots__: Final[tuple[str, str]] = ("_head", "_length")
     __hash__ = None  # type: ignore[assignment]
 
+    node_pool: ClassVar[NodePool[Any, _StackNode[Any]]] = NodePool(_StackNode)
+
     def __init__(self) -> None:
         """Ein leerer Stapel wird erzeugt."""
         self._head: _StackNode[_T] | None = None
+        self._length: int = 0
+
+    @staticmethod
+    def array_backed() -> ArrayStack[Any]:
+        """Die Anfrage liefert einen neuen, leeren Stapel vom Typ `ArrayStack`, der
+        seine Objekte zusammenhängend in einem Array speichert.
+        """
+        return ArrayStack()
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(head={self._head!r})"
 
     def __str__(self) -> str:
-        if self.is_empty:
-            return f"{self.__class__.__name__}()"
+        return self.to_str()
+
+    def __len__(self) -> int:
+        return self._length
 
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None:
+        """Die Darstellung des Stapels wird schrittweise in `file` geschrieben.
+
+        Ist `limit` nicht `None`, werden nur die ersten `limit` Objekte sowie die
+        Anzahl aller Objekte geschrieben, sodass der Aufwand nur von `limit`
+        abhängt.
+        """
+        write_linked_contents(
+            file,
+            self.__class__.__name__,
+            self,
+            limit=limit,
+        )
+
+    def to_str(self, limit: int | None = None) -> str:
+        """Die Anfrage liefert die Darstellung des Stapels wie `write` als
+        Zeichenkette.
+        """
         with StringIO() as buffer:
-            buffer.write(f"{self.__class__.__name__}(")
-            temp: _StackNode[_T] | None = self._head
-            while temp is not None and temp.next_node is not None:
-                buffer.write(f"{temp.content} -> ")
-                temp = temp.next_node
-            buffer.write(f"{temp.content})")
+            self.write(buffer, limit)
             return buffer.getvalue()
 
+    def __iter__(self) -> Iterator[_T]:
+        node: _StackNode[_T] | None = self._head
+        while node is not None:
+            yield node._content
+            node = node._next_node
+
+    def __reversed__(self) -> Iterator[_T]:
+        return reversed(list(self))
+
+    def __contains__(self, content: object) -> bool:
+        node: _StackNode[_T] | None = self._head
+        while node is not None:
+            if node._content is content or node._content == content:
+                return True
+            node = node._next_node
+        return False
+
     @property
     def is_empty(self) -> bool:
         """Die Anfrage liefert den Wert `True`, wenn der Stapel keine Objekte enthält,
@@ -87,8 +146,27 @@ class Stack(Generic[_T]):
         if content is None:
             return
 
-        new_node: _StackNode[_T] = _StackNode(content)
+        new_node: _StackNode[_T] = self.node_pool.acquire(content)
         new_node.next_node, self._head = self._head, new_node
+        self._length += 1
+
+    def push_many(self, iterable: Iterable[_T | None]) -> None:
+        """Alle Objekte aus `iterable` werden in deren Reihenfolge auf den Stapel
+        gelegt, d. h., das letzte Objekt liegt anschliessend oben.
+        `None` wird dabei übersprungen.
+        """
+        acquire: Callable[[_T], _StackNode[_T]] = self.node_pool.acquire
+        head: _StackNode[_T] | None = self._head
+        count: int = 0
+        for content in iterable:
+            if content is None:
+                continue
+            new_node: _StackNode[_T] = acquire(content)
+            new_node._next_node = head
+            head = new_node
+            count += 1
+        self._head = head
+        self._length += count
 
     def pop(self) -> None:
         """Das zuletzt eingefügte Objekt wird von dem Stapel entfernt.
@@ -96,7 +174,28 @@ class Stack(Generic[_T]):
         """
         if self.is_empty:
             return
-        self._head = self._head.next_node
+        old_head: _StackNode[_T] | None = self._head
+        assert old_head is not None
+        self._head = old_head.next_node
+        self._length -= 1
+        self.node_pool.release(old_head)
+
+    def pop_many(self, count: int | None = None) -> List[_T]:
+        """Die obersten `count` Objekte werden von dem Stapel entfernt und in der
+        Reihenfolge ihrer Entnahme als neue Liste vom Typ `List[_T]` geliefert.
+        Ist `count` `None` oder enthält der Stapel weniger Objekte, wird der Stapel
+        vollständig geleert.
+        """
+        release: Callable[[_StackNode[_T]], None] = self.node_pool.release
+        contents: list[_T] = []
+        head: _StackNode[_T] | None = self._head
+        while head is not None and (count is None or len(contents) < count):
+            contents.append(head._content)
+            old_head, head = head, head._next_node
+            release(old_head)
+        self._head = head
+        self._length -= len(contents)
+        return List.from_iterable(contents)
 
     @property
     def top(self) -> _T | None:
@@ -0,0 +1,266 @@
+"""Implementation der generischen Klasse `TypedList[_NumberT]`."""
+
+from __future__ import annotations
+
+__all__: Final[list[str]] = ["TypedList"]
+
+from array import array
+from io import StringIO
+from typing import TYPE_CHECKING, Final, Generic, TypeVar
+
+from nrw.datastructures._utils import write_linked_contents
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from _typeshed import SupportsWrite
+
+_NumberT = TypeVar("_NumberT", int, float)
+
+
+class TypedList(Generic[_NumberT]):
+    """Objekte der generischen Klasse `TypedList` verhalten sich wie Objekte der
+    Klasse `List`, d. h., sie verwalten beliebig viele linear angeordnete Zahlen,
+    auf die über ein aktuelles Objekt zugegriffen werden kann.
+
+    Die Zahlen werden jedoch nicht in einzelnen Knoten, sondern unverpackt in
+    einem `array.array` mit dem Typcode `typecode` (z. B. `"d"` für `float` oder
+    `"q"` für `int`) gespeichert. Dadurch benötigt jede Zahl nur `itemsize` Bytes.
+    Über `memoryview` können die Daten ohne Kopie z. B. an NumPy übergeben werden
+    (`numpy.asarray(lst.memoryview())`). Ab Python 3.12 (PEP 688) unterstützt die
+    Liste zudem selbst das Pufferprotokoll (`numpy.asarray(lst)`); in älteren
+    Versionen ist dafür `lst.memoryview()` zu verwenden.
+
+    Da die Zahlen zusammenhängend gespeichert werden, haben `insert` und `remove`
+    eine lineare Laufzeit. Solange ein `memoryview` auf die Liste existiert,
+    lösen Aufträge, welche die Länge der Liste ändern, einen `BufferError` aus.
+    """
+
+    __slots__: Final[tuple[str, str]] = ("_array", "_current")
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, typecode: str) -> None:
+        """Eine leere Liste für Zahlen mit dem Typcode `typecode` wird erzeugt. Ist
+        `typecode` kein gültiger Typcode für `array.array`, wird ein `ValueError`
+        ausgelöst.
+        """
+        self._array: array[_NumberT] = array(typecode)
+        self._current: int | None = None
+
+    @classmethod
+    def from_iterable(
+        cls,
+        typecode: str,
+        iterable: Iterable[_NumberT | None],
+    ) -> TypedList[_NumberT]:
+        """Eine neue Liste mit dem Typcode `typecode` wird erzeugt, die alle Zahlen
+        aus `iterable` in deren Reihenfolge enthält. `None` wird dabei
+        übersprungen. Es gibt kein aktuelles Objekt (`has_access is False`).
+        """
+        lst: TypedList[_NumberT] = cls(typecode)
+        lst.extend(iterable)
+        return lst
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self._array.typecode!r}, "
+            f"{self._array.tolist()!r}, current={self.content!r})"
+        )
+
+    def __str__(self) -> str:
+        return self.to_str()
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def write(self, file: SupportsWrite[str], limit: int | None = None) -> None:
+        """Die Darstellung der Liste wird schrittweise in `file` geschrieben.
+
+        Ist `limit` nicht `None`, werden nur die ersten und letzten `limit` Zahlen
+        sowie die Anzahl aller Zahlen geschrieben, sodass der Aufwand nur von
+        `limit` abhängt.
+        """
+        write_linked_contents(
+            file,
+            self.__class__.__name__,
+            self,
+            limit=limit,
+            reversed_contents=reversed(self),
+        )
+
+    def to_str(self, limit: int | None = None) -> str:
+        """Die Anfrage liefert die Darstellung der Liste wie `write` als
+        Zeichenkette.
+        """
+        with StringIO() as buffer:
+            self.write(buffer, limit)
+            return buffer.getvalue()
+
+    def __iter__(self) -> Iterator[_NumberT]:
+        return iter(self._array)
+
+    def __reversed__(self) -> Iterator[_NumberT]:
+        return reversed(self._array)
+
+    def __contains__(self, content: object) -> bool:
+        return content in self._array
+
+    def __buffer__(self, _flags: int) -> memoryview:
+        return memoryview(self._array)
+
+    @property
+    def typecode(self) -> str:
+        """Die Anfrage liefert den Typcode der gespeicherten Zahlen."""
+        return self._array.typecode
+
+    @property
+    def itemsize(self) -> int:
+        """Die Anfrage liefert die Anzahl an Bytes, die eine Zahl belegt."""
+        return self._array.itemsize
+
+    def memoryview(self) -> memoryview:
+        """Die Anfrage liefert einen `memoryview` auf die gespeicherten Zahlen, über
+        den ohne Kopie gelesen und geschrieben werden kann.
+        """
+        return memoryview(self._array)
+
+    @property
+    def is_empty(self) -> bool:
+        """Die Anfrage liefert den Wert `True`, wenn die Liste keine Zahlen enthält,
+        sonst liefert sie den Wert `False`.
+        """
+        return not self._array
+
+    @property
+    def has_access(self) -> bool:
+        """Die Anfrage liefert den Wert `True`, wenn es ein aktuelles Objekt gibt,
+        sonst liefert sie den Wert `False`.
+        """
+        return self._current is not None
+
+    def next(self) -> None:
+        """Falls die Liste nicht leer ist, es ein aktuelles Objekt gibt und dieses
+        nicht das letzte Objekt der Liste ist, wird das dem aktuellen Objekt in
+        der Liste folgende Objekt zum aktuellen Objekt, andernfalls gibt es nach
+        Ausführung des Auftrags kein aktuelles Objekt, d. h. `has_access` liefert
+        den Wert `False`.
+        """
+        if self._current is None:
+            return
+        self._current += 1
+        if self._current == len(self._array):
+            self._current = None
+
+    def to_first(self) -> None:
+        """Falls die Liste nicht leer ist, wird das erste Objekt der Liste aktuelles
+        Objekt. Ist die Liste leer, geschieht nichts.
+        """
+        if self.is_empty:
+            return
+        self._current = 0
+
+    def to_last(self) -> None:
+        """Falls die Liste nicht leer ist, wird das letzte Objekt der Liste
+        aktuelles Objekt. Ist die Liste leer, geschieht nichts.
+        """
+        if self.is_empty:
+            return
+        self._current = len(self._array) - 1
+
+    def to_index(self, index: int) -> None:
+        """Falls `index` eine gültige Position der Liste ist (`0 <= index <
+        len(lst)`), wird das Objekt an dieser Position zum aktuellen Objekt,
+        andernfalls gibt es nach Ausführung des Auftrags kein aktuelles Objekt.
+        Der Auftrag hat eine konstante Laufzeit.
+        """
+        self._current = index if 0 <= index < len(self._array) else None
+
+    @property
+    def content(self) -> _NumberT | None:
+        """Falls es ein aktuelles Objekt gibt (`has_access is True`), wird das
+        aktuelle Objekt zurückgegeben, andernfalls (`has_access is False`) gibt
+        die Anfrage den Wert `None` zurück.
+        """
+        return self._array[self._current] if self._current is not None else None
+
+    @content.setter
+    def content(self, new_content: _NumberT | None) -> None:
+        if new_content is None or self._current is None:
+            return
+        self._array[self._current] = new_content
+
+    def insert(self, content: _NumberT | None) -> None:
+        """Falls es ein aktuelles Objekt gibt (`has_access is True`), wird eine neue
+        Zahl vor dem aktuellen Objekt in die Liste eingefügt. Das aktuelle
+        Objekt bleibt unverändert.
+
+        Wenn die Liste leer ist, wird `content` in die Liste eingefügt und es
+        gibt weiterhin kein aktuelles Objekt (`has_access is False`).
+
+        Falls es kein aktuelles Objekt gibt (`has_access is False`) und die Liste
+        nicht leer ist oder `content` `None` ist, geschieht nichts.
+        """
+        if content is None:
+            return
+
+        if self._current is not None:
+            self._array.insert(self._current, content)
+            self._current += 1
+        elif self.is_empty:
+            self._array.append(content)
+
+    def append(self, content: _NumberT | None) -> None:
+        """Falls `content` `None` ist, geschieht nichts.
+
+        Ansonsten wird eine neue Zahl `content` am Ende der Liste eingefügt.
+        Das aktuelle Objekt bleibt unverändert.
+        """
+        if content is None:
+            return
+        self._array.append(content)
+
+    def extend(self, iterable: Iterable[_NumberT | None]) -> None:
+        """Alle Zahlen aus `iterable` werden in deren Reihenfolge am Ende der Liste
+        eingefügt, wobei `None` übersprungen wird. Das aktuelle Objekt bleibt
+        unverändert.
+        """
+        self._array.extend(content for content in iterable if content is not None)
+
+    def concat(self, other_list: TypedList[_NumberT] | None) -> None:
+        """Falls es sich bei der Liste und `other_list` um dasselbe Objekt handelt,
+        `other_list` `None` oder eine leere Liste ist oder die Typcodes beider
+        Listen verschieden sind, geschieht nichts.
+
+        Ansonsten wird die Liste `other_list` an die aktuelle Liste angehängt.
+        Anschliessend wird `other_list` eine leere Liste. Das aktuelle Objekt bleibt
+        unverändert. Insbesondere bleibt `has_access` identisch.
+        """
+        if (
+            other_list is self
+            or other_list is None
+            or other_list.is_empty
+            or other_list.typecode != self.typecode
+        ):
+            return
+
+        self._array.extend(other_list._array)
+        del other_list._array[:]
+        other_list._current = None
+
+    def remove(self) -> None:
+        """Wenn die Liste leer ist oder es kein aktuelles Objekt gibt (`has_access
+        is False`), geschieht nichts.
+
+        Falls es ein aktuelles Objekt gibt (`has_access is True`), wird das
+        aktuelle Objekt gelöscht und das Objekt hinter dem gelöschten Objekt
+        wird zum aktuellen Objekt.
+
+        Wird das Objekt, das am Ende der Liste steht, gelöscht, gibt es kein
+        aktuelles Objekt mehr.
+        """
+        if self._current is None:
+            return
+
+        del self._array[self._current]
+        if self._current == len(self._array):
+            self._current = None
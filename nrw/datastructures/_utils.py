@@ -1,45 +1,173 @@
 from __future__ import annotations
 
-__all__: Final[list[str]] = ["display_binary_node"]
-
+__all__: Final[list[str]] = [
+    "display_binary_node",
+    "display_linked_node",
+    "repr_binary_node",
+    "write_linked_contents",
+]
+
+from itertools import islice
 from typing import TYPE_CHECKING, Final, TypeVar
 
+_T = TypeVar("_T")
+
 if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+
+    from _typeshed import SupportsWrite
+
+    from nrw.datastructures._avl_tree import _AVLNode
     from nrw.datastructures._binary_search_tree import _BSTNode
     from nrw.datastructures._binary_tree import _BTNode
     from nrw.datastructures._comparable_content import ComparableContentT
-
-_T = TypeVar("_T")
+    from nrw.datastructures._list import _ListNode
+    from nrw.datastructures._persistent_stack import _PersistentNode
+    from nrw.datastructures._queue import _QueueNode
+    from nrw.datastructures._stack import _StackNode
 
 
-def display_binary_node(node: _BTNode[_T] | _BSTNode[ComparableContentT]) -> str:
-    lines, *_ = _display_binary_node_impl(node)
+def display_linked_node(
+    node: _ListNode[_T] | _StackNode[_T] | _QueueNode[_T] | _PersistentNode[_T] | None,
+) -> str:
+    """Liefert die Darstellung eines Knotens samt aller Folgeknoten, ohne dabei
+    rekursiv vorzugehen.
+    """
+    parts: list[str] = []
+    while node is not None:
+        parts.append(
+            f"{node.__class__.__name__}(content={node._content!r}, next_node=",
+        )
+        node = node._next_node
+    return f"{''.join(parts)}None{')' * len(parts)}"
+
+
+def write_linked_contents(
+    file: SupportsWrite[str],
+    name: str,
+    contents: Collection[_T],
+    *,
+    limit: int | None,
+    reversed_contents: Iterable[_T] | None = None,
+) -> None:
+    """Schreibt die Darstellung einer linearen Datenstruktur schrittweise in
+    `file`.
+
+    Ist `limit` nicht `None`, werden höchstens die ersten `limit` Objekte aus
+    `contents` und, falls `reversed_contents` gegeben ist, zusätzlich die letzten
+    `limit` Objekte geschrieben, gefolgt von der Anzahl aller Objekte.
+    """
+    file.write(f"{name}(")
+    length: int = len(contents)
+    shown: int = length if reversed_contents is None else (length + 1) // 2
+    if limit is None or limit >= shown:
+        _write_joined(file, contents)
+        file.write(")")
+        return
+
+    limit = max(limit, 0)
+    _write_joined(file, islice(contents, limit))
+    if limit:
+        file.write(" -> ")
+    file.write("...")
+    if reversed_contents is not None and limit:
+        file.write(" -> ")
+        _write_joined(file, reversed(list(islice(reversed_contents, limit))))
+    file.write(f", len={length})")
+
+
+def _write_joined(file: SupportsWrite[str], contents: Iterable[_T]) -> None:
+    separator: str = ""
+    for content in contents:
+        file.write(f"{separator}{content}")
+        separator = " -> "
+
+
+def repr_binary_node(
+    node: _BTNode[_T] | _BSTNode[ComparableContentT] | _AVLNode[ComparableContentT],
+    field: str | None = None,
+) -> str:
+    """Liefert die Darstellung (`repr`) eines Knotens samt aller Teilbäume, ohne
+    dabei rekursiv vorzugehen. Ist `field` gegeben, wird nach dem Inhalt
+    zusätzlich das Attribut `_<field>` jedes Knotens dargestellt.
+    """
+    parts: list[str] = []
+    stack: list[
+        _BTNode[_T] | _BSTNode[ComparableContentT] | _AVLNode[ComparableContentT] | str
+    ] = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, str):
+            parts.append(current)
+            continue
+        parts.append(f"{current.__class__.__name__}(content={current._content!r}, ")
+        if field is not None:
+            parts.append(f"{field}={getattr(current, f'_{field}')!r}, ")
+        parts.append("left=")
+        stack.extend(
+            (
+                ")",
+                repr(None) if current._right is None else current._right,
+                ", right=",
+                repr(None) if current._left is None else current._left,
+            ),
+        )
+    return "".join(parts)
+
+
+def display_binary_node(
+    node: _BTNode[_T] | _BSTNode[ComparableContentT] | _AVLNode[ComparableContentT],
+) -> str:
+    """Liefert die Darstellung eines Baumes ab `node`, ohne dabei rekursiv
+    vorzugehen.
+
+    Die Knoten werden zunächst in Preorder gesammelt und dann rückwärts
+    verarbeitet, sodass die Teilbilder beider Kinder bereits vorliegen, wenn das
+    Bild ihres Elternknotens zusammengesetzt wird.
+    """
+    empty: tuple[list[str], int, int, int] = ([], 0, 0, 0)
+    stack: list[
+        _BTNode[_T] | _BSTNode[ComparableContentT] | _AVLNode[ComparableContentT]
+    ] = [node]
+    nodes: list[
+        _BTNode[_T] | _BSTNode[ComparableContentT] | _AVLNode[ComparableContentT]
+    ] = []
+    while stack:
+        current = stack.pop()
+        nodes.append(current)
+        if current._left is not None:
+            stack.append(current._left)
+        if current._right is not None:
+            stack.append(current._right)
+
+    boxes: dict[int, tuple[list[str], int, int, int]] = {}
+    for current in reversed(nodes):
+        boxes[id(current)] = _combine_boxes(
+            str(current._content),
+            empty if current._left is None else boxes.pop(id(current._left)),
+            empty if current._right is None else boxes.pop(id(current._right)),
+        )
+    lines, *_ = boxes[id(node)]
     return "\n".join(lines[:-1])
 
 
-def _display_binary_node_impl(  # pylint: disable=R0914
-    node: _BTNode[_T] | _BSTNode[ComparableContentT] | None,
+def _combine_boxes(  # pylint: disable=R0914
+    node_repr: str,
+    left: tuple[list[str], int, int, int],
+    right: tuple[list[str], int, int, int],
 ) -> tuple[list[str], int, int, int]:
     """Inspired by joowani.
 
     https://github.com/joowani/binarytree/blob/74e0c0bf204a0a2789c45a07264718f963db37fe/binarytree/__init__.py#L1891-L1981
     """
-    if node is None:
-        return [], 0, 0, 0
+    l_box, l_box_width, l_root_start, l_root_end = left
+    r_box, r_box_width, r_root_start, r_root_end = right
 
     line1: list[str] = []
     line2: list[str] = []
-    node_repr: str = str(node._content)
 
     new_root_width = gap_size = len(node_repr)
 
-    l_box, l_box_width, l_root_start, l_root_end = _display_binary_node_impl(
-        node._left._node,
-    )
-    r_box, r_box_width, r_root_start, r_root_end = _display_binary_node_impl(
-        node._right._node,
-    )
-
     if l_box_width > 0:
         l_root: int = (l_root_start + l_root_end) // 2 + 1
         line1.append(" " * (l_root + 1))
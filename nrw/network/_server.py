@@ -12,7 +12,7 @@ from abc import ABC, abstractmethod
 from contextlib import suppress
 from typing import TYPE_CHECKING, Final
 
-from nrw.datastructures import List
+from nrw.datastructures import ConcurrentList
 
 if sys.version_info >= (3, 12):  # pragma: >=3.12 cover
     from typing import override
@@ -208,10 +208,9 @@ class Server(ABC):
     getrennte Verbindungen können nicht reaktiviert werden.
     """
 
-    __slots__: Final[tuple[str, str, str, str]] = (
+    __slots__: Final[tuple[str, str, str]] = (
         "__weakref__",
         "_connection_handler",
-        "_lock",
         "_message_handlers",
     )
 
@@ -223,48 +222,30 @@ class Server(ABC):
         weil die Portnummer bereits belegt ist), ist keine Verbindungsaufnahme zum
         Server und kein Datenaustausch möglich.
         """
-        self._lock: threading.Lock = threading.Lock()
-        self._message_handlers: List[_ClientMessageHandler] = List()
+        self._message_handlers: ConcurrentList[_ClientMessageHandler] = ConcurrentList()
         self._connection_handler: _NewConnectionHandler = _NewConnectionHandler(
             port,
             self,
         )
 
     def _add_new_client_message_handler(self, client_socket: socket.socket) -> None:
-        with self._lock:
-            self._message_handlers.append(_ClientMessageHandler(client_socket, self))
+        self._message_handlers.append(_ClientMessageHandler(client_socket, self))
 
     def _remove_client_message_handler(
         self,
         client_message_handler: _ClientMessageHandler,
     ) -> None:
-        with self._lock:
-            self._message_handlers.to_first()
-            while self._message_handlers.has_access:
-                if client_message_handler is self._message_handlers.content:
-                    self._message_handlers.remove()
-                    return
-                self._message_handlers.next()
+        self._message_handlers.remove(client_message_handler)
 
     def _find_client_message_handler(
         self,
         client_ip: str | None,
         client_port: int,
     ) -> _ClientMessageHandler | None:
-        with self._lock:
-            self._message_handlers.to_first()
-            while self._message_handlers.has_access:
-                current_message_handler: _ClientMessageHandler | None = (
-                    self._message_handlers.content
-                )
-                assert current_message_handler is not None
-                if (
-                    current_message_handler.client_ip == client_ip
-                    and current_message_handler.client_port == client_port
-                ):
-                    return current_message_handler
-                self._message_handlers.next()
-            return None
+        return self._message_handlers.find(
+            lambda message_handler: message_handler.client_ip == client_ip
+            and message_handler.client_port == client_port,
+        )
 
     @property
     def is_open(self) -> bool:
@@ -299,11 +280,8 @@ class Server(ABC):
         dem Server verbundenen Clients gesendet. Schlägt der Versand an einen Client
         fehl, wird dieser Client übersprungen.
         """
-        with self._lock:
-            self._message_handlers.to_first()
-            while self._message_handlers.has_access:
-                self._message_handlers.content.send(message)
-                self._message_handlers.next()
+        for message_handler in self._message_handlers:
+            message_handler.send(message)
 
     def close_connection(self, client_ip: str, client_port: int) -> None:
         """Die Verbindung des Servers zu dem durch `client_ip` und `client_port`
@@ -326,19 +304,12 @@ class Server(ABC):
         diesem Zustand, geschieht nichts.
         """
         self._connection_handler.close()
-        with self._lock:
-            self._message_handlers.to_first()
-            while self._message_handlers.has_access:
-                message_handler: _ClientMessageHandler | None = (
-                    self._message_handlers.content
-                )
-                assert message_handler is not None
-                self.process_closing_connection(
-                    message_handler.client_ip,
-                    message_handler.client_port,
-                )
-                message_handler.close()
-                self._message_handlers.remove()
+        for message_handler in self._message_handlers.clear():
+            self.process_closing_connection(
+                message_handler.client_ip,
+                message_handler.client_port,
+            )
+            message_handler.close()
 
     @abstractmethod
     def process_new_connection(
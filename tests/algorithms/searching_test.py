@@ -16,9 +16,11 @@ def test_linear_search() -> None:
         lst.append(i)
 
     assert linear_search(lst, 3) == 3
-    assert lst.content == 3
-    assert linear_search(lst, 10) == 5
     assert not lst.has_access
+    assert linear_search(lst, 10) == 5
+    lst.to_last()
+    assert linear_search(lst, 0) == 0
+    assert lst.content == 4
 
 
 def test_depth_first_search_on_empty_graph() -> None:
@@ -150,5 +150,50 @@ def test_sorting_algorithm_on_unsorted_list(
     assert _have_same_elements(newly_sorted_list, unsorted_list)
 
 
+@pytest.mark.parametrize("sorting_algorithm", [merge_sort, quick_sort])
+def test_sorting_algorithm_keeps_given_list(
+    sorting_algorithm: Callable[[List[int]], List[int]],
+) -> None:
+    contents: list[int] = [(i * 7919) % 503 for i in range(500)]
+    lst: List[int] = List.from_iterable(contents)
+    nodes: set[int] = set()
+    lst.to_first()
+    while lst.has_access:
+        nodes.add(id(lst._current))
+        lst.next()
+
+    newly_sorted_list: List[int] = sorting_algorithm(lst)
+    assert list(newly_sorted_list) == sorted(contents)
+    assert list(reversed(newly_sorted_list)) == sorted(contents, reverse=True)
+    assert len(newly_sorted_list) == len(contents)
+    newly_sorted_list.to_first()
+    while newly_sorted_list.has_access:
+        assert id(newly_sorted_list._current) not in nodes
+        newly_sorted_list.next()
+
+    assert list(lst) == contents
+    assert list(reversed(lst)) == contents[::-1]
+    assert len(lst) == len(contents)
+
+
+def test_merge_sort_is_stable() -> None:
+    class _Key:
+        def __init__(self, key: int, tag: str) -> None:
+            self.key: int = key
+            self.tag: str = tag
+
+        def __lt__(self, other: _Key) -> bool:
+            return self.key < other.key
+
+        def __gt__(self, other: _Key) -> bool:
+            return self.key > other.key
+
+    contents: list[_Key] = [_Key(i % 3, str(i)) for i in range(12)]
+    newly_sorted_list: List[_Key] = merge_sort(List.from_iterable(contents))
+    assert [element.tag for element in newly_sorted_list] == [
+        element.tag for element in sorted(contents, key=lambda element: element.key)
+    ]
+
+
 if __name__ == "__main__":
     raise SystemExit(pytest.main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Tests for `datastructures._array_queue`."""
+from __future__ import annotations
+
+from io import StringIO
+
+import pytest
+
+from nrw.datastructures import ArrayQueue, List
+
+
+def test_slots_of_array_queue() -> None:
+    assert ArrayQueue.__slots__ == ("_buffer", "_head", "_length")
+
+
+def test_array_queue_is_unhashable() -> None:
+    assert ArrayQueue.__hash__ is None
+
+
+def test_capacity() -> None:
+    assert ArrayQueue().capacity == 8
+    assert ArrayQueue(2).capacity == 8
+    assert ArrayQueue(100).capacity == 100
+
+
+def test_empty_queue() -> None:
+    q: ArrayQueue[int] = ArrayQueue()
+    assert q.is_empty
+    assert q.front is None
+    assert len(q) == 0
+    q.dequeue()
+    assert q.is_empty
+
+
+def test_queue_functionality() -> None:
+    q: ArrayQueue[int] = ArrayQueue()
+    q.enqueue(1)
+    q.enqueue(None)  # type: ignore[arg-type]
+    q.enqueue(2)
+    q.enqueue(3)
+    assert len(q) == 3
+    assert q.front == 1
+    q.dequeue()
+    assert q.front == 2
+    q.dequeue()
+    q.dequeue()
+    assert q.is_empty
+    assert q.front is None
+
+
+def test_wrap_around_and_growth() -> None:
+    q: ArrayQueue[int] = ArrayQueue()
+    for i in range(6):
+        q.enqueue(i)
+    for _ in range(5):
+        q.dequeue()
+    for i in range(6, 12):
+        q.enqueue(i)
+    assert q.capacity == 8
+    assert list(q) == list(range(5, 12))
+    for i in range(12, 20):
+        q.enqueue(i)
+    assert q.capacity == 16
+    assert list(q) == list(range(5, 20))
+    assert list(reversed(q)) == list(range(19, 4, -1))
+    assert q.front == 5
+
+
+def test_enqueue_many() -> None:
+    q: ArrayQueue[int] = ArrayQueue()
+    q.enqueue(0)
+    q.dequeue()
+    q.enqueue_many([1, None, 2])
+    q.enqueue_many(range(3, 21))
+    assert q.capacity == 32
+    assert list(q) == list(range(1, 21))
+    q.enqueue_many([])
+    assert len(q) == 20
+
+
+def test_dequeue_many() -> None:
+    q: ArrayQueue[int] = ArrayQueue()
+    q.enqueue_many(range(1, 6))
+    dequeued: List[int] = q.dequeue_many(2)
+    assert str(dequeued) == "List(1 -> 2)"
+    assert q.front == 3
+    assert q.dequeue_many(-1).is_empty
+    assert str(q.dequeue_many()) == "List(3 -> 4 -> 5)"
+    assert q.is_empty
+    assert q.dequeue_many(3).is_empty
+    assert all(content is None for content in q._buffer)
+
+
+def test_iteration() -> None:
+    q: ArrayQueue[int] = ArrayQueue()
+    q.enqueue_many([1, 2, 3])
+    assert 2 in q
+    assert 42 not in q
+    assert q.front == 1
+
+
+def test_str_and_repr() -> None:
+    q: ArrayQueue[int] = ArrayQueue()
+    assert str(q) == "ArrayQueue()"
+    assert repr(q) == "ArrayQueue([])"
+    q.enqueue_many(range(1, 6))
+    assert str(q) == "ArrayQueue(1 -> 2 -> 3 -> 4 -> 5)"
+    assert q.to_str(1) == "ArrayQueue(1 -> ... -> 5, len=5)"
+    with StringIO() as buffer:
+        q.write(buffer)
+        assert buffer.getvalue() == str(q)
+    assert repr(q) == "ArrayQueue([1, 2, 3, 4, 5])"
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main())
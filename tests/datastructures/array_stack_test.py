@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Tests for `datastructures._array_stack`."""
+from __future__ import annotations
+
+from io import StringIO
+
+import pytest
+
+from nrw.datastructures import ArrayStack, List, Stack
+
+
+def test_slots_of_array_stack() -> None:
+    assert ArrayStack.__slots__ == ("_contents",)
+
+
+def test_array_stack_is_unhashable() -> None:
+    assert ArrayStack.__hash__ is None
+
+
+def test_stack_array_backed() -> None:
+    s: ArrayStack[int] = Stack.array_backed()
+    assert isinstance(s, ArrayStack)
+    assert s.is_empty
+
+
+def test_empty_stack() -> None:
+    s: ArrayStack[int] = ArrayStack()
+    assert s.is_empty
+    assert s.top is None
+    assert len(s) == 0
+    s.pop()
+    assert s.is_empty
+
+
+def test_stack_functionality() -> None:
+    s: ArrayStack[int] = ArrayStack()
+    s.push(1)
+    s.push(None)  # type: ignore[arg-type]
+    s.push(2)
+    s.push(3)
+    assert len(s) == 3
+    assert s.top == 3
+    s.pop()
+    assert s.top == 2
+    s.pop()
+    s.pop()
+    assert s.is_empty
+    assert s.top is None
+
+
+def test_push_many() -> None:
+    s: ArrayStack[int] = ArrayStack()
+    s.push(0)
+    s.push_many([1, None, 2, 3])
+    assert str(s) == "ArrayStack(3 -> 2 -> 1 -> 0)"
+    s.push_many([])
+    assert s.top == 3
+
+
+def test_pop_many() -> None:
+    s: ArrayStack[int] = ArrayStack()
+    s.push_many(range(1, 6))
+    popped: List[int] = s.pop_many(2)
+    assert str(popped) == "List(5 -> 4)"
+    assert s.top == 3
+    assert s.pop_many(-1).is_empty
+    assert str(s.pop_many()) == "List(3 -> 2 -> 1)"
+    assert s.is_empty
+    assert s.pop_many(3).is_empty
+    s.push(1)
+    assert s.pop_many(0).is_empty
+    assert s.top == 1
+
+
+def test_iteration() -> None:
+    s: ArrayStack[int] = ArrayStack()
+    s.push_many([1, 2, 3])
+    assert list(s) == [3, 2, 1]
+    assert list(reversed(s)) == [1, 2, 3]
+    assert 2 in s
+    assert 42 not in s
+
+
+def test_str_and_repr() -> None:
+    s: ArrayStack[int] = ArrayStack()
+    assert str(s) == "ArrayStack()"
+    assert repr(s) == "ArrayStack(top=None, len=0)"
+    s.push_many(range(1, 6))
+    assert s.to_str(2) == "ArrayStack(5 -> 4 -> ..., len=5)"
+    with StringIO() as buffer:
+        s.write(buffer)
+        assert buffer.getvalue() == str(s)
+    assert repr(s) == "ArrayStack(top=5, len=5)"
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main())
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Tests for `datastructures._async_container`."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from nrw.datastructures import AsyncQueue, AsyncStack
+from nrw.datastructures._async_container import AsyncContainer
+
+
+def test_slots_of_async_container() -> None:
+    assert AsyncContainer.__slots__ == ("_maxsize", "_not_empty", "_not_full")
+
+
+def test_async_container_is_unhashable() -> None:
+    assert AsyncContainer.__hash__ is None
+
+
+def test_async_container_is_abstract() -> None:
+    assert AsyncContainer.__abstractmethods__ == frozenset(
+        ("__len__", "_add", "_contents", "_remove", "_remove_many"),
+    )
+
+
+@pytest.mark.parametrize("container_type", [AsyncQueue, AsyncStack])
+def test_async_containers_share_the_base_class(container_type: type[object]) -> None:
+    assert issubclass(container_type, AsyncContainer)
+
+
+@pytest.mark.parametrize("container_type", [AsyncQueue, AsyncStack])
+def test_timeouts_return_instead_of_raising(
+    container_type: type[AsyncContainer[int]],
+) -> None:
+    async def main() -> None:
+        container: AsyncContainer[int] = container_type(1)
+        assert await container.get(timeout=0.01) is None
+        assert (await container.get_batch(2, timeout=0.01)).is_empty
+        assert await container.put(1, timeout=0.01)
+        assert not await container.put(2, timeout=0.01)
+        assert await container.put_many([3, 4], timeout=0.01) == 0
+        assert len(container) == 1
+
+    asyncio.run(main())
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Tests for `datastructures._async_queue`."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from nrw.datastructures import AsyncQueue, List
+
+
+def test_slots_of_async_queue() -> None:
+    assert AsyncQueue.__slots__ == ("_queue",)
+
+
+def test_async_queue_is_unhashable() -> None:
+    assert AsyncQueue.__hash__ is None
+
+
+def test_conditions_are_created_lazily() -> None:
+    q: AsyncQueue[int] = AsyncQueue()
+    assert q._not_empty is None
+    assert q._not_full is None
+
+    async def main() -> None:
+        await q.put(1)
+
+    asyncio.run(main())
+    assert q._not_empty is not None
+    assert q._not_full is not None
+
+
+def test_empty_queue() -> None:
+    async def main() -> None:
+        q: AsyncQueue[int] = AsyncQueue()
+        assert q.maxsize == 0
+        assert q.is_empty
+        assert not q.is_full
+        assert q.front is None
+        assert len(q) == 0
+        assert await q.get(timeout=0) is None
+        assert (await q.get_batch(3, timeout=0)).is_empty
+
+    asyncio.run(main())
+
+
+def test_put_and_get() -> None:
+    async def main() -> None:
+        q: AsyncQueue[int] = AsyncQueue()
+        assert not await q.put(None)
+        assert await q.put(1)
+        assert await q.put(2)
+        assert len(q) == 2
+        assert q.front == 1
+        assert repr(q) == "AsyncQueue(maxsize=0, contents=[1, 2])"
+        assert await q.get() == 1
+        assert await q.get() == 2
+        assert q.is_empty
+
+    asyncio.run(main())
+
+
+def test_bounded_put_times_out() -> None:
+    async def main() -> None:
+        q: AsyncQueue[int] = AsyncQueue(2)
+        assert await q.put(1)
+        assert await q.put(2)
+        assert q.is_full
+        assert not await q.put(3, timeout=0.01)
+        assert len(q) == 2
+
+    asyncio.run(main())
+
+
+def test_put_many() -> None:
+    async def main() -> None:
+        q: AsyncQueue[int] = AsyncQueue(3)
+        assert await q.put_many([1, None, 2]) == 2
+        assert await q.put_many([3, 4, 5], timeout=0.01) == 1
+        assert len(await q.get_batch(10)) == 3
+        assert await AsyncQueue[int]().put_many(range(100)) == 100
+
+    asyncio.run(main())
+
+
+def test_get_batch() -> None:
+    async def main() -> None:
+        q: AsyncQueue[int] = AsyncQueue()
+        await q.put_many(range(1, 6))
+        batch: List[int] = await q.get_batch(2)
+        assert str(batch) == "List(1 -> 2)"
+        assert (await q.get_batch(0)).is_empty
+        assert str(await q.get_batch(10)) == "List(3 -> 4 -> 5)"
+        assert q.is_empty
+
+    asyncio.run(main())
+
+
+def test_get_waits_for_producer() -> None:
+    async def main() -> None:
+        q: AsyncQueue[int] = AsyncQueue()
+
+        async def produce() -> None:
+            await asyncio.sleep(0.01)
+            await q.put(42)
+
+        producer: asyncio.Task[None] = asyncio.ensure_future(produce())
+        assert await q.get(timeout=5) == 42
+        await producer
+
+    asyncio.run(main())
+
+
+def test_put_waits_for_consumer() -> None:
+    async def main() -> None:
+        q: AsyncQueue[int] = AsyncQueue(1)
+        await q.put(1)
+
+        async def consume() -> List[int]:
+            await asyncio.sleep(0.01)
+            return await q.get_batch(1)
+
+        consumer: asyncio.Task[List[int]] = asyncio.ensure_future(consume())
+        assert await q.put(2, timeout=5)
+        assert str(await consumer) == "List(1)"
+        assert q.front == 2
+
+    asyncio.run(main())
+
+
+def test_producers_and_consumers() -> None:
+    async def main() -> list[int]:
+        q: AsyncQueue[int] = AsyncQueue(4)
+        results: list[int] = []
+
+        async def produce(start: int) -> None:
+            await q.put_many(range(start, start + 50))
+
+        async def consume() -> None:
+            for _ in range(50):
+                content: int | None = await q.get()
+                assert content is not None
+                results.append(content)
+
+        await asyncio.gather(produce(0), produce(50), consume(), consume())
+        return results
+
+    assert sorted(asyncio.run(main())) == list(range(100))
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Tests for `datastructures._async_stack`."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from nrw.datastructures import AsyncStack, List
+
+
+def test_slots_of_async_stack() -> None:
+    assert AsyncStack.__slots__ == ("_stack",)
+
+
+def test_async_stack_is_unhashable() -> None:
+    assert AsyncStack.__hash__ is None
+
+
+def test_empty_stack() -> None:
+    async def main() -> None:
+        s: AsyncStack[int] = AsyncStack()
+        assert s.maxsize == 0
+        assert s.is_empty
+        assert not s.is_full
+        assert s.top is None
+        assert len(s) == 0
+        assert await s.get(timeout=0) is None
+        assert (await s.get_batch(3, timeout=0)).is_empty
+
+    asyncio.run(main())
+
+
+def test_put_and_get() -> None:
+    async def main() -> None:
+        s: AsyncStack[int] = AsyncStack()
+        assert not await s.put(None)
+        assert await s.put(1)
+        assert await s.put(2)
+        assert len(s) == 2
+        assert s.top == 2
+        assert repr(s) == "AsyncStack(maxsize=0, contents=[2, 1])"
+        assert await s.get() == 2
+        assert await s.get() == 1
+        assert s.is_empty
+
+    asyncio.run(main())
+
+
+def test_bounded_put_times_out() -> None:
+    async def main() -> None:
+        s: AsyncStack[int] = AsyncStack(2)
+        assert await s.put_many([1, 2, 3], timeout=0.01) == 2
+        assert s.is_full
+        assert not await s.put(3, timeout=0.01)
+        assert s.top == 2
+
+    asyncio.run(main())
+
+
+def test_get_batch() -> None:
+    async def main() -> None:
+        s: AsyncStack[int] = AsyncStack()
+        await s.put_many(range(1, 6))
+        batch: List[int] = await s.get_batch(2)
+        assert str(batch) == "List(5 -> 4)"
+        assert str(await s.get_batch(10)) == "List(3 -> 2 -> 1)"
+        assert s.is_empty
+
+    asyncio.run(main())
+
+
+def test_get_waits_for_producer() -> None:
+    async def main() -> None:
+        s: AsyncStack[int] = AsyncStack()
+
+        async def produce() -> None:
+            await asyncio.sleep(0.01)
+            await s.put(42)
+
+        producer: asyncio.Task[None] = asyncio.ensure_future(produce())
+        assert await s.get(timeout=5) == 42
+        await producer
+
+    asyncio.run(main())
+
+
+def test_put_waits_for_consumer() -> None:
+    async def main() -> None:
+        s: AsyncStack[int] = AsyncStack(1)
+        await s.put(1)
+
+        async def consume() -> int | None:
+            await asyncio.sleep(0.01)
+            return await s.get()
+
+        consumer: asyncio.Task[int | None] = asyncio.ensure_future(consume())
+        assert await s.put(2, timeout=5)
+        assert await consumer == 1
+        assert s.top == 2
+
+    asyncio.run(main())
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main())
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Tests for `datastructures._avl_tree`."""
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from nrw.datastructures import AVLTree, BinarySearchTree
+from nrw.datastructures._avl_tree import _AVLNode
+
+
+def _assert_balanced(node: _AVLNode[int] | None) -> int:
+    """Prüft die Höhen, die Anzahlen, die Balance und die Ordnung und liefert die
+    Höhe.
+    """
+    if node is None:
+        return 0
+    left_height: int = _assert_balanced(node._left)
+    right_height: int = _assert_balanced(node._right)
+    assert abs(left_height - right_height) <= 1
+    assert node._height == 1 + max(left_height, right_height)
+    assert node._size == 1 + sum(
+        child._size for child in (node._left, node._right) if child is not None
+    )
+    if node._left is not None:
+        assert node._left._content < node._content
+    if node._right is not None:
+        assert node._right._content > node._content
+    return node._height
+
+
+@pytest.fixture
+def sample_tree() -> AVLTree[int]:
+    tree: AVLTree[int] = AVLTree()
+    for i in range(1, 8):
+        tree.insert(i)
+    return tree
+
+
+def test_avlnode_slots() -> None:
+    assert _AVLNode.__slots__ == (
+        "_content",
+        "_height",
+        "_left",
+        "_right",
+        "_size",
+    )
+
+
+def test_avlnode_is_unhashable() -> None:
+    assert _AVLNode.__hash__ is None
+
+
+def test_avlnode_construction() -> None:
+    node: _AVLNode[int] = _AVLNode(1)
+    assert node._content == 1
+    assert node._height == 1
+    assert node._size == 1
+    assert node._left is None
+    assert node._right is None
+
+
+def test_repr_of_avlnode() -> None:
+    assert repr(_AVLNode(1)) == "_AVLNode(content=1, height=1, left=None, right=None)"
+
+
+def test_avl_tree_slots() -> None:
+    assert AVLTree.__slots__ == ("_is_left", "_node", "_parent")
+
+
+def test_avl_tree_is_unhashable() -> None:
+    assert AVLTree.__hash__ is None
+
+
+def test_balanced_factory() -> None:
+    tree: AVLTree[int] = BinarySearchTree.balanced()
+    assert isinstance(tree, AVLTree)
+    assert tree.is_empty
+
+
+def test_empty_tree() -> None:
+    tree: AVLTree[int] = AVLTree()
+    assert tree.is_empty
+    assert tree.height == 0
+    assert tree.content is None
+    assert tree.left_tree is None
+    assert tree.right_tree is None
+    assert tree.search(1) is None
+    assert str(tree) == ""
+    assert repr(tree) == "AVLTree(node=None)"
+    tree.remove(1)
+    assert tree.is_empty
+
+
+def test_sorted_inserts_are_balanced(sample_tree: AVLTree[int]) -> None:
+    assert sample_tree.height == 3
+    assert sample_tree.content == 4
+    assert sample_tree.left_tree is not None
+    assert sample_tree.left_tree.content == 2
+    assert sample_tree.right_tree is not None
+    assert sample_tree.right_tree.content == 6
+    assert str(sample_tree) == (
+        "    __4__    \n   /     \\   \n  2       6  \n / \\     / \\ \n1   3   5   7"
+    )
+    _assert_balanced(sample_tree._node)
+
+
+def test_dunder_methods(sample_tree: AVLTree[int]) -> None:
+    assert len(sample_tree) == 7
+    assert list(sample_tree) == [1, 2, 3, 4, 5, 6, 7]
+    assert list(reversed(sample_tree)) == [7, 6, 5, 4, 3, 2, 1]
+    assert 5 in sample_tree
+    assert 8 not in sample_tree
+    assert None not in sample_tree
+
+
+def test_insert_ignores_none_and_duplicates(sample_tree: AVLTree[int]) -> None:
+    sample_tree.insert(None)
+    sample_tree.insert(4)
+    assert list(sample_tree) == [1, 2, 3, 4, 5, 6, 7]
+
+
+def test_search(sample_tree: AVLTree[int]) -> None:
+    for i in range(1, 8):
+        assert sample_tree.search(i) == i
+    assert sample_tree.search(0) is None
+    assert sample_tree.search(None) is None
+
+
+@pytest.mark.parametrize("content", [1, 4, 6, 7])
+def test_remove(sample_tree: AVLTree[int], content: int) -> None:
+    sample_tree.remove(content)
+    assert content not in sample_tree
+    assert len(sample_tree) == 6
+    _assert_balanced(sample_tree._node)
+
+
+def test_remove_does_nothing(sample_tree: AVLTree[int]) -> None:
+    sample_tree.remove(None)
+    sample_tree.remove(8)
+    assert len(sample_tree) == 7
+
+
+def test_remove_rebalances() -> None:
+    tree: AVLTree[int] = AVLTree()
+    for i in (2, 1, 3, 4):
+        tree.insert(i)
+    tree.remove(1)
+    assert tree.content == 3
+    assert tree.height == 2
+    _assert_balanced(tree._node)
+
+
+def test_many_sequential_keys_keep_logarithmic_height() -> None:
+    tree: AVLTree[int] = AVLTree()
+    count: int = 10_000
+    for i in range(count):
+        tree.insert(i)
+    assert tree.height <= 1.44 * math.log2(count + 2)
+    assert tree.search(count - 1) == count - 1
+    for i in range(0, count, 2):
+        tree.remove(i)
+    assert list(tree) == list(range(1, count, 2))
+    assert tree.height <= 1.44 * math.log2(count // 2 + 2)
+
+
+def test_random_operations_keep_invariants() -> None:
+    rng: random.Random = random.Random(17)
+    tree: AVLTree[int] = AVLTree()
+    reference: set[int] = set()
+    for _ in range(2000):
+        content: int = rng.randrange(200)
+        if rng.random() < 0.6:
+            tree.insert(content)
+            reference.add(content)
+        else:
+            tree.remove(content)
+            reference.discard(content)
+    assert list(tree) == sorted(reference)
+    _assert_balanced(tree._node)
+
+
+def test_changes_through_subtrees_rebalance_the_whole_tree(
+    sample_tree: AVLTree[int],
+) -> None:
+    right_tree: AVLTree[int] | None = sample_tree.right_tree
+    assert right_tree is not None
+    for i in range(8, 20):
+        right_tree.insert(i)
+        _assert_balanced(sample_tree._node)
+        assert len(sample_tree) == i
+    assert list(sample_tree) == list(range(1, 20))
+
+    left_tree: AVLTree[int] | None = sample_tree.left_tree
+    assert left_tree is not None
+    for i in (1, 2, 3):
+        left_tree.remove(i)
+        _assert_balanced(sample_tree._node)
+    assert list(sample_tree) == list(range(4, 20))
+    assert len(sample_tree) == 16
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main())
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Tests for `datastructures._b_tree`."""
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from nrw.datastructures import BTree
+from nrw.datastructures._b_tree import _BTreeNode
+
+
+def _assert_valid(btree: BTree[int]) -> None:
+    """Prüft Ordnung, Füllgrad und gleiche Tiefe aller Blätter."""
+    depths: set[int] = set()
+    degree: int = btree.degree
+    stack: list[tuple[_BTreeNode[int], int, int | None, int | None]] = [
+        (btree._root, 1, None, None),
+    ]
+    while stack:
+        node, depth, low, high = stack.pop()
+        assert node._contents == sorted(node._contents)
+        assert len(node._contents) <= 2 * degree - 1
+        if node is not btree._root:
+            assert len(node._contents) >= degree - 1
+        assert all(low is None or low < content for content in node._contents)
+        assert all(high is None or content < high for content in node._contents)
+        if not node._children:
+            depths.add(depth)
+            continue
+        assert len(node._children) == len(node._contents) + 1
+        bounds: list[int | None] = [low, *node._contents, high]
+        for index, child in enumerate(node._children):
+            stack.append((child, depth + 1, bounds[index], bounds[index + 1]))
+    assert len(depths) == 1
+    assert sum(1 for _ in btree) == len(btree)
+
+
+@pytest.fixture
+def sample_tree() -> BTree[int]:
+    tree: BTree[int] = BTree(2)
+    for content in range(20):
+        tree.insert(content)
+    return tree
+
+
+def test_btree_node_slots() -> None:
+    assert _BTreeNode.__slots__ == ("_children", "_contents")
+
+
+def test_btree_node_is_unhashable() -> None:
+    assert _BTreeNode.__hash__ is None
+
+
+def test_repr_of_btree_node() -> None:
+    assert repr(_BTreeNode([1, 2], [])) == "_BTreeNode(contents=[1, 2], children=[])"
+
+
+def test_btree_slots() -> None:
+    assert BTree.__slots__ == ("_degree", "_length", "_root")
+
+
+def test_btree_is_unhashable() -> None:
+    assert BTree.__hash__ is None
+
+
+def test_repr_of_btree() -> None:
+    tree: BTree[int] = BTree(2)
+    assert repr(tree) == "BTree(degree=2, root=_BTreeNode(contents=[], children=[]))"
+    tree.insert(1)
+    assert repr(tree) == "BTree(degree=2, root=_BTreeNode(contents=[1], children=[]))"
+
+
+def test_degree_of_btree() -> None:
+    assert BTree().degree == 16
+    assert BTree(4).degree == 4
+    assert BTree(1).degree == 2
+    assert BTree(-3).degree == 2
+
+
+def test_empty_btree() -> None:
+    tree: BTree[int] = BTree()
+    assert tree.is_empty
+    assert len(tree) == 0
+    assert tree.height == 0
+    assert tree.min is None
+    assert tree.max is None
+    assert tree.search(1) is None
+    assert 1 not in tree
+    assert not list(tree)
+    assert not list(reversed(tree))
+    assert not list(tree.range(0, 10))
+    tree.remove(1)
+    assert tree.is_empty
+
+
+def test_insert_into_btree(sample_tree: BTree[int]) -> None:
+    assert not sample_tree.is_empty
+    assert len(sample_tree) == 20
+    assert list(sample_tree) == list(range(20))
+    assert list(reversed(sample_tree)) == list(range(19, -1, -1))
+    assert sample_tree.height > 1
+    assert sample_tree.min == 0
+    assert sample_tree.max == 19
+    _assert_valid(sample_tree)
+
+
+def test_insert_none_or_duplicate(sample_tree: BTree[int]) -> None:
+    sample_tree.insert(None)
+    sample_tree.insert(5)
+    assert len(sample_tree) == 20
+    assert list(sample_tree) == list(range(20))
+    _assert_valid(sample_tree)
+
+
+def test_search_in_btree(sample_tree: BTree[int]) -> None:
+    assert sample_tree.search(7) == 7
+    assert sample_tree.search(20) is None
+    assert sample_tree.search(-1) is None
+    assert sample_tree.search(None) is None
+    assert 7 in sample_tree
+    assert None not in sample_tree
+    assert 42 not in sample_tree
+
+
+def test_remove_from_btree(sample_tree: BTree[int]) -> None:
+    sample_tree.remove(None)
+    sample_tree.remove(42)
+    assert len(sample_tree) == 20
+
+    for content in (10, 0, 19, 5, 6, 7):
+        sample_tree.remove(content)
+        assert content not in sample_tree
+        _assert_valid(sample_tree)
+    assert len(sample_tree) == 14
+
+    for content in range(20):
+        sample_tree.remove(content)
+    assert sample_tree.is_empty
+    assert sample_tree.height == 0
+    _assert_valid(sample_tree)
+
+
+@pytest.mark.parametrize("degree", [2, 3, 5, 16])
+def test_random_operations_keep_btree_valid(degree: int) -> None:
+    rng: random.Random = random.Random(degree)
+    tree: BTree[int] = BTree(degree)
+    reference: set[int] = set()
+    for _ in range(3000):
+        content: int = rng.randrange(500)
+        if rng.random() < 0.6:
+            tree.insert(content)
+            reference.add(content)
+        else:
+            tree.remove(content)
+            reference.discard(content)
+        assert len(tree) == len(reference)
+    _assert_valid(tree)
+    assert list(tree) == sorted(reference)
+
+
+def test_height_of_btree_is_logarithmic() -> None:
+    tree: BTree[int] = BTree(16)
+    for content in range(10_000):
+        tree.insert(content)
+    assert tree.height <= 1 + math.log((len(tree) + 1) / 2, tree.degree)
+    _assert_valid(tree)
+
+
+def test_range_of_btree(sample_tree: BTree[int]) -> None:
+    assert list(sample_tree.range()) == list(range(20))
+    assert list(sample_tree.range(5, 9)) == [5, 6, 7, 8, 9]
+    assert list(sample_tree.range(low=15)) == [15, 16, 17, 18, 19]
+    assert list(sample_tree.range(high=3)) == [0, 1, 2, 3]
+    assert list(sample_tree.range(-5, 0)) == [0]
+    assert not list(sample_tree.range(9, 5))
+    assert not list(sample_tree.range(20, 30))
+
+
+def test_range_of_btree_is_lazy() -> None:
+    tree: BTree[int] = BTree.from_sorted(range(0, 2000, 2), 4)
+    contents = tree.range(100)
+    assert next(contents) == 100
+    assert next(contents) == 102
+    assert list(tree.range(101, 107)) == [102, 104, 106]
+
+
+@pytest.mark.parametrize("count", [0, 1, 3, 4, 7, 8, 100, 1234])
+@pytest.mark.parametrize("degree", [2, 3, 16])
+def test_from_sorted(count: int, degree: int) -> None:
+    tree: BTree[int] = BTree.from_sorted(range(count), degree)
+    assert tree.degree == degree
+    assert len(tree) == count
+    assert list(tree) == list(range(count))
+    _assert_valid(tree)
+
+    tree.insert(count)
+    tree.remove(0)
+    assert list(tree) == list(range(1, count + 1))
+    _assert_valid(tree)
+
+
+def test_from_sorted_skips_none_and_duplicates() -> None:
+    tree: BTree[int] = BTree.from_sorted([1, None, 1, 2, 2, 3])
+    assert list(tree) == [1, 2, 3]
+    assert len(tree) == 3
+
+
+def test_from_sorted_with_unsorted_input() -> None:
+    tree: BTree[int] = BTree.from_sorted([1, 5, 3, None, 2, 5, 4], 2)
+    assert list(tree) == [1, 2, 3, 4, 5]
+    _assert_valid(tree)
+
+
+def test_from_iterable() -> None:
+    contents: list[int] = list(range(500))
+    random.Random(25).shuffle(contents)
+    tree: BTree[int] = BTree.from_iterable([*contents, None, 3], 3)
+    assert list(tree) == list(range(500))
+    assert tree.degree == 3
+    _assert_valid(tree)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main())
@@ -2,6 +2,9 @@
 """Tests for `datastructures._binary_search_tree`."""
 from __future__ import annotations
 
+import random
+import sys
+
 import pytest
 
 from nrw.datastructures import BinarySearchTree
@@ -17,13 +20,14 @@ def empty_bst() -> BinarySearchTree[int]:
 def sample_bst() -> BinarySearchTree[int]:
     bst: BinarySearchTree[int] = BinarySearchTree()
     bst._node = _BSTNode(1)
-    bst._node._left._node = _BSTNode(0)
-    bst._node._right._node = _BSTNode(2)
+    bst._node._left = _BSTNode(0)
+    bst._node._right = _BSTNode(2)
+    bst._node._size = 3
     return bst
 
 
 def test_bstnode_slots() -> None:
-    assert _BSTNode.__slots__ == ("_content", "_left", "_right")
+    assert _BSTNode.__slots__ == ("_content", "_left", "_right", "_size")
 
 
 def test_bstnode_is_unhashable() -> None:
@@ -37,10 +41,7 @@ def test_str_of_bstnode() -> None:
 
 def test_repr_of_bstnode() -> None:
     node: _BSTNode[int] = _BSTNode(1)
-    assert (
-        repr(node) == "_BSTNode(content=1, left_tree=BinarySearchTree(node=None), "
-        "right_tree=BinarySearchTree(node=None))"
-    )
+    assert repr(node) == "_BSTNode(content=1, size=1, left=None, right=None)"
 
 
 def test_bstnode_construction() -> None:
@@ -48,15 +49,13 @@ def test_bstnode_construction() -> None:
 
     assert node._content == 1
 
-    assert isinstance(node._left, BinarySearchTree)
-    assert node._left.is_empty
-
-    assert isinstance(node._right, BinarySearchTree)
-    assert node._right.is_empty
+    assert node._left is None
+    assert node._right is None
+    assert node._size == 1
 
 
 def test_bst_slots() -> None:
-    assert BinarySearchTree.__slots__ == ("_node",)
+    assert BinarySearchTree.__slots__ == ("_is_left", "_node", "_parent")
 
 
 def test_bst_is_unhashable() -> None:
@@ -83,12 +82,9 @@ def test_repr_of_bst() -> None:
     tree.insert(0)
     tree.insert(2)
     assert (
-        repr(tree)
-        == "BinarySearchTree(node=_BSTNode(content=1, left_tree=BinarySearchTree("
-        "node=_BSTNode(content=0, left_tree=BinarySearchTree(node=None), "
-        "right_tree=BinarySearchTree(node=None))), "
-        "right_tree=BinarySearchTree(node=_BSTNode(content=2, left_tree="
-        "BinarySearchTree(node=None), right_tree=BinarySearchTree(node=None)))))"
+        repr(tree) == "BinarySearchTree(node=_BSTNode(content=1, size=3, "
+        "left=_BSTNode(content=0, size=1, left=None, right=None), "
+        "right=_BSTNode(content=2, size=1, left=None, right=None)))"
     )
 
 
@@ -314,35 +310,339 @@ def test_remove_none(sample_bst: BinarySearchTree[int]) -> None:
     assert sample_bst.right_tree.right_tree.is_empty
 
 
-def test_ancestor_of_small_right_raises_type_error_on_empty_bst(
+def test_iteration_over_bst(sample_bst: BinarySearchTree[int]) -> None:
+    sample_bst.insert(5)
+    sample_bst.insert(3)
+    sample_bst.insert(-1)
+    assert list(sample_bst) == [-1, 0, 1, 2, 3, 5]
+    assert list(reversed(sample_bst)) == [5, 3, 2, 1, 0, -1]
+    assert len(sample_bst) == 6
+
+
+def test_iteration_over_empty_bst(empty_bst: BinarySearchTree[int]) -> None:
+    assert not list(empty_bst)
+    assert len(empty_bst) == 0
+    assert 1 not in empty_bst
+
+
+def test_contains_on_bst(sample_bst: BinarySearchTree[int]) -> None:
+    assert 0 in sample_bst
+    assert 2 in sample_bst
+    assert 42 not in sample_bst
+    assert None not in sample_bst
+
+
+def test_operations_on_degenerate_bst_are_not_limited_by_recursion(
     empty_bst: BinarySearchTree[int],
 ) -> None:
-    with pytest.raises(AttributeError):
-        empty_bst._ancestor_of_small_right()
+    count: int = sys.getrecursionlimit() + 100
+    for i in range(count):
+        empty_bst.insert(i)
+    empty_bst.insert(count - 1)
+
+    assert empty_bst.search(count - 1) == count - 1
+    assert empty_bst.search(count) is None
+    assert count - 1 in empty_bst
+    assert str(empty_bst).count("\n") == 2 * count - 2
+    assert repr(empty_bst).count("_BSTNode(") == count
+
+    empty_bst.remove(count - 1)
+    empty_bst.remove(0)
+    assert empty_bst.search(count - 1) is None
+    assert empty_bst.content == 1
+    assert len(empty_bst) == count - 2
 
 
-def test_ancestor_of_small_right_on_non_empty_tree(
-    sample_bst: BinarySearchTree[int],
+def test_remove_node_whose_successor_has_a_right_successor(
+    empty_bst: BinarySearchTree[int],
 ) -> None:
-    assert sample_bst._ancestor_of_small_right() is sample_bst
+    for i in (5, 2, 10, 8, 12, 6, 7):
+        empty_bst.insert(i)
+
+    empty_bst.remove(5)
+    assert empty_bst.content == 6
+    assert empty_bst.right_tree.left_tree.content == 8
+    assert empty_bst.right_tree.left_tree.left_tree.content == 7
+    assert list(empty_bst) == [2, 6, 7, 8, 10, 12]
+
+
+def _height(tree: BinarySearchTree[int]) -> int:
+    height: int = 0
+    level: list[_BSTNode[int]] = [tree._node] if tree._node is not None else []
+    while level:
+        level = [
+            subtree
+            for node in level
+            for subtree in (node._left, node._right)
+            if subtree is not None
+        ]
+        height += 1
+    return height
+
+
+def test_from_sorted() -> None:
+    tree: BinarySearchTree[int] = BinarySearchTree.from_sorted(range(1, 8))
+    assert tree.content == 4
+    assert tree.left_tree.content == 2
+    assert tree.right_tree.content == 6
+    assert list(tree) == [1, 2, 3, 4, 5, 6, 7]
+    assert _height(tree) == 3
+    assert str(tree) == (
+        "    __4__    \n   /     \\   \n  2       6  \n / \\     / \\ \n1   3   5   7"
+    )
 
-    sample_bst.insert(-1)
-    sample_bst.insert(-2)
-    assert sample_bst._ancestor_of_small_right().content == -1
+
+def test_from_sorted_skips_none_and_duplicates() -> None:
+    tree: BinarySearchTree[int] = BinarySearchTree.from_sorted(
+        [None, 1, 1, 2, None, 3, 3],
+    )
+    assert list(tree) == [1, 2, 3]
+    assert tree.content == 2
 
 
-def test_node_of_left_successor(sample_bst: BinarySearchTree[int]) -> None:
-    sample_bst.insert(1)
-    sample_bst.insert(0)
-    assert sample_bst._node_of_left_successor is sample_bst.left_tree._node
-    assert sample_bst._node_of_left_successor._content == 0
+def test_from_sorted_with_empty_iterable() -> None:
+    tree: BinarySearchTree[int] = BinarySearchTree.from_sorted([])
+    assert tree.is_empty
 
 
-def test_node_of_right_successor(sample_bst: BinarySearchTree[int]) -> None:
-    sample_bst.insert(1)
-    sample_bst.insert(2)
-    assert sample_bst._node_of_right_successor is sample_bst.right_tree._node
-    assert sample_bst._node_of_right_successor._content == 2
+def test_from_sorted_falls_back_to_sorting_unsorted_input() -> None:
+    tree: BinarySearchTree[int] = BinarySearchTree.from_sorted([1, 2, 5, 3, 4, 2])
+    assert list(tree) == [1, 2, 3, 4, 5]
+    assert tree.content == 3
+
+
+def test_from_iterable() -> None:
+    tree: BinarySearchTree[int] = BinarySearchTree.from_iterable(
+        [5, None, 3, 1, 4, 1, 2, 5],
+    )
+    assert list(tree) == [1, 2, 3, 4, 5]
+    assert tree.content == 3
+    assert _height(tree) == 3
+
+
+def test_from_iterable_builds_optimal_height() -> None:
+    count: int = 10_000
+    tree: BinarySearchTree[int] = BinarySearchTree.from_iterable(
+        reversed(range(count)),
+    )
+    assert len(tree) == count
+    assert _height(tree) == count.bit_length()
+    assert tree.search(count - 1) == count - 1
+
+
+@pytest.fixture
+def ordered_bst() -> BinarySearchTree[int]:
+    return BinarySearchTree.from_sorted(range(0, 20, 2))
+
+
+def test_min_and_max(
+    empty_bst: BinarySearchTree[int],
+    ordered_bst: BinarySearchTree[int],
+) -> None:
+    assert empty_bst.min is None
+    assert empty_bst.max is None
+    assert ordered_bst.min == 0
+    assert ordered_bst.max == 18
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        (-1, (None, 0, None, 0)),
+        (0, (0, 0, None, 2)),
+        (7, (6, 8, 6, 8)),
+        (8, (8, 8, 6, 10)),
+        (18, (18, 18, 16, None)),
+        (19, (18, None, 18, None)),
+    ],
+)
+def test_neighbour_queries(
+    ordered_bst: BinarySearchTree[int],
+    content: int,
+    expected: tuple[int | None, int | None, int | None, int | None],
+) -> None:
+    assert (
+        ordered_bst.floor(content),
+        ordered_bst.ceiling(content),
+        ordered_bst.predecessor(content),
+        ordered_bst.successor(content),
+    ) == expected
+
+
+def test_neighbour_queries_with_none(ordered_bst: BinarySearchTree[int]) -> None:
+    assert ordered_bst.floor(None) is None
+    assert ordered_bst.ceiling(None) is None
+    assert ordered_bst.predecessor(None) is None
+    assert ordered_bst.successor(None) is None
+
+
+def test_neighbour_queries_on_empty_bst(empty_bst: BinarySearchTree[int]) -> None:
+    assert empty_bst.floor(1) is None
+    assert empty_bst.ceiling(1) is None
+    assert empty_bst.predecessor(1) is None
+    assert empty_bst.successor(1) is None
+
+
+@pytest.mark.parametrize(
+    ("low", "high", "expected"),
+    [
+        (None, None, list(range(0, 20, 2))),
+        (5, 11, [6, 8, 10]),
+        (6, 10, [6, 8, 10]),
+        (None, 3, [0, 2]),
+        (15, None, [16, 18]),
+        (7, 7, []),
+        (11, 5, []),
+        (20, None, []),
+    ],
+)
+def test_range(
+    ordered_bst: BinarySearchTree[int],
+    low: int | None,
+    high: int | None,
+    expected: list[int],
+) -> None:
+    assert list(ordered_bst.range(low, high)) == expected
+
+
+def test_range_on_empty_bst(empty_bst: BinarySearchTree[int]) -> None:
+    assert not list(empty_bst.range(0, 10))
+
+
+def test_range_is_lazy() -> None:
+    compared: list[int] = []
+
+    class Key:
+        """Vergleichbarer Schlüssel, der jeden Vergleich in `compared` festhält."""
+
+        def __init__(self, value: int) -> None:
+            self.value: int = value
+
+        def __lt__(self, other: Key) -> bool:
+            compared.append(self.value)
+            return self.value < other.value
+
+        def __gt__(self, other: Key) -> bool:
+            compared.append(self.value)
+            return self.value > other.value
+
+        def __eq__(self, other: object) -> bool:
+            return isinstance(other, Key) and self.value == other.value
+
+    tree: BinarySearchTree[Key] = BinarySearchTree.from_sorted(
+        Key(i) for i in range(1024)
+    )
+    compared.clear()
+    window = tree.range(Key(500), Key(504))
+    assert not compared
+    assert [key.value for key in window] == [500, 501, 502, 503, 504]
+    assert len(compared) < 40
+
+
+def _assert_sizes(node: _BSTNode[int] | None) -> int:
+    if node is None:
+        return 0
+    size: int = 1 + _assert_sizes(node._left) + _assert_sizes(node._right)
+    assert node._size == size
+    return size
+
+
+def test_sizes_are_maintained(empty_bst: BinarySearchTree[int]) -> None:
+    rng: random.Random = random.Random(23)
+    reference: set[int] = set()
+    for _ in range(3000):
+        content: int = rng.randrange(300)
+        if rng.random() < 0.6:
+            empty_bst.insert(content)
+            reference.add(content)
+        else:
+            empty_bst.remove(content)
+            reference.discard(content)
+        assert len(empty_bst) == len(reference)
+    _assert_sizes(empty_bst._node)
+    assert list(empty_bst) == sorted(reference)
+
+
+def test_sizes_of_bulk_loaded_bst() -> None:
+    tree: BinarySearchTree[int] = BinarySearchTree.from_iterable(range(100))
+    assert len(tree) == 100
+    assert tree.left_tree is not None
+    assert len(tree.left_tree) == 50
+    _assert_sizes(tree._node)
+
+
+def test_changes_through_subtrees(empty_bst: BinarySearchTree[int]) -> None:
+    for content in (4, 2, 6):
+        empty_bst.insert(content)
+    left_tree: BinarySearchTree[int] | None = empty_bst.left_tree
+    assert left_tree is not None
+    left_tree.insert(1)
+    left_tree.insert(3)
+    assert list(empty_bst) == [1, 2, 3, 4, 6]
+    assert len(empty_bst) == 5
+
+    left_tree.remove(2)
+    assert list(empty_bst) == [1, 3, 4, 6]
+    assert len(empty_bst) == 4
+    _assert_sizes(empty_bst._node)
+
+    right_tree: BinarySearchTree[int] | None = empty_bst.right_tree
+    assert right_tree is not None
+    right_tree.remove(6)
+    assert right_tree.is_empty
+    right_tree.insert(5)
+    assert list(empty_bst) == [1, 3, 4, 5]
+    _assert_sizes(empty_bst._node)
+    first_left_tree: BinarySearchTree[int] | None = empty_bst.left_tree
+    assert first_left_tree is not empty_bst.left_tree
+
+
+def test_rank(ordered_bst: BinarySearchTree[int]) -> None:
+    assert ordered_bst.rank(-1) == 0
+    assert ordered_bst.rank(0) == 0
+    assert ordered_bst.rank(1) == 1
+    assert ordered_bst.rank(8) == 4
+    assert ordered_bst.rank(9) == 5
+    assert ordered_bst.rank(100) == 10
+    assert ordered_bst.rank(None) == 0
+
+
+def test_select(ordered_bst: BinarySearchTree[int]) -> None:
+    assert [ordered_bst.select(i) for i in range(10)] == list(range(0, 20, 2))
+    assert ordered_bst.select(-1) is None
+    assert ordered_bst.select(10) is None
+    for i in range(10):
+        assert ordered_bst.rank(ordered_bst.select(i)) == i
+
+
+def test_rank_and_select_on_empty_bst(empty_bst: BinarySearchTree[int]) -> None:
+    assert empty_bst.rank(1) == 0
+    assert empty_bst.select(0) is None
+    assert empty_bst.count_between(0, 10) == 0
+
+
+@pytest.mark.parametrize(
+    ("low", "high"),
+    [
+        (None, None),
+        (5, 11),
+        (6, 10),
+        (None, 3),
+        (15, None),
+        (7, 7),
+        (8, 8),
+        (11, 5),
+        (20, None),
+    ],
+)
+def test_count_between(
+    ordered_bst: BinarySearchTree[int],
+    low: int | None,
+    high: int | None,
+) -> None:
+    assert ordered_bst.count_between(low, high) == len(
+        list(ordered_bst.range(low, high)),
+    )
 
 
 if __name__ == "__main__":
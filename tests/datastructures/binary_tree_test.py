@@ -19,25 +19,20 @@ def test_btnode_is_unhashable() -> None:
 def test_str_of_btnode() -> None:
     btnode: _BTNode[int] = _BTNode(1)
     assert str(btnode) == "1"
-    btnode._left = BinaryTree(0)  # type: ignore[assignment]
-    btnode._right = BinaryTree(2)  # type: ignore[assignment]
+    btnode._left = _BTNode(0)
+    btnode._right = _BTNode(2)
     assert str(btnode) == "  1  \n / \\ \n0   2"
 
 
 def test_repr_of_btnode() -> None:
     btnode: _BTNode[int] = _BTNode(1)
-    assert (
-        repr(btnode) == "_BTNode(content=1, left_tree=BinaryTree(node=None), "
-        "right_tree=BinaryTree(node=None))"
-    )
-    btnode._left = BinaryTree(0)  # type: ignore[assignment]
-    btnode._right = BinaryTree(2)  # type: ignore[assignment]
+    assert repr(btnode) == "_BTNode(content=1, left=None, right=None)"
+    btnode._left = _BTNode(0)
+    btnode._right = _BTNode(2)
     assert (
         repr(btnode)
-        == "_BTNode(content=1, left_tree=BinaryTree(node=_BTNode(content=0, "
-        "left_tree=BinaryTree(node=None), right_tree=BinaryTree(node=None))), "
-        "right_tree=BinaryTree(node=_BTNode(content=2, left_tree=BinaryTree(node=None),"
-        " right_tree=BinaryTree(node=None))))"
+        == "_BTNode(content=1, left=_BTNode(content=0, left=None, right=None), "
+        "right=_BTNode(content=2, left=None, right=None))"
     )
 
 
@@ -46,19 +41,12 @@ def test_btnode() -> None:
 
     assert node._content == 42
 
-    assert isinstance(node._left, BinaryTree)
-    assert node._left.content is None
-    assert node._left.left_tree is None
-    assert node._left.right_tree is None
-
-    assert isinstance(node._right, BinaryTree)
-    assert node._right.content is None
-    assert node._right.left_tree is None
-    assert node._right.right_tree is None
+    assert node._left is None
+    assert node._right is None
 
 
 def test_slots_of_binary_tree() -> None:
-    assert BinaryTree.__slots__ == ("_node",)
+    assert BinaryTree.__slots__ == ("_is_left", "_node", "_parent")
 
 
 def test_binary_tree_is_unhashable() -> None:
@@ -73,11 +61,9 @@ def test_repr_of_binary_tree() -> None:
     tree.left_tree = BinaryTree(0)
     tree.right_tree = BinaryTree(2)
     assert (
-        repr(tree) == "BinaryTree(node=_BTNode(content=1, left_tree=BinaryTree("
-        "node=_BTNode(content=0, left_tree=BinaryTree(node=None), "
-        "right_tree=BinaryTree(node=None))), "
-        "right_tree=BinaryTree(node=_BTNode(content=2, left_tree=BinaryTree(node=None),"
-        " right_tree=BinaryTree(node=None)))))"
+        repr(tree) == "BinaryTree(node=_BTNode(content=1, "
+        "left=_BTNode(content=0, left=None, right=None), "
+        "right=_BTNode(content=2, left=None, right=None)))"
     )
 
 
@@ -242,5 +228,66 @@ def test_set_right_tree_of_binary_tree_with_subtrees() -> None:
     assert tree.right_tree.content == 2
 
 
+def test_subtrees_of_binary_tree_are_views() -> None:
+    tree: BinaryTree[int] = BinaryTree(0)
+    left_tree: BinaryTree[int] | None = tree.left_tree
+    assert left_tree is not None
+    left_tree.content = 1
+    assert list(tree) == [1, 0]
+
+    left_tree.right_tree = BinaryTree(2)
+    right_tree: BinaryTree[int] | None = left_tree.right_tree
+    assert right_tree is not None
+    right_tree.content = 3
+    assert list(tree) == [1, 3, 0]
+    first_left_tree: BinaryTree[int] | None = tree.left_tree
+    assert first_left_tree is not tree.left_tree
+
+
+def test_attached_subtree_stays_linked() -> None:
+    subtree: BinaryTree[int] = BinaryTree()
+    tree: BinaryTree[int] = BinaryTree(0, None, subtree)
+    assert list(tree) == [0]
+
+    subtree.content = 1
+    subtree.left_tree = BinaryTree(2)
+    assert list(tree) == [0, 2, 1]
+
+
+def test_subtree_attached_twice() -> None:
+    subtree: BinaryTree[int] = BinaryTree(1)
+    tree1: BinaryTree[int] = BinaryTree(0, subtree, None)
+    tree2: BinaryTree[int] = BinaryTree(2, subtree, None)
+    subtree.right_tree = BinaryTree(3)
+    assert list(tree1) == [1, 3, 0]
+    assert list(tree2) == [1, 3, 2]
+
+    empty_subtree: BinaryTree[int] = BinaryTree()
+    tree1.right_tree = empty_subtree
+    tree2.right_tree = empty_subtree
+    empty_subtree.content = 4
+    assert list(tree1) == [1, 3, 0]
+    assert list(tree2) == [1, 3, 2, 4]
+
+
+def test_iteration_over_binary_tree() -> None:
+    tree: BinaryTree[int] = BinaryTree(
+        4,
+        BinaryTree(2, BinaryTree(1), BinaryTree(3)),
+        BinaryTree(5, None, BinaryTree(6)),
+    )
+    assert list(tree) == [1, 2, 3, 4, 5, 6]
+    assert list(reversed(tree)) == [6, 5, 4, 3, 2, 1]
+    assert len(tree) == 6
+    assert 3 in tree
+    assert 42 not in tree
+
+
+def test_iteration_over_empty_binary_tree() -> None:
+    tree: BinaryTree[int] = BinaryTree()
+    assert not list(tree)
+    assert len(tree) == 0
+
+
 if __name__ == "__main__":
     raise SystemExit(pytest.main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Tests for `datastructures._blocking_queue`."""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from nrw.datastructures import BlockingQueue, List
+
+
+def test_slots_of_blocking_queue() -> None:
+    assert BlockingQueue.__slots__ == ("_maxsize", "_not_empty", "_not_full", "_queue")
+
+
+def test_blocking_queue_is_unhashable() -> None:
+    assert BlockingQueue.__hash__ is None
+
+
+def test_empty_queue() -> None:
+    q: BlockingQueue[int] = BlockingQueue()
+    assert q.maxsize == 0
+    assert q.is_empty
+    assert not q.is_full
+    assert q.front is None
+    assert len(q) == 0
+    assert q.get(timeout=0) is None
+    assert q.get_batch(3, timeout=0).is_empty
+
+
+def test_put_and_get() -> None:
+    q: BlockingQueue[int] = BlockingQueue()
+    assert not q.put(None)
+    assert q.put(1)
+    assert q.put(2)
+    assert len(q) == 2
+    assert q.front == 1
+    assert q.get() == 1
+    assert q.get() == 2
+    assert q.is_empty
+
+
+def test_bounded_put_times_out() -> None:
+    q: BlockingQueue[int] = BlockingQueue(2)
+    assert q.put(1)
+    assert q.put(2)
+    assert q.is_full
+    start: float = time.monotonic()
+    assert not q.put(3, timeout=0.05)
+    assert time.monotonic() - start >= 0.04
+    assert len(q) == 2
+    assert repr(q) == "BlockingQueue(maxsize=2, contents=[1, 2])"
+
+
+def test_put_many() -> None:
+    q: BlockingQueue[int] = BlockingQueue(3)
+    assert q.put_many([1, None, 2]) == 2
+    assert q.put_many([3, 4, 5], timeout=0.01) == 1
+    assert len(q.get_batch(10)) == 3
+    assert BlockingQueue[int]().put_many(range(100)) == 100
+
+
+def test_get_batch() -> None:
+    q: BlockingQueue[int] = BlockingQueue()
+    q.put_many(range(1, 6))
+    batch: List[int] = q.get_batch(2)
+    assert str(batch) == "List(1 -> 2)"
+    assert q.get_batch(0).is_empty
+    assert str(q.get_batch(10)) == "List(3 -> 4 -> 5)"
+    assert q.is_empty
+
+
+def test_get_waits_for_producer() -> None:
+    q: BlockingQueue[int] = BlockingQueue()
+    timer: threading.Timer = threading.Timer(0.05, q.put, args=(42,))
+    timer.start()
+    assert q.get(timeout=5) == 42
+    timer.join()
+
+
+def test_put_waits_for_consumer() -> None:
+    q: BlockingQueue[int] = BlockingQueue(1)
+    q.put(1)
+    timer: threading.Timer = threading.Timer(0.05, q.get)
+    timer.start()
+    assert q.put(2, timeout=5)
+    timer.join()
+    assert q.get() == 2
+
+
+def test_producers_and_consumers() -> None:
+    q: BlockingQueue[int] = BlockingQueue(4)
+    received: list[int] = []
+    lock: threading.Lock = threading.Lock()
+
+    def produce(offset: int) -> None:
+        q.put_many(range(offset, offset + 100))
+
+    def consume() -> None:
+        while True:
+            batch: List[int] = q.get_batch(8, timeout=0.5)
+            if batch.is_empty:
+                return
+            with lock:
+                received.extend(batch)
+
+    threads: list[threading.Thread] = [
+        threading.Thread(target=produce, args=(offset,)) for offset in (0, 100, 200)
+    ]
+    threads += [threading.Thread(target=consume) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(received) == list(range(300))
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main())
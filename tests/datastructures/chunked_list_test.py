@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""Tests for `datastructures._chunked_list`."""
+
+from __future__ import annotations
+
+from io import StringIO
+
+import pytest
+
+from nrw.datastructures import ChunkedList
+from nrw.datastructures._chunked_list import _ListChunk
+
+
+@pytest.fixture
+def empty_list() -> ChunkedList[int]:
+    return ChunkedList(4)
+
+
+@pytest.fixture
+def sample_list() -> ChunkedList[int]:
+    lst: ChunkedList[int] = ChunkedList(4)
+    for i in range(1, 11):
+        lst.append(i)
+    return lst
+
+
+def _contents(lst: ChunkedList[int]) -> list[int]:
+    contents: list[int] = []
+    lst.to_first()
+    while lst.has_access:
+        contents.append(lst.content)  # type: ignore[arg-type]
+        lst.next()
+    return contents
+
+
+def _chunk_sizes(lst: ChunkedList[int]) -> list[int]:
+    sizes: list[int] = []
+    chunk: _ListChunk[int] | None = lst._first
+    while chunk is not None:
+        sizes.append(len(chunk._contents))
+        chunk = chunk._next_chunk
+    return sizes
+
+
+def test_slots_of_list_chunk() -> None:
+    assert _ListChunk.__slots__ == ("_contents", "_next_chunk", "_previous_chunk")
+
+
+def test_list_chunk_is_unhashable() -> None:
+    assert _ListChunk.__hash__ is None
+
+
+def test_list_chunk_repr() -> None:
+    assert repr(_ListChunk([1, 2])) == "_ListChunk(contents=[1, 2])"
+
+
+def test_slots_of_chunked_list() -> None:
+    assert ChunkedList.__slots__ == (
+        "_chunk_size",
+        "_current_chunk",
+        "_current_index",
+        "_first",
+        "_last",
+        "_length",
+    )
+
+
+def test_chunked_list_is_unhashable() -> None:
+    assert ChunkedList.__hash__ is None
+
+
+def test_chunk_size() -> None:
+    assert ChunkedList().chunk_size == 64
+    assert ChunkedList(8).chunk_size == 8
+    assert ChunkedList(0).chunk_size == 2
+
+
+def test_empty_list(empty_list: ChunkedList[int]) -> None:
+    assert empty_list.is_empty
+    assert not empty_list.has_access
+    assert empty_list.content is None
+    assert len(empty_list) == 0
+    empty_list.next()
+    empty_list.to_first()
+    empty_list.to_last()
+    empty_list.remove()
+    assert not empty_list.has_access
+
+
+def test_append_fills_chunks(sample_list: ChunkedList[int]) -> None:
+    assert _chunk_sizes(sample_list) == [4, 4, 2]
+    assert _contents(sample_list) == list(range(1, 11))
+    assert len(sample_list) == 10
+
+
+def test_append_none(sample_list: ChunkedList[int]) -> None:
+    sample_list.append(None)
+    assert len(sample_list) == 10
+
+
+def test_to_first_and_to_last(sample_list: ChunkedList[int]) -> None:
+    assert not sample_list.has_access
+    sample_list.to_first()
+    assert sample_list.content == 1
+    sample_list.to_last()
+    assert sample_list.content == 10
+    sample_list.next()
+    assert not sample_list.has_access
+    sample_list.next()
+    assert not sample_list.has_access
+
+
+def test_set_content(sample_list: ChunkedList[int]) -> None:
+    sample_list.content = 42
+    sample_list.to_first()
+    sample_list.content = None
+    assert sample_list.content == 1
+    sample_list.content = 42
+    assert sample_list.content == 42
+
+
+def test_insert_into_empty_list(empty_list: ChunkedList[int]) -> None:
+    empty_list.insert(None)
+    assert empty_list.is_empty
+    empty_list.insert(1)
+    assert not empty_list.has_access
+    assert _contents(empty_list) == [1]
+
+
+def test_insert_without_access(sample_list: ChunkedList[int]) -> None:
+    sample_list.insert(42)
+    assert len(sample_list) == 10
+
+
+def test_insert_splits_full_chunk(sample_list: ChunkedList[int]) -> None:
+    sample_list.to_first()
+    sample_list.next()
+    sample_list.next()
+    sample_list.insert(42)
+    assert sample_list.content == 3
+    assert _chunk_sizes(sample_list) == [2, 3, 4, 2]
+    assert _contents(sample_list) == [1, 2, 42, 3, 4, 5, 6, 7, 8, 9, 10]
+
+
+def test_insert_before_first_keeps_current(sample_list: ChunkedList[int]) -> None:
+    sample_list.to_first()
+    sample_list.insert(0)
+    assert sample_list.content == 1
+    assert _contents(sample_list) == list(range(11))
+
+
+def test_insert_into_last_chunk(sample_list: ChunkedList[int]) -> None:
+    sample_list.to_last()
+    for i in range(3):
+        sample_list.insert(42 + i)
+    assert sample_list.content == 10
+    assert _contents(sample_list)[-4:] == [42, 43, 44, 10]
+    sample_list.to_last()
+    assert sample_list.content == 10
+
+
+def test_remove(sample_list: ChunkedList[int]) -> None:
+    sample_list.to_first()
+    sample_list.remove()
+    assert sample_list.content == 2
+    assert len(sample_list) == 9
+    assert _contents(sample_list) == list(range(2, 11))
+
+
+def test_remove_whole_chunk(sample_list: ChunkedList[int]) -> None:
+    sample_list.to_first()
+    for _ in range(4):
+        sample_list.remove()
+    assert sample_list.content == 5
+    assert _chunk_sizes(sample_list) == [4, 2]
+
+
+def test_remove_merges_small_chunks() -> None:
+    lst: ChunkedList[int] = ChunkedList(8)
+    for i in range(9):
+        lst.append(i)
+    lst.to_first()
+    for _ in range(7):
+        lst.remove()
+    assert lst.content == 7
+    assert _chunk_sizes(lst) == [2]
+
+
+def test_remove_last(sample_list: ChunkedList[int]) -> None:
+    sample_list.to_last()
+    sample_list.remove()
+    assert not sample_list.has_access
+    sample_list.to_last()
+    assert sample_list.content == 9
+
+
+def test_remove_at_chunk_end_moves_to_next_chunk(
+    sample_list: ChunkedList[int],
+) -> None:
+    sample_list.to_first()
+    for _ in range(3):
+        sample_list.next()
+    sample_list.remove()
+    assert sample_list.content == 5
+
+
+def test_remove_everything(sample_list: ChunkedList[int]) -> None:
+    sample_list.to_first()
+    while sample_list.has_access:
+        sample_list.remove()
+    assert sample_list.is_empty
+    assert sample_list._last is None
+    assert len(sample_list) == 0
+
+
+def test_concat(sample_list: ChunkedList[int], empty_list: ChunkedList[int]) -> None:
+    other_list: ChunkedList[int] = ChunkedList(4)
+    other_list.append(11)
+    other_list.append(12)
+    sample_list.concat(other_list)
+    assert other_list.is_empty
+    assert len(other_list) == 0
+    assert len(sample_list) == 12
+    assert _contents(sample_list) == list(range(1, 13))
+
+    empty_list.concat(sample_list)
+    assert sample_list.is_empty
+    assert _contents(empty_list) == list(range(1, 13))
+
+
+def test_concat_no_effect(sample_list: ChunkedList[int]) -> None:
+    sample_list.concat(sample_list)
+    sample_list.concat(None)
+    sample_list.concat(ChunkedList())
+    assert len(sample_list) == 10
+
+
+def test_iteration(sample_list: ChunkedList[int]) -> None:
+    assert list(sample_list) == list(range(1, 11))
+    assert list(reversed(sample_list)) == list(range(10, 0, -1))
+    assert 10 in sample_list
+    assert 42 not in sample_list
+    assert not sample_list.has_access
+
+
+def test_str(sample_list: ChunkedList[int], empty_list: ChunkedList[int]) -> None:
+    assert str(empty_list) == "ChunkedList()"
+    assert str(sample_list) == (
+        "ChunkedList(1 -> 2 -> 3 -> 4 -> 5 -> 6 -> 7 -> 8 -> 9 -> 10)"
+    )
+
+
+def test_repr(empty_list: ChunkedList[int]) -> None:
+    assert repr(empty_list) == "ChunkedList(chunk_size=4, chunks=[], current=None)"
+    empty_list.append(1)
+    empty_list.to_first()
+    assert repr(empty_list) == (
+        "ChunkedList(chunk_size=4, chunks=[_ListChunk(contents=[1])], current=1)"
+    )
+
+
+def test_to_str_with_limit(sample_list: ChunkedList[int]) -> None:
+    assert (
+        sample_list.to_str(3)
+        == "ChunkedList(1 -> 2 -> 3 -> ... -> 8 -> 9 -> 10, len=10)"
+    )
+    with StringIO() as buffer:
+        sample_list.write(buffer)
+        assert buffer.getvalue() == str(sample_list)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Tests for `datastructures._concurrent_list`."""
+from __future__ import annotations
+
+import threading
+from io import StringIO
+
+import pytest
+
+from nrw.datastructures import ConcurrentList, List
+
+
+@pytest.fixture
+def sample_list() -> ConcurrentList[int]:
+    return ConcurrentList.from_iterable([1, 2, None, 3])
+
+
+def test_slots_of_concurrent_list() -> None:
+    assert ConcurrentList.__slots__ == ("_lock", "_snapshot")
+
+
+def test_concurrent_list_is_unhashable() -> None:
+    assert ConcurrentList.__hash__ is None
+
+
+def test_empty_list() -> None:
+    lst: ConcurrentList[int] = ConcurrentList()
+    assert lst.is_empty
+    assert len(lst) == 0
+    assert lst.snapshot() == ()
+    assert lst.clear() == ()
+
+
+def test_append_and_extend() -> None:
+    lst: ConcurrentList[int] = ConcurrentList()
+    lst.append(None)
+    lst.append(1)
+    lst.extend([2, None, 3])
+    lst.extend([])
+    assert lst.snapshot() == (1, 2, 3)
+    assert not lst.is_empty
+
+
+def test_snapshot_is_unaffected_by_changes(sample_list: ConcurrentList[int]) -> None:
+    snapshot: tuple[int, ...] = sample_list.snapshot()
+    iterator = iter(sample_list)
+    sample_list.append(4)
+    assert snapshot == (1, 2, 3)
+    assert list(iterator) == [1, 2, 3]
+    assert list(sample_list) == [1, 2, 3, 4]
+
+
+def test_iteration(sample_list: ConcurrentList[int]) -> None:
+    assert list(reversed(sample_list)) == [3, 2, 1]
+    assert 2 in sample_list
+    assert 42 not in sample_list
+
+
+def test_find(sample_list: ConcurrentList[int]) -> None:
+    assert sample_list.find(lambda content: content > 1) == 2
+    assert sample_list.find(lambda content: content > 3) is None
+
+
+def test_remove() -> None:
+    first: list[int] = [1]
+    second: list[int] = [1]
+    lst: ConcurrentList[list[int]] = ConcurrentList.from_iterable([first, second])
+    assert not lst.remove(None)
+    assert not lst.remove([1])
+    assert lst.remove(second)
+    assert lst.snapshot()[0] is first
+    assert len(lst) == 1
+    assert not lst.remove(second)
+
+
+def test_clear(sample_list: ConcurrentList[int]) -> None:
+    assert sample_list.clear() == (1, 2, 3)
+    assert sample_list.is_empty
+
+
+def test_to_list(sample_list: ConcurrentList[int]) -> None:
+    lst: List[int] = sample_list.to_list()
+    assert str(lst) == "List(1 -> 2 -> 3)"
+
+
+def test_str_and_repr(sample_list: ConcurrentList[int]) -> None:
+    assert str(ConcurrentList()) == "ConcurrentList()"
+    assert str(sample_list) == "ConcurrentList(1 -> 2 -> 3)"
+    assert sample_list.to_str(1) == "ConcurrentList(1 -> ... -> 3, len=3)"
+    with StringIO() as buffer:
+        sample_list.write(buffer)
+        assert buffer.getvalue() == str(sample_list)
+    assert repr(sample_list) == "ConcurrentList([1, 2, 3])"
+
+
+def test_concurrent_writers_and_readers() -> None:
+    lst: ConcurrentList[int] = ConcurrentList()
+    seen_lengths: list[int] = []
+
+    def write(offset: int) -> None:
+        for i in range(200):
+            lst.append(offset + i)
+
+    def read() -> None:
+        seen_lengths.extend([len(list(lst)) for _ in range(200)])
+
+    threads: list[threading.Thread] = [
+        threading.Thread(target=write, args=(offset,)) for offset in (0, 1000, 2000)
+    ]
+    threads.append(threading.Thread(target=read))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(lst) == 600
+    assert sorted(lst) == sorted(
+        offset + i for offset in (0, 1000, 2000) for i in range(200)
+    )
+    assert seen_lengths == sorted(seen_lengths)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main())
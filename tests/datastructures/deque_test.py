@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Tests for `datastructures._deque`."""
+from __future__ import annotations
+
+import random
+from collections import deque
+from io import StringIO
+
+import pytest
+
+from nrw.datastructures import Deque
+from nrw.datastructures._deque import _DequeBlock
+
+
+def _blocks(d: Deque[int]) -> int:
+    count: int = 0
+    block: _DequeBlock[int] | None = d._first_block
+    while block is not None:
+        count += 1
+        block = block._next_block
+    return count
+
+
+def test_slots_of_deque_block() -> None:
+    assert _DequeBlock.__slots__ == ("_contents", "_next_block", "_previous_block")
+
+
+def test_deque_block_is_unhashable() -> None:
+    assert _DequeBlock.__hash__ is None
+
+
+def test_slots_of_deque() -> None:
+    assert Deque.__slots__ == (
+        "_first_block",
+        "_first_index",
+        "_last_block",
+        "_last_index",
+        "_length",
+    )
+
+
+def test_deque_is_unhashable() -> None:
+    assert Deque.__hash__ is None
+
+
+def test_empty_deque() -> None:
+    d: Deque[int] = Deque()
+    assert d.is_empty
+    assert d.front is None
+    assert d.back is None
+    assert len(d) == 0
+    d.pop_front()
+    d.pop_back()
+    assert d.is_empty
+
+
+def test_push_and_pop() -> None:
+    d: Deque[int] = Deque()
+    d.push_back(2)
+    d.push_front(1)
+    d.push_back(3)
+    d.push_front(None)
+    d.push_back(None)
+    assert len(d) == 3
+    assert (d.front, d.back) == (1, 3)
+    d.pop_front()
+    assert d.front == 2
+    d.pop_back()
+    assert d.back == 2
+    d.pop_back()
+    assert d.is_empty
+    assert d.front is None
+    assert d.back is None
+
+
+def test_growth_across_blocks() -> None:
+    d: Deque[int] = Deque()
+    for i in range(200):
+        d.push_back(i)
+        d.push_front(-i - 1)
+    assert len(d) == 400
+    assert list(d) == list(range(-200, 200))
+    assert list(reversed(d)) == list(range(199, -201, -1))
+    assert _blocks(d) == 7
+
+    for _ in range(190):
+        d.pop_front()
+        d.pop_back()
+    assert list(d) == list(range(-10, 10))
+    assert _blocks(d) == 1
+
+
+def test_emptying_recenters() -> None:
+    d: Deque[int] = Deque()
+    for i in range(100):
+        d.push_back(i)
+    while not d.is_empty:
+        d.pop_front()
+    assert _blocks(d) == 1
+    assert d._first_block is d._last_block
+    d.push_front(1)
+    d.push_back(2)
+    assert list(d) == [1, 2]
+
+
+def test_against_collections_deque() -> None:
+    rng: random.Random = random.Random(42)
+    d: Deque[int] = Deque()
+    reference: deque[int] = deque()
+    for i in range(5000):
+        operation: int = rng.randrange(4)
+        if operation == 0:
+            d.push_front(i)
+            reference.appendleft(i)
+        elif operation == 1:
+            d.push_back(i)
+            reference.append(i)
+        elif operation == 2 and reference:
+            d.pop_front()
+            reference.popleft()
+        elif operation == 3 and reference:
+            d.pop_back()
+            reference.pop()
+    assert list(d) == list(reference)
+    assert len(d) == len(reference)
+
+
+def test_contains() -> None:
+    d: Deque[int] = Deque()
+    d.push_back(1)
+    d.push_back(2)
+    assert 2 in d
+    assert 42 not in d
+
+
+def test_str_and_repr() -> None:
+    d: Deque[int] = Deque()
+    assert str(d) == "Deque()"
+    assert repr(d) == "Deque([])"
+    for i in range(1, 6):
+        d.push_back(i)
+    assert str(d) == "Deque(1 -> 2 -> 3 -> 4 -> 5)"
+    assert d.to_str(1) == "Deque(1 -> ... -> 5, len=5)"
+    with StringIO() as buffer:
+        d.write(buffer)
+        assert buffer.getvalue() == str(d)
+    assert repr(d) == "Deque([1, 2, 3, 4, 5])"
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main())
@@ -13,7 +13,7 @@ def graph() -> Graph:
 
 
 def test_graph_slots() -> None:
-    assert Graph.__slots__ == ("_vertices", "_edges")
+    assert Graph.__slots__ == ("_edges", "_vertices")
 
 
 def test_graph_is_unhashable() -> None:
@@ -76,6 +76,34 @@ def test_vertices_property(graph: Graph) -> None:
     assert copy is not graph.vertices
 
 
+def test_vertices_and_edges_share_nodes(graph: Graph) -> None:
+    vertex1: Vertex = Vertex("A")
+    graph.add_vertex(vertex1)
+    vertex2: Vertex = Vertex("B")
+    graph.add_vertex(vertex2)
+    edge: Edge = Edge(vertex1, vertex2, 1)
+    graph.add_edge(edge)
+
+    vertices: List[Vertex] = graph.vertices
+    edges: List[Edge] = graph.edges
+    assert vertices._first is graph._vertices._first
+    assert edges._first is graph._edges._first
+
+    vertices.to_first()
+    vertices.remove()
+    edges.append(edge)
+    assert list(graph.vertices) == [vertex1, vertex2]
+    assert list(graph.edges) == [edge]
+
+    vertex3: Vertex = Vertex("C")
+    graph.add_vertex(vertex3)
+    graph.remove_edge(edge)
+    assert list(vertices) == [vertex2]
+    assert list(edges) == [edge, edge]
+    assert list(graph.vertices) == [vertex1, vertex2, vertex3]
+    assert graph.edges.is_empty
+
+
 def test_get_vertex(graph: Graph) -> None:
     vertex1: Vertex = Vertex("A")
     graph.add_vertex(vertex1)
@@ -430,10 +458,10 @@ def test_repr_of_graph(graph: Graph) -> None:
         repr(graph) == "Graph(vertices=List(first=_ListNode(content=Vertex(id='A', "
         "mark=False), next_node=_ListNode(content=Vertex(id='B', mark=False), "
         "next_node=None)), last=_ListNode(content=Vertex(id='B', mark=False), "
-        "next_node=None), current=_ListNode(content=Vertex(id='B', mark=False), "
-        "next_node=None)), edges=List(first=_ListNode(content=Edge(vertices=("
-        "Vertex(id='A', mark=False), Vertex(id='B', mark=False)), weight=1, mark=False)"
-        ", next_node=None), last=_ListNode(content=Edge(vertices=(Vertex(id='A', "
+        "next_node=None), current=None), edges=List(first=_ListNode("
+        "content=Edge(vertices=(Vertex(id='A', mark=False), Vertex(id='B', "
+        "mark=False)), weight=1, mark=False), next_node=None), "
+        "last=_ListNode(content=Edge(vertices=(Vertex(id='A', "
         "mark=False), Vertex(id='B', mark=False)), weight=1, mark=False), "
         "next_node=None), current=None))"
     )
@@ -2,11 +2,17 @@
 """Tests for `datastructures._list`."""
 from __future__ import annotations
 
+from io import StringIO
+from typing import TYPE_CHECKING
+
 import pytest
 
-from nrw.datastructures import List
+from nrw.datastructures import List, ListCursor
 from nrw.datastructures._list import _ListNode
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 @pytest.fixture
 def sample_node() -> _ListNode[int]:
@@ -28,7 +34,7 @@ def sample_list() -> List[int]:
 
 
 def test_slots_of_list_node() -> None:
-    assert _ListNode.__slots__ == ("_content", "_next_node")
+    assert _ListNode.__slots__ == ("_content", "_next_node", "_previous_node")
 
 
 def test_list_node_is_unhashable() -> None:
@@ -64,8 +70,25 @@ def test_list_node_next_node_setter(sample_node: _ListNode[int]) -> None:
     assert sample_node.next_node == new_node
 
 
+def test_list_node_previous_node_property(sample_node: _ListNode[int]) -> None:
+    assert sample_node.previous_node is None
+
+
+def test_list_node_previous_node_setter(sample_node: _ListNode[int]) -> None:
+    new_node = _ListNode(42)
+    sample_node.previous_node = new_node
+    assert sample_node.previous_node is new_node
+
+
 def test_slots_of_list() -> None:
-    assert List.__slots__ == ("_first", "_last", "_current")
+    assert List.__slots__ == (
+        "_current",
+        "_first",
+        "_last",
+        "_length",
+        "_positions",
+        "_shared",
+    )
 
 
 def test_list_is_unhashable() -> None:
@@ -329,6 +352,58 @@ def test_remove_from_list_with_one_element() -> None:
     assert lst.content is None
 
 
+def _assert_links_are_consistent(lst: List[int]) -> None:
+    forwards: list[int] = []
+    node: _ListNode[int] | None = lst._first
+    while node is not None:
+        forwards.append(node.content)
+        node = node.next_node
+
+    backwards: list[int] = []
+    node = lst._last
+    while node is not None:
+        backwards.append(node.content)
+        node = node.previous_node
+
+    assert forwards == backwards[::-1]
+
+
+def test_links_after_insert(sample_list: List[int]) -> None:
+    sample_list.to_first()
+    sample_list.insert(0)
+    sample_list.to_last()
+    sample_list.insert(42)
+    _assert_links_are_consistent(sample_list)
+    assert sample_list._last.previous_node.content == 42
+
+
+def test_links_after_remove(sample_list: List[int]) -> None:
+    sample_list.to_first()
+    sample_list.next()
+    sample_list.remove()
+    _assert_links_are_consistent(sample_list)
+    sample_list.to_first()
+    sample_list.remove()
+    _assert_links_are_consistent(sample_list)
+    assert sample_list._first.previous_node is None
+    sample_list.remove()
+    assert sample_list.is_empty
+    assert sample_list._last is None
+
+
+def test_links_after_concat(sample_list: List[int]) -> None:
+    other_list: List[int] = List()
+    other_list.append(4)
+    other_list.append(5)
+    sample_list.concat(other_list)
+    _assert_links_are_consistent(sample_list)
+
+
+def test_get_previous(sample_list: List[int]) -> None:
+    assert sample_list._get_previous(sample_list._first) is None
+    assert sample_list._get_previous(sample_list._last).content == 2
+
+
 def test_parse_none_to_get_previos(sample_list: List[int]) -> None:
     assert sample_list._get_previous(None) is None
 
@@ -337,6 +412,147 @@ def test_get_previos_on_empty_list(empty_list: List[int]) -> None:
     assert empty_list._get_previous(None) is None
 
 
+def test_len_of_empty_list(empty_list: List[int]) -> None:
+    assert len(empty_list) == 0
+
+
+def test_len_is_maintained(sample_list: List[int]) -> None:
+    assert len(sample_list) == 3
+    sample_list.append(4)
+    assert len(sample_list) == 4
+    sample_list.append(None)
+    assert len(sample_list) == 4
+    sample_list.to_first()
+    sample_list.insert(0)
+    assert len(sample_list) == 5
+    sample_list.remove()
+    assert len(sample_list) == 4
+
+    other_list: List[int] = List()
+    other_list.append(5)
+    other_list.append(6)
+    sample_list.concat(other_list)
+    assert len(sample_list) == 6
+    assert len(other_list) == 0
+
+
+def test_len_after_insert_into_empty_list(empty_list: List[int]) -> None:
+    empty_list.insert(1)
+    assert len(empty_list) == 1
+
+
+def test_to_index(sample_list: List[int]) -> None:
+    sample_list.to_index(1)
+    assert sample_list.content == 2
+    sample_list.to_index(0)
+    assert sample_list.content == 1
+    sample_list.to_index(2)
+    assert sample_list.content == 3
+
+
+def test_to_index_out_of_range(sample_list: List[int]) -> None:
+    sample_list.to_first()
+    sample_list.to_index(3)
+    assert not sample_list.has_access
+    sample_list.to_first()
+    sample_list.to_index(-1)
+    assert not sample_list.has_access
+
+
+def test_to_index_on_empty_list(empty_list: List[int]) -> None:
+    empty_list.to_index(0)
+    assert not empty_list.has_access
+
+
+def test_to_index_after_structural_changes(sample_list: List[int]) -> None:
+    sample_list.to_index(2)
+    assert sample_list._positions is not None
+    sample_list.append(4)
+    sample_list.to_index(3)
+    assert sample_list.content == 4
+
+    sample_list.to_first()
+    sample_list.insert(0)
+    assert sample_list._positions is None
+    sample_list.to_index(1)
+    assert sample_list.content == 1
+
+    sample_list.remove()
+    sample_list.to_index(1)
+    assert sample_list.content == 2
+
+    other_list: List[int] = List()
+    other_list.append(5)
+    sample_list.concat(other_list)
+    sample_list.to_index(4)
+    assert sample_list.content == 5
+
+
+def test_index_of(sample_list: List[int]) -> None:
+    sample_list.to_first()
+    assert sample_list.index_of(1) == 0
+    assert sample_list.index_of(3) == 2
+    assert sample_list.index_of(42) is None
+    assert sample_list.index_of(None) is None
+    assert sample_list.content == 1
+
+
+def test_from_iterable() -> None:
+    lst: List[int] = List.from_iterable([1, None, 2, 3])
+    assert not lst.has_access
+    assert len(lst) == 3
+    assert str(lst) == "List(1 -> 2 -> 3)"
+    assert List.from_iterable([]).is_empty
+
+
+def test_extend(sample_list: List[int]) -> None:
+    sample_list.to_first()
+    sample_list.to_index(2)
+    sample_list.extend(iter(range(4, 7)))
+    assert sample_list.content == 3
+    assert len(sample_list) == 6
+    assert str(sample_list) == "List(1 -> 2 -> 3 -> 4 -> 5 -> 6)"
+    assert sample_list._positions is None
+    sample_list.to_last()
+    assert sample_list.content == 6
+    _assert_links_are_consistent(sample_list)
+
+
+def test_extend_empty_list(empty_list: List[int]) -> None:
+    empty_list.extend([None, None])
+    assert empty_list.is_empty
+    empty_list.extend([1, 2])
+    assert not empty_list.has_access
+    assert len(empty_list) == 2
+    _assert_links_are_consistent(empty_list)
+
+
+def test_iteration_over_list(sample_list: List[int]) -> None:
+    sample_list.to_first()
+    sample_list.next()
+    assert list(sample_list) == [1, 2, 3]
+    assert list(reversed(sample_list)) == [3, 2, 1]
+    assert sample_list.content == 2
+
+
+def test_iteration_over_empty_list(empty_list: List[int]) -> None:
+    assert not list(empty_list)
+    assert not list(reversed(empty_list))
+    assert 1 not in empty_list
+
+
+def test_independent_iterators(sample_list: List[int]) -> None:
+    pairs: list[tuple[int, int]] = [(a, b) for a in sample_list for b in sample_list]
+    assert len(pairs) == 9
+
+
+def test_contains(sample_list: List[int]) -> None:
+    assert 1 in sample_list
+    assert 3 in sample_list
+    assert 42 not in sample_list
+    assert not sample_list.has_access
+
+
 def test_empty_list_to_str(empty_list: List[int]) -> None:
     assert str(empty_list) == "List()"
 
@@ -358,5 +574,269 @@ def test_repr_of_non_empty_list(sample_list: List[int]) -> None:
     )
 
 
+def test_to_str_with_limit() -> None:
+    lst: List[int] = List.from_iterable(range(1, 11))
+    assert lst.to_str() == str(lst)
+    assert lst.to_str(2) == "List(1 -> 2 -> ... -> 9 -> 10, len=10)"
+    assert lst.to_str(0) == "List(..., len=10)"
+    assert lst.to_str(5) == str(lst)
+    assert List().to_str(3) == "List()"
+
+
+def test_write(sample_list: List[int]) -> None:
+    with StringIO() as buffer:
+        sample_list.write(buffer)
+        assert buffer.getvalue() == "List(1 -> 2 -> 3)"
+
+
+def test_str_and_repr_of_long_list() -> None:
+    lst: List[int] = List.from_iterable(range(5000))
+    assert str(lst).endswith("4998 -> 4999)")
+    assert repr(lst).endswith(
+        "last=_ListNode(content=4999, next_node=None), current=None)",
+    )
+
+
+def test_slots_of_list_cursor() -> None:
+    assert ListCursor.__slots__ == ("_list", "_node")
+
+
+def test_list_cursor_is_unhashable() -> None:
+    assert ListCursor.__hash__ is None
+
+
+def test_cursor_is_independent(sample_list: List[int]) -> None:
+    cursor: ListCursor[int] = sample_list.cursor()
+    assert cursor.list is sample_list
+    assert not cursor.has_access
+    assert cursor.content is None
+    cursor.to_last()
+    sample_list.to_first()
+    assert cursor.content == 3
+    assert sample_list.content == 1
+    cursor.previous()
+    assert cursor.content == 2
+    cursor.next()
+    cursor.next()
+    assert not cursor.has_access
+    cursor.next()
+    cursor.previous()
+    assert not cursor.has_access
+    assert repr(cursor) == "ListCursor(content=None)"
+
+
+def test_cursor_save_and_restore(sample_list: List[int]) -> None:
+    sample_list.to_index(1)
+    saved: ListCursor[int] = sample_list.cursor()
+    assert saved.content == 2
+    sample_list.to_last()
+    saved.make_current()
+    assert sample_list.content == 2
+
+    copied: ListCursor[int] = saved.copy()
+    copied.next()
+    assert (saved.content, copied.content) == (2, 3)
+    copied.to_current()
+    assert copied.content == 2
+
+
+def test_make_current_without_access(sample_list: List[int]) -> None:
+    sample_list.to_first()
+    other_list: List[int] = List.from_iterable([4])
+    other_list.to_first()
+    other_list.cursor().make_current()
+    assert sample_list.content == 1
+    assert other_list.content == 4
+
+    cursor: ListCursor[int] = sample_list.cursor()
+    cursor.to_last()
+    cursor.next()
+    cursor.make_current()
+    assert not sample_list.has_access
+
+
+def test_cursor_content(sample_list: List[int]) -> None:
+    cursor: ListCursor[int] = sample_list.cursor()
+    cursor.content = 42
+    cursor.to_first()
+    cursor.content = None
+    assert cursor.content == 1
+    cursor.content = 42
+    assert list(sample_list) == [42, 2, 3]
+
+
+def test_cursor_insert(sample_list: List[int], empty_list: List[int]) -> None:
+    cursor: ListCursor[int] = sample_list.cursor()
+    cursor.insert(42)
+    assert len(sample_list) == 3
+    cursor.to_first()
+    cursor.insert(0)
+    cursor.insert(None)
+    cursor.to_last()
+    cursor.insert(42)
+    assert cursor.content == 3
+    assert list(sample_list) == [0, 1, 2, 42, 3]
+    assert len(sample_list) == 5
+    sample_list.to_index(0)
+    assert sample_list.content == 0
+
+    empty_cursor: ListCursor[int] = empty_list.cursor()
+    empty_cursor.to_first()
+    empty_cursor.insert(1)
+    assert not empty_cursor.has_access
+    assert list(empty_list) == [1]
+
+
+def test_cursor_remove(sample_list: List[int]) -> None:
+    cursor: ListCursor[int] = sample_list.cursor()
+    cursor.remove()
+    assert len(sample_list) == 3
+    cursor.to_first()
+    sample_list.to_first()
+    cursor.remove()
+    assert cursor.content == 2
+    assert sample_list.content == 2
+    assert len(sample_list) == 2
+
+    sample_list.to_first()
+    cursor.to_last()
+    cursor.remove()
+    assert not cursor.has_access
+    assert sample_list.content == 2
+    assert list(sample_list) == [2]
+    sample_list.to_last()
+    assert sample_list.content == 2
+
+    cursor.to_first()
+    cursor.remove()
+    assert sample_list.is_empty
+    assert not sample_list.has_access
+    assert len(sample_list) == 0
+
+
+def test_split_at_current(sample_list: List[int]) -> None:
+    assert sample_list.split_at_current().is_empty
+    assert len(sample_list) == 3
+
+    sample_list.to_index(1)
+    tail: List[int] = sample_list.split_at_current()
+    assert not sample_list.has_access
+    assert not tail.has_access
+    assert list(sample_list) == [1]
+    assert list(reversed(tail)) == [3, 2]
+    assert len(sample_list) == 1
+    assert len(tail) == 2
+    sample_list.to_last()
+    assert sample_list.content == 1
+    tail.to_index(1)
+    assert tail.content == 3
+
+
+def test_split_at_first(sample_list: List[int]) -> None:
+    sample_list.to_first()
+    tail: List[int] = sample_list.split_at_current()
+    assert sample_list.is_empty
+    assert len(sample_list) == 0
+    assert list(tail) == [1, 2, 3]
+    assert len(tail) == 3
+
+
+def test_length_after_split_and_changes(sample_list: List[int]) -> None:
+    sample_list.to_last()
+    tail: List[int] = sample_list.split_at_current()
+    sample_list.append(4)
+    sample_list.to_first()
+    sample_list.remove()
+    sample_list.concat(tail)
+    assert list(sample_list) == [2, 4, 3]
+    assert len(sample_list) == 3
+    assert sample_list.to_str(1) == "List(2 -> ... -> 3, len=3)"
+
+
+def test_splice_at_current(sample_list: List[int]) -> None:
+    sample_list.to_index(1)
+    other_list: List[int] = List.from_iterable([4, 5])
+    sample_list.splice(other_list, at_current=True)
+    assert sample_list.content == 2
+    assert other_list.is_empty
+    assert len(other_list) == 0
+    assert list(sample_list) == [1, 4, 5, 2, 3]
+    assert list(reversed(sample_list)) == [3, 2, 5, 4, 1]
+    assert len(sample_list) == 5
+
+    sample_list.to_first()
+    sample_list.splice(List.from_iterable([0]), at_current=True)
+    assert list(sample_list) == [0, 1, 4, 5, 2, 3]
+    sample_list.to_index(0)
+    assert sample_list.content == 0
+
+
+def test_splice_at_end(sample_list: List[int]) -> None:
+    sample_list.to_first()
+    sample_list.splice(List.from_iterable([4]))
+    sample_list.next()
+    sample_list.next()
+    sample_list.next()
+    sample_list.splice(List.from_iterable([5]), at_current=True)
+    assert list(sample_list) == [1, 2, 3, 5, 4]
+
+
+def test_splice_no_effect(sample_list: List[int]) -> None:
+    sample_list.to_first()
+    sample_list.splice(sample_list, at_current=True)
+    sample_list.splice(None)
+    sample_list.splice(List(), at_current=True)
+    assert list(sample_list) == [1, 2, 3]
+
+
+def test_share_copies_nodes_on_first_change(sample_list: List[int]) -> None:
+    first = sample_list._first
+    shared: List[int] = sample_list._share()
+    assert shared._first is first
+    assert not shared.has_access
+    assert len(shared) == 3
+
+    shared.to_index(1)
+    shared.content = 20
+    assert shared.content == 20
+    assert shared._first is not first
+    assert list(shared) == [1, 20, 3]
+    assert list(sample_list) == [1, 2, 3]
+
+    sample_list.to_last()
+    sample_list.remove()
+    assert list(sample_list) == [1, 2]
+    assert list(shared) == [1, 20, 3]
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda lst: lst.append(4),
+        lambda lst: lst.extend([4]),
+        lambda lst: lst.concat(List.from_iterable([4])),
+        lambda lst: lst.splice(List.from_iterable([4]), at_current=True),
+        lambda lst: lst.insert(4),
+        lambda lst: lst.remove(),
+        lambda lst: lst.split_at_current(),
+        lambda lst: lst.cursor().remove(),
+    ],
+)
+def test_share_keeps_original_unchanged(
+    sample_list: List[int],
+    change: Callable[[List[int]], object],
+) -> None:
+    shared: List[int] = sample_list._share()
+    shared.to_first()
+    change(shared)
+    assert list(sample_list) == [1, 2, 3]
+    assert list(reversed(sample_list)) == [3, 2, 1]
+
+    other: List[int] = sample_list._share()
+    List.from_iterable([0]).concat(other)
+    assert other.is_empty
+    assert list(sample_list) == [1, 2, 3]
+
+
 if __name__ == "__main__":
     raise SystemExit(pytest.main())
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Tests for `datastructures._node_pool`."""
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+
+from nrw.datastructures import List, NodePool, Queue, Stack
+from nrw.datastructures._stack import _StackNode
+
+
+@pytest.fixture
+def pool() -> NodePool[int, _StackNode[int]]:
+    return NodePool(_StackNode, 2)
+
+
+@pytest.fixture
+def pooled_containers() -> Iterator[None]:
+    for container in (List, Stack, Queue):
+        container.node_pool.clear()
+        container.node_pool.capacity = 8
+    yield
+    for container in (List, Stack, Queue):
+        container.node_pool.capacity = 0
+        container.node_pool.clear()
+
+
+def test_slots_of_node_pool() -> None:
+    assert NodePool.__slots__ == (
+        "_capacity",
+        "_factory",
+        "_free",
+        "_hits",
+        "_misses",
+    )
+
+
+def test_node_pool_is_unhashable() -> None:
+    assert NodePool.__hash__ is None
+
+
+def test_repr_of_node_pool(pool: NodePool[int, _StackNode[int]]) -> None:
+    assert repr(pool) == "NodePool(capacity=2, free=0, hits=0, misses=0)"
+
+
+def test_negative_capacity() -> None:
+    empty_pool: NodePool[int, _StackNode[int]] = NodePool(_StackNode, -1)
+    assert empty_pool.capacity == 0
+    empty_pool.capacity = -5
+    assert empty_pool.capacity == 0
+
+
+def test_acquire_creates_new_node(pool: NodePool[int, _StackNode[int]]) -> None:
+    node: _StackNode[int] = pool.acquire(1)
+    assert isinstance(node, _StackNode)
+    assert node.content == 1
+    assert pool.misses == 1
+    assert pool.hits == 0
+    assert pool.hit_rate == 0.0
+
+
+def test_release_and_reuse(pool: NodePool[int, _StackNode[int]]) -> None:
+    node: _StackNode[int] = pool.acquire(1)
+    node.next_node = _StackNode(2)
+    pool.release(node)
+    assert len(pool) == 1
+    assert node.content is None
+    assert node.next_node is None
+
+    reused: _StackNode[int] = pool.acquire(3)
+    assert reused is node
+    assert reused.content == 3
+    assert pool.hits == 1
+    assert pool.hit_rate == 0.5
+
+
+def test_release_respects_capacity(pool: NodePool[int, _StackNode[int]]) -> None:
+    for i in range(3):
+        pool.release(_StackNode(i))
+    assert len(pool) == 2
+    pool.capacity = 1
+    assert len(pool) == 1
+
+
+def test_hit_rate_without_requests(pool: NodePool[int, _StackNode[int]]) -> None:
+    assert pool.hit_rate == 0.0
+
+
+def test_clear(pool: NodePool[int, _StackNode[int]]) -> None:
+    pool.release(pool.acquire(1))
+    pool.acquire(2)
+    pool.clear()
+    assert len(pool) == 0
+    assert pool.hits == pool.misses == 0
+
+
+def test_containers_are_unpooled_by_default() -> None:
+    assert List.node_pool.capacity == 0
+    assert Stack.node_pool.capacity == 0
+    assert Queue.node_pool.capacity == 0
+
+
+@pytest.mark.usefixtures("pooled_containers")
+def test_stack_reuses_nodes() -> None:
+    s: Stack[int] = Stack()
+    s.push_many([1, 2, 3])
+    s.pop()
+    s.pop_many()
+    assert len(Stack.node_pool) == 3
+    s.push(4)
+    s.push_many([5, 6])
+    assert Stack.node_pool.hits == 3
+    assert list(s) == [6, 5, 4]
+
+
+@pytest.mark.usefixtures("pooled_containers")
+def test_queue_reuses_nodes() -> None:
+    q: Queue[int] = Queue()
+    q.enqueue_many([1, 2, 3])
+    q.dequeue()
+    q.dequeue_many()
+    assert len(Queue.node_pool) == 3
+    q.enqueue(4)
+    q.enqueue_many([5, 6])
+    assert Queue.node_pool.hits == 3
+    assert list(q) == [4, 5, 6]
+
+
+@pytest.mark.usefixtures("pooled_containers")
+def test_list_reuses_nodes() -> None:
+    lst: List[int] = List.from_iterable([1, 2, 3])
+    lst.to_first()
+    lst.remove()
+    lst.remove()
+    assert len(List.node_pool) == 2
+    lst.insert(0)
+    lst.append(4)
+    assert List.node_pool.hits == 2
+    assert list(lst) == [0, 3, 4]
+    assert list(reversed(lst)) == [4, 3, 0]
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main())
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""Tests for `datastructures._persistent_list`."""
+from __future__ import annotations
+
+import pytest
+
+from nrw.datastructures import List, PersistentList
+
+
+@pytest.fixture
+def sample_list() -> PersistentList[int]:
+    return PersistentList.from_iterable(range(1, 5))
+
+
+def test_slots_of_persistent_list() -> None:
+    assert PersistentList.__slots__ == (
+        "_current",
+        "_first",
+        "_last",
+        "_length",
+        "_shared",
+    )
+
+
+def test_persistent_list_is_unhashable() -> None:
+    assert PersistentList.__hash__ is None
+
+
+def test_persistent_list_construction() -> None:
+    lst: PersistentList[int] = PersistentList()
+    assert lst.is_empty
+    assert not lst.has_access
+    assert lst._first is None
+    assert lst._last is None
+    assert len(lst) == 0
+
+
+def test_from_iterable(sample_list: PersistentList[int]) -> None:
+    assert list(sample_list) == [1, 2, 3, 4]
+    assert len(sample_list) == 4
+    assert sample_list._last is not None
+    assert sample_list._last.content == 4
+    assert not sample_list.has_access
+    assert list(PersistentList.from_iterable([None, 1, None])) == [1]
+
+
+def test_persistent_list_str(sample_list: PersistentList[int]) -> None:
+    assert str(sample_list) == "PersistentList(1 -> 2 -> 3 -> 4)"
+    assert sample_list.to_str(2) == "PersistentList(1 -> 2 -> ..., len=4)"
+
+
+def test_persistent_list_dunder_methods(sample_list: PersistentList[int]) -> None:
+    assert list(reversed(sample_list)) == [4, 3, 2, 1]
+    assert 3 in sample_list
+    assert 5 not in sample_list
+
+
+def test_to_list(sample_list: PersistentList[int]) -> None:
+    copy: List[int] = sample_list.to_list()
+    assert isinstance(copy, List)
+    assert list(copy) == [1, 2, 3, 4]
+
+
+def test_navigation(sample_list: PersistentList[int]) -> None:
+    assert sample_list.content is None
+    sample_list.next()
+    assert not sample_list.has_access
+    sample_list.to_first()
+    assert sample_list.content == 1
+    sample_list.next()
+    assert sample_list.content == 2
+    sample_list.to_last()
+    assert sample_list.content == 4
+    sample_list.next()
+    assert not sample_list.has_access
+
+
+def test_navigation_on_empty_list() -> None:
+    lst: PersistentList[int] = PersistentList()
+    lst.to_first()
+    assert not lst.has_access
+    lst.to_last()
+    assert not lst.has_access
+
+
+def test_snapshot_shares_nodes(sample_list: PersistentList[int]) -> None:
+    sample_list.to_first()
+    snapshot: PersistentList[int] = sample_list.snapshot()
+    assert snapshot is not sample_list
+    assert snapshot._first is sample_list._first
+    assert snapshot._last is sample_list._last
+    assert len(snapshot) == 4
+    assert not snapshot.has_access
+
+
+def test_set_content_copies_prefix_only(sample_list: PersistentList[int]) -> None:
+    snapshot: PersistentList[int] = sample_list.snapshot()
+    sample_list.to_first()
+    sample_list.next()
+    sample_list.content = 20
+    assert sample_list.content == 20
+    sample_list.content = None
+    assert list(sample_list) == [1, 20, 3, 4]
+    assert list(snapshot) == [1, 2, 3, 4]
+    assert sample_list._first is not snapshot._first
+    assert sample_list._last is snapshot._last
+
+    sample_list.to_last()
+    sample_list.content = 40
+    assert list(sample_list) == [1, 20, 3, 40]
+    assert sample_list._last is not None
+    assert sample_list._last.content == 40
+
+
+def test_insert(sample_list: PersistentList[int]) -> None:
+    snapshot: PersistentList[int] = sample_list.snapshot()
+    sample_list.insert(0)
+    assert list(sample_list) == [1, 2, 3, 4]
+    sample_list.to_first()
+    sample_list.next()
+    sample_list.insert(5)
+    assert sample_list.content == 2
+    sample_list.insert(None)
+    assert list(sample_list) == [1, 5, 2, 3, 4]
+    assert len(sample_list) == 5
+    assert list(snapshot) == [1, 2, 3, 4]
+    sample_list.to_first()
+    sample_list.insert(0)
+    assert list(sample_list) == [0, 1, 5, 2, 3, 4]
+
+
+def test_insert_into_empty_list() -> None:
+    lst: PersistentList[int] = PersistentList()
+    lst.insert(1)
+    assert list(lst) == [1]
+    assert not lst.has_access
+    assert lst._first is lst._last
+
+
+def test_append(sample_list: PersistentList[int]) -> None:
+    snapshot: PersistentList[int] = sample_list.snapshot()
+    sample_list.to_first()
+    sample_list.next()
+    sample_list.append(5)
+    sample_list.append(None)
+    assert list(sample_list) == [1, 2, 3, 4, 5]
+    assert sample_list.content == 2
+    assert len(sample_list) == 5
+    sample_list.to_last()
+    assert sample_list.content == 5
+    assert list(snapshot) == [1, 2, 3, 4]
+
+
+def test_append_links_unshared_nodes(sample_list: PersistentList[int]) -> None:
+    first = sample_list._first
+    last = sample_list._last
+    sample_list.append(5)
+    assert sample_list._first is first
+    assert last is not None
+    assert last._next_node is sample_list._last
+
+    snapshot: PersistentList[int] = sample_list.snapshot()
+    sample_list.append(6)
+    sample_list.append(7)
+    assert sample_list._first is not first
+    assert list(sample_list) == [1, 2, 3, 4, 5, 6, 7]
+    assert list(snapshot) == [1, 2, 3, 4, 5]
+    snapshot.append(8)
+    assert list(snapshot) == [1, 2, 3, 4, 5, 8]
+    assert list(sample_list) == [1, 2, 3, 4, 5, 6, 7]
+
+    other: PersistentList[int] = PersistentList.from_iterable([9])
+    other_snapshot: PersistentList[int] = other.snapshot()
+    snapshot.concat(other)
+    snapshot.append(10)
+    assert list(snapshot) == [1, 2, 3, 4, 5, 8, 9, 10]
+    assert list(other_snapshot) == [9]
+
+
+def test_append_to_empty_list() -> None:
+    lst: PersistentList[int] = PersistentList()
+    lst.append(1)
+    assert list(lst) == [1]
+    assert not lst.has_access
+    lst.to_last()
+    assert lst.content == 1
+
+
+def test_concat(sample_list: PersistentList[int]) -> None:
+    other: PersistentList[int] = PersistentList.from_iterable([5, 6])
+    other_first = other._first
+    sample_list.concat(other)
+    assert list(sample_list) == [1, 2, 3, 4, 5, 6]
+    assert len(sample_list) == 6
+    assert other.is_empty
+    assert len(other) == 0
+    sample_list.to_last()
+    assert sample_list.content == 6
+    sample_list.to_first()
+    for _ in range(4):
+        sample_list.next()
+    assert sample_list._current is other_first
+
+
+def test_concat_does_nothing(sample_list: PersistentList[int]) -> None:
+    sample_list.concat(sample_list)
+    sample_list.concat(None)
+    sample_list.concat(PersistentList())
+    assert list(sample_list) == [1, 2, 3, 4]
+
+
+def test_remove(sample_list: PersistentList[int]) -> None:
+    snapshot: PersistentList[int] = sample_list.snapshot()
+    sample_list.remove()
+    assert list(sample_list) == [1, 2, 3, 4]
+    sample_list.to_first()
+    sample_list.next()
+    sample_list.remove()
+    assert sample_list.content == 3
+    assert list(sample_list) == [1, 3, 4]
+    sample_list.to_last()
+    sample_list.remove()
+    assert not sample_list.has_access
+    assert list(sample_list) == [1, 3]
+    sample_list.to_last()
+    assert sample_list.content == 3
+    sample_list.to_first()
+    sample_list.remove()
+    sample_list.remove()
+    assert sample_list.is_empty
+    assert sample_list._last is None
+    assert len(sample_list) == 0
+    assert list(snapshot) == [1, 2, 3, 4]
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Tests for `datastructures._persistent_stack`."""
+from __future__ import annotations
+
+import pytest
+
+from nrw.datastructures import PersistentStack
+from nrw.datastructures._persistent_stack import _PersistentNode
+
+
+@pytest.fixture
+def sample_stack() -> PersistentStack[int]:
+    stack: PersistentStack[int] = PersistentStack()
+    for i in range(1, 4):
+        stack.push(i)
+    return stack
+
+
+def test_slots_of_persistent_node() -> None:
+    assert _PersistentNode.__slots__ == ("_content", "_next_node")
+
+
+def test_persistent_node_is_unhashable() -> None:
+    assert _PersistentNode.__hash__ is None
+
+
+def test_slots_of_persistent_stack() -> None:
+    assert PersistentStack.__slots__ == ("_head", "_length")
+
+
+def test_persistent_stack_is_unhashable() -> None:
+    assert PersistentStack.__hash__ is None
+
+
+def test_persistent_stack_construction() -> None:
+    stack: PersistentStack[int] = PersistentStack()
+    assert stack.is_empty
+    assert stack.top is None
+    assert len(stack) == 0
+
+
+def test_persistent_stack_repr(sample_stack: PersistentStack[int]) -> None:
+    assert repr(sample_stack) == (
+        "PersistentStack(head=_PersistentNode(content=3, next_node="
+        "_PersistentNode(content=2, next_node="
+        "_PersistentNode(content=1, next_node=None))))"
+    )
+
+
+def test_persistent_stack_str(sample_stack: PersistentStack[int]) -> None:
+    assert str(sample_stack) == "PersistentStack(3 -> 2 -> 1)"
+    assert sample_stack.to_str(2) == "PersistentStack(3 -> 2 -> ..., len=3)"
+
+
+def test_persistent_stack_dunder_methods(sample_stack: PersistentStack[int]) -> None:
+    assert len(sample_stack) == 3
+    assert list(sample_stack) == [3, 2, 1]
+    assert list(reversed(sample_stack)) == [1, 2, 3]
+    assert 2 in sample_stack
+    assert 4 not in sample_stack
+
+
+def test_push_and_pop(sample_stack: PersistentStack[int]) -> None:
+    assert sample_stack.top == 3
+    sample_stack.pop()
+    assert sample_stack.top == 2
+    sample_stack.push(None)  # type: ignore[arg-type]
+    assert sample_stack.top == 2
+    sample_stack.pop()
+    sample_stack.pop()
+    assert sample_stack.is_empty
+    sample_stack.pop()
+    assert sample_stack.is_empty
+    assert len(sample_stack) == 0
+
+
+def test_snapshot_shares_nodes(sample_stack: PersistentStack[int]) -> None:
+    snapshot: PersistentStack[int] = sample_stack.snapshot()
+    assert snapshot is not sample_stack
+    assert snapshot._head is sample_stack._head
+    assert len(snapshot) == 3
+
+
+def test_snapshot_is_not_affected_by_changes(
+    sample_stack: PersistentStack[int],
+) -> None:
+    snapshot: PersistentStack[int] = sample_stack.snapshot()
+    sample_stack.pop()
+    sample_stack.push(4)
+    snapshot.push(5)
+
+    assert list(sample_stack) == [4, 2, 1]
+    assert list(snapshot) == [5, 3, 2, 1]
+    assert sample_stack._head is not None
+    assert snapshot._head is not None
+    assert sample_stack._head._next_node is snapshot._head._next_node._next_node
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main())
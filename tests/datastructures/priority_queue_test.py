@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Tests for `datastructures._priority_queue`."""
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from nrw.datastructures import PriorityQueue, PriorityQueueHandle
+
+
+def _drain(queue: PriorityQueue[int]) -> list[int]:
+    contents: list[int] = []
+    while not queue.is_empty:
+        contents.append(queue.front)  # type: ignore[arg-type]
+        queue.remove_front()
+    return contents
+
+
+def test_slots_of_priority_queue_handle() -> None:
+    assert PriorityQueueHandle.__slots__ == ("_content", "_index")
+
+
+def test_priority_queue_handle_is_unhashable() -> None:
+    assert PriorityQueueHandle.__hash__ is None
+
+
+def test_slots_of_priority_queue() -> None:
+    assert PriorityQueue.__slots__ == ("_heap",)
+
+
+def test_priority_queue_is_unhashable() -> None:
+    assert PriorityQueue.__hash__ is None
+
+
+def test_empty_queue() -> None:
+    queue: PriorityQueue[int] = PriorityQueue()
+    assert queue.is_empty
+    assert queue.front is None
+    assert len(queue) == 0
+    queue.remove_front()
+    assert queue.is_empty
+
+
+def test_insert_and_remove_front() -> None:
+    queue: PriorityQueue[int] = PriorityQueue()
+    assert queue.insert(None) is None
+    for content in (5, 3, 8, 3, 1):
+        queue.insert(content)
+    assert len(queue) == 5
+    assert queue.front == 1
+    assert 8 in queue
+    assert 42 not in queue
+    assert sorted(queue) == [1, 3, 3, 5, 8]
+    assert _drain(queue) == [1, 3, 3, 5, 8]
+
+
+def test_heapify() -> None:
+    contents: list[int] = [random.randrange(100) for _ in range(500)]
+    queue: PriorityQueue[int] = PriorityQueue.from_iterable([*contents, None])
+    assert len(queue) == 500
+    queue.heapify([-1, None, 1000])
+    assert queue.front == -1
+    assert _drain(queue) == sorted([*contents, -1, 1000])
+
+
+def test_decrease_key() -> None:
+    queue: PriorityQueue[int] = PriorityQueue.from_iterable([10, 20, 30])
+    handle: PriorityQueueHandle[int] | None = queue.insert(40)
+    assert handle is not None
+    assert handle.is_queued
+    assert handle.content == 40
+    assert repr(handle) == "PriorityQueueHandle(content=40)"
+
+    assert not queue.decrease_key(handle, 50)
+    assert not queue.decrease_key(handle, None)
+    assert not queue.decrease_key(None, 1)
+    assert queue.decrease_key(handle, 5)
+    assert handle.content == 5
+    assert queue.front == 5
+
+    assert not PriorityQueue[int]().decrease_key(handle, 1)
+    queue.remove_front()
+    assert not handle.is_queued
+    assert not queue.decrease_key(handle, 1)
+    assert _drain(queue) == [10, 20, 30]
+
+
+def test_handles_follow_their_contents() -> None:
+    queue: PriorityQueue[int] = PriorityQueue()
+    handles: list[PriorityQueueHandle[int] | None] = [
+        queue.insert(content) for content in range(100, 0, -1)
+    ]
+    for offset, handle in enumerate(handles[::3]):
+        assert queue.decrease_key(handle, -offset)
+    expected: list[int] = sorted(
+        handle.content for handle in handles if handle is not None
+    )
+    assert _drain(queue) == expected
+
+
+def test_repr() -> None:
+    queue: PriorityQueue[int] = PriorityQueue.from_iterable([3, 1, 2])
+    assert repr(queue) == "PriorityQueue([1, 3, 2])"
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main())
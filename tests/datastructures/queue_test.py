@@ -2,11 +2,17 @@
 """Tests for `datastructures._queue`."""
 from __future__ import annotations
 
+from io import StringIO
+from typing import TYPE_CHECKING
+
 import pytest
 
-from nrw.datastructures import Queue
+from nrw.datastructures import List, Queue
 from nrw.datastructures._queue import _QueueNode
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 def test_slots_of_queue_node() -> None:
     assert _QueueNode.__slots__ == ("_content", "_next_node")
@@ -43,7 +49,7 @@ def test_queue_node_next_node() -> None:
 
 
 def test_slots_of_queue() -> None:
-    assert Queue.__slots__ == ("_head", "_tail")
+    assert Queue.__slots__ == ("_head", "_length", "_tail")
 
 
 def test_queue_is_unhashable() -> None:
@@ -109,6 +115,72 @@ def test_dequeue_on_empty_queue() -> None:
     assert q.front is None
 
 
+def test_enqueue_many() -> None:
+    q: Queue[int] = Queue()
+    q.enqueue_many([1, None, 2])
+    q.enqueue_many([])
+    q.enqueue_many([None])
+    q.enqueue_many(iter([3, 4]))
+    assert str(q) == "Queue(1 -> 2 -> 3 -> 4)"
+    q.enqueue(5)
+    assert q._tail.content == 5
+
+
+def test_enqueue_many_with_failing_iterable() -> None:
+    def contents() -> Iterator[int]:
+        yield 1
+        yield 2
+        raise RuntimeError
+
+    q: Queue[int] = Queue()
+    q.enqueue(0)
+    with pytest.raises(RuntimeError):
+        q.enqueue_many(contents())
+    assert len(q) == 1
+    assert str(q) == "Queue(0)"
+
+
+def test_dequeue_many() -> None:
+    q: Queue[int] = Queue()
+    q.enqueue_many(range(1, 6))
+    dequeued: List[int] = q.dequeue_many(2)
+    assert str(dequeued) == "List(1 -> 2)"
+    assert q.front == 3
+    assert str(q.dequeue_many()) == "List(3 -> 4 -> 5)"
+    assert q.is_empty
+    assert q._tail is None
+    assert q.dequeue_many(3).is_empty
+    q.enqueue(1)
+    assert q.dequeue_many(0).is_empty
+    assert q.front == 1
+
+
+def test_len_of_queue() -> None:
+    q: Queue[int] = Queue()
+    assert len(q) == 0
+    q.enqueue(1)
+    q.enqueue(None)  # type: ignore[arg-type]
+    q.enqueue_many([2, 3, None])
+    assert len(q) == 3
+    q.dequeue()
+    assert len(q) == 2
+    q.dequeue_many(5)
+    assert len(q) == 0
+    q.dequeue()
+    assert len(q) == 0
+
+
+def test_iteration_over_queue() -> None:
+    q: Queue[int] = Queue()
+    assert not list(q)
+    q.enqueue_many([1, 2, 3])
+    assert list(q) == [1, 2, 3]
+    assert list(reversed(q)) == [3, 2, 1]
+    assert q.front == 1
+    assert 2 in q
+    assert 42 not in q
+
+
 def test_list_to_str() -> None:
     q: Queue[int] = Queue()
     assert str(q) == "Queue()"
@@ -131,5 +203,22 @@ def test_repr_of_queue() -> None:
     )
 
 
+def test_queue_to_str_with_limit() -> None:
+    q: Queue[int] = Queue()
+    q.enqueue_many(range(1, 6))
+    assert q.to_str(2) == "Queue(1 -> 2 -> ..., len=5)"
+    assert q.to_str(5) == str(q)
+    with StringIO() as buffer:
+        q.write(buffer, 1)
+        assert buffer.getvalue() == "Queue(1 -> ..., len=5)"
+
+
+def test_str_and_repr_of_long_queue() -> None:
+    q: Queue[int] = Queue()
+    q.enqueue_many(range(5000))
+    assert str(q).endswith("4998 -> 4999)")
+    assert repr(q).endswith("tail=_QueueNode(content=4999, next_node=None))")
+
+
 if __name__ == "__main__":
     raise SystemExit(pytest.main())
@@ -2,11 +2,17 @@
 """Tests for `datastructures._stack`."""
 from __future__ import annotations
 
+from io import StringIO
+from typing import TYPE_CHECKING
+
 import pytest
 
-from nrw.datastructures import Stack
+from nrw.datastructures import List, Stack
 from nrw.datastructures._stack import _StackNode
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 def test_slots_of_stack_node() -> None:
     assert _StackNode.__slots__ == ("_content", "_next_node")
@@ -43,7 +49,7 @@ def test_stack_node_next_node() -> None:
 
 
 def test_slots_of_stack() -> None:
-    assert Stack.__slots__ == ("_head",)
+    assert Stack.__slots__ == ("_head", "_length")
 
 
 def test_stack_is_unhashable() -> None:
@@ -109,6 +115,69 @@ def test_pop_on_empty_stack() -> None:
     assert s.top is None
 
 
+def test_push_many() -> None:
+    s: Stack[int] = Stack()
+    s.push(0)
+    s.push_many([1, None, 2, 3])
+    assert str(s) == "Stack(3 -> 2 -> 1 -> 0)"
+    s.push_many([])
+    assert s.top == 3
+
+
+def test_push_many_with_failing_iterable() -> None:
+    def contents() -> Iterator[int]:
+        yield 1
+        yield 2
+        raise RuntimeError
+
+    s: Stack[int] = Stack()
+    s.push(0)
+    with pytest.raises(RuntimeError):
+        s.push_many(contents())
+    assert len(s) == 1
+    assert str(s) == "Stack(0)"
+
+
+def test_pop_many() -> None:
+    s: Stack[int] = Stack()
+    s.push_many(range(1, 6))
+    popped: List[int] = s.pop_many(2)
+    assert str(popped) == "List(5 -> 4)"
+    assert s.top == 3
+    assert str(s.pop_many()) == "List(3 -> 2 -> 1)"
+    assert s.is_empty
+    assert s.pop_many(3).is_empty
+    s.push(1)
+    assert s.pop_many(0).is_empty
+    assert s.top == 1
+
+
+def test_len_of_stack() -> None:
+    s: Stack[int] = Stack()
+    assert len(s) == 0
+    s.push(1)
+    s.push(None)  # type: ignore[arg-type]
+    s.push_many([2, 3, None])
+    assert len(s) == 3
+    s.pop()
+    assert len(s) == 2
+    s.pop_many(5)
+    assert len(s) == 0
+    s.pop()
+    assert len(s) == 0
+
+
+def test_iteration_over_stack() -> None:
+    s: Stack[int] = Stack()
+    assert not list(s)
+    s.push_many([1, 2, 3])
+    assert list(s) == [3, 2, 1]
+    assert list(reversed(s)) == [1, 2, 3]
+    assert s.top == 3
+    assert 2 in s
+    assert 42 not in s
+
+
 def test_list_to_str() -> None:
     s: Stack[int] = Stack()
     assert str(s) == "Stack()"
@@ -130,5 +199,22 @@ def test_repr_of_stack() -> None:
     )
 
 
+def test_stack_to_str_with_limit() -> None:
+    s: Stack[int] = Stack()
+    s.push_many(range(1, 6))
+    assert s.to_str(2) == "Stack(5 -> 4 -> ..., len=5)"
+    assert s.to_str(5) == str(s)
+    with StringIO() as buffer:
+        s.write(buffer, 1)
+        assert buffer.getvalue() == "Stack(5 -> ..., len=5)"
+
+
+def test_str_and_repr_of_long_stack() -> None:
+    s: Stack[int] = Stack()
+    s.push_many(range(5000))
+    assert str(s).startswith("Stack(4999 -> 4998")
+    assert repr(s).endswith("next_node=None" + ")" * 5001)
+
+
 if __name__ == "__main__":
     raise SystemExit(pytest.main())
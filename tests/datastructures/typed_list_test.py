@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Tests for `datastructures._typed_list`."""
+from __future__ import annotations
+
+import sys
+from io import StringIO
+
+import pytest
+
+from nrw.datastructures import List, TypedList
+
+
+@pytest.fixture
+def empty_list() -> TypedList[float]:
+    return TypedList("d")
+
+
+@pytest.fixture
+def sample_list() -> TypedList[int]:
+    return TypedList.from_iterable("q", [1, 2, None, 3])
+
+
+def test_slots_of_typed_list() -> None:
+    assert TypedList.__slots__ == ("_array", "_current")
+
+
+def test_typed_list_is_unhashable() -> None:
+    assert TypedList.__hash__ is None
+
+
+def test_list_typed() -> None:
+    lst: TypedList[float] = List.typed("d")
+    assert isinstance(lst, TypedList)
+    assert lst.typecode == "d"
+    assert lst.itemsize == 8
+    assert lst.is_empty
+
+
+def test_invalid_typecode() -> None:
+    with pytest.raises(ValueError, match="bad typecode"):
+        TypedList("x")
+
+
+def test_empty_list(empty_list: TypedList[float]) -> None:
+    assert not empty_list.has_access
+    assert empty_list.content is None
+    assert len(empty_list) == 0
+    empty_list.next()
+    empty_list.to_first()
+    empty_list.to_last()
+    empty_list.remove()
+    assert not empty_list.has_access
+
+
+def test_navigation(sample_list: TypedList[int]) -> None:
+    assert len(sample_list) == 3
+    assert not sample_list.has_access
+    sample_list.to_first()
+    assert sample_list.content == 1
+    sample_list.next()
+    assert sample_list.content == 2
+    sample_list.to_last()
+    assert sample_list.content == 3
+    sample_list.next()
+    assert not sample_list.has_access
+    sample_list.to_index(1)
+    assert sample_list.content == 2
+    sample_list.to_index(3)
+    assert not sample_list.has_access
+
+
+def test_set_content(sample_list: TypedList[int]) -> None:
+    sample_list.content = 42
+    sample_list.to_first()
+    sample_list.content = None
+    assert sample_list.content == 1
+    sample_list.content = 42
+    assert list(sample_list) == [42, 2, 3]
+
+
+def test_insert(sample_list: TypedList[int], empty_list: TypedList[float]) -> None:
+    sample_list.insert(42)
+    assert len(sample_list) == 3
+    sample_list.to_index(1)
+    sample_list.insert(42)
+    sample_list.insert(None)
+    assert sample_list.content == 2
+    assert list(sample_list) == [1, 42, 2, 3]
+
+    empty_list.insert(1.5)
+    assert not empty_list.has_access
+    assert list(empty_list) == [1.5]
+
+
+def test_append_and_extend(empty_list: TypedList[float]) -> None:
+    empty_list.append(None)
+    empty_list.append(1.0)
+    empty_list.extend([2.0, None, 3.0])
+    assert list(empty_list) == [1.0, 2.0, 3.0]
+    assert not empty_list.has_access
+
+
+def test_remove(sample_list: TypedList[int]) -> None:
+    sample_list.to_first()
+    sample_list.remove()
+    assert sample_list.content == 2
+    sample_list.to_last()
+    sample_list.remove()
+    assert not sample_list.has_access
+    assert list(sample_list) == [2]
+
+
+def test_concat(sample_list: TypedList[int]) -> None:
+    other_list: TypedList[int] = TypedList.from_iterable("q", [4, 5])
+    other_list.to_first()
+    sample_list.concat(other_list)
+    assert list(sample_list) == [1, 2, 3, 4, 5]
+    assert other_list.is_empty
+    assert not other_list.has_access
+
+
+def test_concat_no_effect(sample_list: TypedList[int]) -> None:
+    sample_list.concat(sample_list)
+    sample_list.concat(None)
+    sample_list.concat(TypedList("q"))
+    sample_list.concat(TypedList.from_iterable("i", [4]))
+    assert list(sample_list) == [1, 2, 3]
+
+
+def test_iteration(sample_list: TypedList[int]) -> None:
+    assert list(reversed(sample_list)) == [3, 2, 1]
+    assert 2 in sample_list
+    assert 42 not in sample_list
+
+
+def test_memoryview(sample_list: TypedList[int]) -> None:
+    view: memoryview = sample_list.memoryview()
+    assert view.format == "q"
+    assert view.tolist() == [1, 2, 3]
+    view[0] = 42
+    sample_list.to_first()
+    assert sample_list.content == 42
+    with pytest.raises(BufferError):
+        sample_list.append(4)
+    view.release()
+    sample_list.append(4)
+    assert len(sample_list) == 4
+
+
+
+def test_memoryview_is_zero_copy(sample_list: TypedList[int]) -> None:
+    view: memoryview = sample_list.memoryview()
+    assert view.obj is sample_list._array
+    sample_list.to_last()
+    sample_list.content = 30
+    assert view[2] == 30
+    view.release()
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="requires PEP 688")
+def test_buffer_protocol(sample_list: TypedList[int]) -> None:
+    assert memoryview(sample_list).tolist() == [1, 2, 3]
+
+
+def test_str(sample_list: TypedList[int], empty_list: TypedList[float]) -> None:
+    assert str(empty_list) == "TypedList()"
+    assert str(sample_list) == "TypedList(1 -> 2 -> 3)"
+    assert sample_list.to_str(1) == "TypedList(1 -> ... -> 3, len=3)"
+    with StringIO() as buffer:
+        sample_list.write(buffer)
+        assert buffer.getvalue() == str(sample_list)
+
+
+def test_repr(sample_list: TypedList[int]) -> None:
+    assert repr(sample_list) == "TypedList('q', [1, 2, 3], current=None)"
+    sample_list.to_first()
+    assert repr(sample_list) == "TypedList('q', [1, 2, 3], current=1)"
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main())